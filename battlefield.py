@@ -0,0 +1,162 @@
+# ------------ imports ------------
+from heapq import heapify, heappop, heappush
+from damage_table import damage_tables
+
+
+# ------------ class setup ------------
+class Battlefield:
+    """Index of the enemies in one battle, for waves of hundreds of enemies
+
+    enemies is the battle's full list in spawn order (the same list object
+    as Game.current_enemies). alive is an insertion-ordered dict used as an
+    ordered set, so a defeated enemy is dropped in O(1) and "is anyone
+    left" is a length check. Two lazy heaps answer targeting queries in
+    O(log n): the weakest enemy (lowest health) and the most threatening
+    one (highest expected damage per attack against the hero).
+
+    Every change to an enemy's health or stats must be reported with
+    update(), or update_many() after an area attack. Heap entries that no
+    longer match their enemy are skipped when they reach the top. Threats
+    also depend on the hero's stats: when those change (a level up, a buff,
+    freeze), the next threat query measures every enemy again.
+    """
+    targetings = ("first", "weakest", "threat")
+
+    __slots__ = ("enemies", "alive", "hero", "_weakest", "_threat", "_threats", "_hero_stats", "_order")
+
+    def __init__(self, enemies: list, hero) -> None:
+        self.enemies = enemies
+        self.hero = hero
+        self.alive = {}
+        self._weakest = []   # (health, order, enemy)
+        self._threat = []    # (-threat, order, enemy)
+        self._threats = {}   # enemy -> (enemy stats, hero stats the threat was measured with, threat)
+        self._hero_stats = hero.stats()  # Hero stats the threat heap is ordered by
+        self._order = 0      # Tie breaker, so heaps never compare enemies
+        for enemy in enemies:
+            if enemy.health > 0:
+                self._index(enemy)
+
+    def clone(self, enemies: list, hero):
+        """Index a copied battle whose enemies are copies of this one's, in the same order"""
+        clone = Battlefield.__new__(Battlefield)
+        copies = dict(zip(self.enemies, enemies))
+        clone.enemies = enemies
+        clone.hero = hero
+        clone.alive = {copies[enemy]: None for enemy in self.alive}
+        clone._threats = {copies[enemy]: known for enemy, known in self._threats.items() if enemy in self.alive}
+        clone._weakest = []
+        clone._threat = []
+        clone._order = 0
+        clone._rebuild()
+        return clone
+
+    def _index(self, enemy) -> None:
+        self.alive[enemy] = None
+        self._order += 1
+        heappush(self._weakest, (enemy.health, self._order, enemy))
+        self._measure(enemy)
+
+    def _measure(self, enemy) -> None:
+        """(Re)compute an enemy's threat when its stats have changed"""
+        stats = enemy.stats()
+        hero_stats = self.hero.stats()
+        known = self._threats.get(enemy)
+        if known is not None and known[0] is stats and known[1] is hero_stats:
+            return
+        weapon = enemy.weapon
+        threat = damage_tables.lookup(weapon.damage_range, weapon.damage_boost,
+                                      stats, hero_stats).expected_damage()
+        self._threats[enemy] = (stats, hero_stats, threat)
+        self._order += 1
+        heappush(self._threat, (-threat, self._order, enemy))
+
+    def add(self, enemy) -> None:
+        """Add an enemy that joins the battle (a summoned minion)"""
+        self.enemies.append(enemy)
+        if enemy.health > 0:
+            self._index(enemy)
+
+    def update(self, enemy) -> None:
+        """Re-index one enemy after its health or stats changed"""
+        if enemy.health <= 0:
+            self.alive.pop(enemy, None)
+            return
+        if enemy not in self.alive:
+            return
+        self._order += 1
+        heappush(self._weakest, (enemy.health, self._order, enemy))
+        self._measure(enemy)
+        if len(self._weakest) > 4 * len(self.alive) + 64:
+            self._rebuild()
+
+    def update_many(self, enemies) -> None:
+        """Re-index many enemies at once (area attacks), rebuilding the heaps in O(n)"""
+        alive = self.alive
+        for enemy in enemies:
+            if enemy.health <= 0:
+                alive.pop(enemy, None)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        alive = self.alive
+        self._weakest = [(enemy.health, order, enemy) for order, enemy in enumerate(alive, self._order + 1)]
+        self._order += len(alive)
+        heapify(self._weakest)
+        self._rebuild_threat()
+        threats = self._threats
+        for enemy in [enemy for enemy in threats if enemy not in alive]:
+            del threats[enemy]
+
+    def _rebuild_threat(self) -> None:
+        # Measure every alive enemy against the hero's current stats and reorder by threat
+        alive = self.alive
+        self._hero_stats = self.hero.stats()
+        for enemy in alive:
+            self._measure(enemy)
+        threats = self._threats
+        self._threat = [(-threats[enemy][2], order, enemy) for order, enemy in enumerate(alive, self._order + 1)]
+        self._order += len(alive)
+        heapify(self._threat)
+
+    # ------------ queries ------------
+    def __bool__(self) -> bool:
+        return bool(self.alive)
+
+    def __len__(self) -> int:
+        return len(self.alive)
+
+    def first(self):
+        """The first alive enemy in spawn order (None when all are defeated)"""
+        return next(iter(self.alive), None)
+
+    def weakest(self):
+        """The alive enemy with the lowest health"""
+        heap = self._weakest
+        while heap:
+            health, _, enemy = heap[0]
+            if enemy.health == health and enemy in self.alive:
+                return enemy
+            heappop(heap)
+        return None
+
+    def most_threatening(self):
+        """The alive enemy that deals the most damage per attack on average"""
+        if self.hero.stats() is not self._hero_stats:
+            self._rebuild_threat()
+        heap = self._threat
+        while heap:
+            threat, _, enemy = heap[0]
+            known = self._threats.get(enemy)
+            if enemy in self.alive and known is not None and known[2] == -threat:
+                return enemy
+            heappop(heap)
+        return None
+
+    def target(self, targeting: str = "first"):
+        """The enemy a targeting rule ("first", "weakest" or "threat") picks"""
+        if targeting == "weakest":
+            return self.weakest()
+        if targeting == "threat":
+            return self.most_threatening()
+        return self.first()
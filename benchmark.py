@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+
+"""
+Performance benchmarks
+
+Times the hot paths of the game: a single Character.attack, status effect
+ticks across many afflicted characters, HealthBar.draw rendering, a full
+headless encounter_enemies battle, a shop round trip (display_items and
+buy_item) and a complete scripted playthrough. Every benchmark reports
+ops/sec, p50/p99 latency and peak traced memory as JSON, and can be
+compared against a stored baseline to flag regressions.
+"""
+
+# ------------ imports ------------
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from itertools import count
+from character import Hero
+from game import Game, GameEnded
+from renderer import BufferedRenderer
+from runner import play_game
+from shop import Shop
+
+
+# ------------ benchmark setups ------------
+# Each setup builds its fixtures from a seed and returns the operation to time
+
+def bench_attack(seed: int):
+    """One hero attack on a zone 3 enemy"""
+    game = Game(headless=True, seed=seed)
+    hero = game.hero
+    enemy = game.enemy_registry.spawn_group(3, 1, game.rng, game.renderer, game.combat_log)[0]
+
+    def attack():
+        enemy.health = enemy.health_max
+        hero.attack(enemy)
+    return attack
+
+
+def bench_status_effects(seed: int, load: int = 256):
+    """One apply_status_effects call, round robin over many poisoned and burning enemies"""
+    game = Game(headless=True, seed=seed)
+    enemies = game.enemy_registry.spawn_wave(3, load, game.rng, game.renderer, game.combat_log)
+    turns = count()
+
+    def apply_status_effects():
+        enemy = enemies[next(turns) % load]
+        effects = enemy.status_effects
+        if not effects:
+            for _ in range(3):
+                effects.add("poison", 3, 5)
+            effects.add("burn", 2, 8)
+        enemy.health = enemy.health_max
+        enemy.apply_status_effects()
+    return apply_status_effects
+
+
+def bench_health_bar(seed: int):
+    """One HealthBar.update and draw into an in-memory frame"""
+    renderer = BufferedRenderer(io.StringIO())
+    hero = Hero("Hero", 999, renderer=renderer)
+    hero.status_effects.add("poison", 3, 5)
+    bar = hero.health_bar
+    hits = count()
+
+    def draw():
+        hero.health = hero.health_max - next(hits) % hero.health_max
+        bar.update()
+        bar.draw()
+        renderer.parts.clear()
+    return draw
+
+
+def bench_battle(seed: int):
+    """One headless encounter_enemies battle against a zone 2 group, always attacking"""
+    game = Game(input_func=lambda prompt: "1", headless=True, seed=seed)
+    game.current_zone = 2
+
+    def battle():
+        game.hero = Hero("Hero", 999, rng=game.rng, renderer=game.renderer, combat_log=game.combat_log)
+        enemies = game.enemy_registry.spawn_group(2, 3, game.rng, game.renderer, game.combat_log)
+        try:
+            game.encounter_enemies(enemies, "Benchmark battle")
+        except GameEnded:
+            pass
+    return battle
+
+
+def bench_shop(seed: int):
+    """One shop visit: display_items into an in-memory frame, then buy_item"""
+    game = Game(headless=True, seed=seed)
+    renderer = BufferedRenderer(io.StringIO())
+    shop = Shop(rng=game.rng, renderer=renderer)
+    hero = game.hero
+    visits = count()
+
+    def visit():
+        items = shop.display_items()
+        hero.coins = 1000
+        shop.buy_item(hero, items, next(visits) % len(items) + 1)
+        hero.inventory.clear()
+        renderer.parts.clear()
+    return visit
+
+
+def bench_full_game(seed: int):
+    """One complete scripted playthrough (see runner.py), a new seed each time"""
+    seeds = count(seed)
+
+    def full_game():
+        play_game(next(seeds))
+    return full_game
+
+
+# name -> (setup, operations per timed sample)
+BENCHMARKS = {
+    "attack": (bench_attack, 1000),
+    "status_effects": (bench_status_effects, 1000),
+    "health_bar": (bench_health_bar, 1000),
+    "battle": (bench_battle, 10),
+    "shop": (bench_shop, 100),
+    "full_game": (bench_full_game, 1),
+}
+
+
+# ------------ measurement ------------
+def _percentile(ordered: list, percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def measure(setup, batch: int, duration: float = 1.0, seed: int = 0, min_samples: int = 5) -> dict:
+    """Time one benchmark and trace its peak memory
+
+    Operations run in samples of batch calls until duration seconds have
+    passed; a sample's latency is its mean time per operation, so fast
+    operations are not swamped by timer overhead. Memory is traced in a
+    separate pass over one fresh sample, since tracemalloc slows every
+    allocation down.
+    """
+    operation = setup(seed)
+    operation()  # Warm up caches and lazily built tables
+
+    latencies = []
+    operations = 0
+    clock = time.perf_counter
+    started = clock()
+    while clock() - started < duration or len(latencies) < min_samples:
+        sample_start = clock()
+        for _ in range(batch):
+            operation()
+        latencies.append((clock() - sample_start) / batch)
+        operations += batch
+    elapsed = clock() - started
+
+    operation = setup(seed)
+    tracemalloc.start()
+    try:
+        for _ in range(batch):
+            operation()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "ops_per_sec": operations / elapsed,
+        "p50_us": _percentile(latencies, 50) * 1e6,
+        "p99_us": _percentile(latencies, 99) * 1e6,
+        "peak_memory_kb": peak / 1024,
+        "samples": len(latencies),
+        "operations": operations,
+    }
+
+
+def run_benchmarks(names=None, duration: float = 1.0, seed: int = 0) -> dict:
+    """Run the named benchmarks (all by default) and return a JSON-ready report"""
+    results = {}
+    for name in names or BENCHMARKS:
+        setup, batch = BENCHMARKS[name]
+        results[name] = measure(setup, batch, duration, seed)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "duration": duration,
+        "benchmarks": results,
+    }
+
+
+# ------------ baseline comparison ------------
+def compare(report: dict, baseline: dict, threshold: float = 0.10) -> dict:
+    """Compare a report against a baseline report, benchmark by benchmark
+
+    A benchmark regressed when its ops/sec dropped, or its median latency
+    or peak memory grew, by more than threshold (a fraction). p99 changes
+    are reported but not flagged, as single samples make them noisy.
+    Benchmarks missing from either report are skipped.
+    """
+    comparison = {}
+    for name, result in report["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if base is None:
+            continue
+        changes = {key: (result[key] - base[key]) / base[key] if base[key] else 0.0
+                   for key in ("ops_per_sec", "p50_us", "p99_us", "peak_memory_kb")}
+        regressions = []
+        if changes["ops_per_sec"] < -threshold:
+            regressions.append("ops_per_sec")
+        for key in ("p50_us", "peak_memory_kb"):
+            if changes[key] > threshold:
+                regressions.append(key)
+        comparison[name] = {"changes": changes, "regressions": regressions}
+    return comparison
+
+
+def main():
+    """Command line entry point for the benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmark combat, rendering and full runs.")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=None,
+                        help="benchmarks to run (default: all)")
+    parser.add_argument("--duration", type=float, default=1.0, help="seconds to time each benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-", help="JSON report file ('-' for stdout)")
+    parser.add_argument("--baseline", default=None, help="compare against this stored JSON report")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative change that counts as a regression (default: 0.10)")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.only, args.duration, args.seed)
+    regressed = []
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            report["comparison"] = compare(report, json.load(baseline_file), args.threshold)
+        regressed = [name for name, result in report["comparison"].items() if result["regressions"]]
+
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+
+    for name in regressed:
+        print(f"Regression in {name}: {', '.join(report['comparison'][name]['regressions'])}", file=sys.stderr)
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
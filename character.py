@@ -1,14 +1,43 @@
 # ------------ imports ------------
-import random
+from operator import attrgetter
+from rng import default_rng
+from renderer import default_renderer
+from combat_log import EventKind, null_combat_log
+from damage_table import damage_tables
 from weapon import fists
 from health_bar import HealthBar
+from inventory import Inventory
+from status_effects import StatusEffects
+
+
+# ------------ helpers ------------
+_slot_readers = {}
+
+
+def _slot_reader(cls):
+    """Every slot declared by a class and its parents, and a getter that reads them all"""
+    reader = _slot_readers.get(cls)
+    if reader is None:
+        slots = tuple(slot for klass in reversed(cls.__mro__) for slot in klass.__dict__.get("__slots__", ()))
+        reader = _slot_readers[cls] = (slots, attrgetter(*slots))
+    return reader
 
 
 # ------------ parent class setup ------------
 class Character:
+    # Fixed attribute layout keeps every combatant free of a per-instance __dict__
+    __slots__ = ("name", "health", "health_max",
+                 "strength", "defense", "speed",
+                 "strength_bonus", "defense_bonus", "speed_bonus",
+                 "status_effects", "weapon", "health_bar", "rng", "renderer", "combat_log",
+                 "stat_key", "attack_table")
+
     def __init__(self,
                  name: str,
                  health: int,
+                 rng=None,
+                 renderer=None,
+                 combat_log=None,
                  ) -> None:
         self.name = name
         self.health = health
@@ -23,12 +52,43 @@ class Character:
         self.strength_bonus = 0
         self.defense_bonus = 0
         self.speed_bonus = 0
+        self.stat_key = None  # Cached stat totals, see stats()
+        self.attack_table = None  # Last (target stats, weapon, boost, table) used by attack()
         
         # Status effects
-        self.status_effects = {}
+        self.status_effects = StatusEffects()
         
         self.weapon = fists
         self.health_bar = None
+        
+        # Random stream, output and event log shared with the rest of the game
+        self.rng = rng or default_rng
+        self.renderer = renderer or default_renderer
+        self.combat_log = combat_log or null_combat_log
+
+    def clone(self, rng=None, renderer=None, combat_log=None):
+        """Copy this combatant for a copied game state
+
+        Every slot is copied directly (no deepcopy): mutable combat state such
+        as status effects and the health bar is duplicated, while weapons and
+        other shared data are kept by reference. Subclasses copy their own
+        mutable containers.
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)
+        slots, read_slots = _slot_reader(cls)
+        for slot, value in zip(slots, read_slots(self)):
+            setattr(clone, slot, value)
+        clone.status_effects = self.status_effects.copy()
+        if self.health_bar:
+            clone.health_bar = self.health_bar.clone(clone)
+        if rng is not None:
+            clone.rng = rng
+        if renderer is not None:
+            clone.renderer = renderer
+        if combat_log is not None:
+            clone.combat_log = combat_log
+        return clone
 
     def get_total_strength(self):
         return self.strength + self.strength_bonus
@@ -37,91 +97,118 @@ class Character:
         return self.defense + self.defense_bonus
         
     def get_total_speed(self):
-        return self.speed + self.speed_bonus
+        # Freeze slows its target for as long as it lasts
+        return max(0, self.speed + self.speed_bonus - self.status_effects.value("freeze"))
+
+    def stats(self) -> tuple:
+        """(strength, defense, speed) totals, cached until stats_changed() is called"""
+        stats = self.stat_key
+        if stats is None:
+            stats = self.stat_key = (self.get_total_strength(), self.get_total_defense(), self.get_total_speed())
+        return stats
+
+    def stats_changed(self) -> None:
+        """Drop the cached stat totals; call after changing a stat or bonus"""
+        self.stat_key = None
+        self.attack_table = None
 
     def attack(self, target) -> None:
-        # Calculate damage with weapon and strength
-        base_damage = self.weapon.get_damage()
-        damage_bonus = self.get_total_strength() // 2
-        total_damage = base_damage + damage_bonus
-        
-        # Check for critical hit (10% chance)
-        is_critical = random.random() < 0.1
-        if is_critical:
-            total_damage = int(total_damage * 1.5)
-            
-        # Check for dodge (based on target's speed)
-        dodge_chance = min(0.05 + (target.get_total_speed() - self.get_total_speed()) * 0.01, 0.25)
-        is_dodged = random.random() < dodge_chance
-        
-        if is_dodged:
-            print(f"{target.name} dodged the attack from {self.name}!")
+        # One draw against the precomputed outcome table of this matchup
+        # (weapon roll, strength bonus, critical hit, dodge and defense),
+        # remembered while the target's stats and the weapon stay the same
+        weapon = self.weapon
+        target_stats = target.stats()
+        cached = self.attack_table
+        if cached is not None and cached[0] is target_stats and cached[1] is weapon and cached[2] == weapon.damage_boost:
+            table = cached[3]
+        else:
+            table = damage_tables.lookup(weapon.damage_range, weapon.damage_boost, self.stats(), target_stats)
+            self.attack_table = (target_stats, weapon, weapon.damage_boost, table)
+        final_damage, is_critical = table.roll(self.rng.random())
+        
+        if not final_damage:
+            self.combat_log.record(EventKind.DODGE, self.name, target.name, 0, weapon.name)
+            self.renderer.show("{} dodged the attack from {}!", target.name, self.name)
             return
             
-        # Apply defense reduction
-        damage_reduction = target.get_total_defense() // 3
-        final_damage = max(1, total_damage - damage_reduction)
-        
         # Apply damage
-        target.health -= final_damage
-        target.health = max(target.health, 0)
+        target.health = max(target.health - final_damage, 0)
         if target.health_bar:
             target.health_bar.update()
             
+        self.combat_log.record(EventKind.CRIT if is_critical else EventKind.HIT,
+                               self.name, target.name, final_damage, weapon.name)
+        
         # Display attack message
         crit_text = " CRITICAL HIT!" if is_critical else ""
-        print(f"{self.name} dealt {final_damage} damage to "
-              f"{target.name} with {self.weapon.name}{crit_text}")
+        self.renderer.show("{} dealt {} damage to {} with {}{}",
+                           self.name, final_damage, target.name, weapon.name, crit_text)
               
-        # Apply weapon special effects
-        effect = self.weapon.has_special_effect()
+        # Apply weapon special effects (only effect weapons draw for them)
+        if not weapon.special_effect:
+            return
+        effect = weapon.has_special_effect(self.rng)
         if effect and target.health > 0:
             if effect == "burn":
-                target.status_effects["burn"] = {"duration": 3, "damage": final_damage // 4}
-                print(f"{target.name} is burning!")
+                target.status_effects.add("burn", 3, final_damage // 4)
+                self.renderer.show("{} is burning!", target.name)
             elif effect == "poison":
-                target.status_effects["poison"] = {"duration": 3, "damage": final_damage // 3}
-                print(f"{target.name} is poisoned!")
+                target.status_effects.add("poison", 3, final_damage // 3)
+                self.renderer.show("{} is poisoned!", target.name)
             elif effect == "freeze":
-                target.status_effects["freeze"] = {"duration": 2, "slow": 2}
-                print(f"{target.name} is frozen!")
+                target.status_effects.add("freeze", 2, 2)  # 2 turns, slow of 2
+                target.stats_changed()
+                self.renderer.show("{} is frozen!", target.name)
+            if effect in target.status_effects:
+                self.combat_log.record(EventKind.STATUS_APPLY, self.name, target.name,
+                                       target.status_effects.value(effect), weapon.name, effect)
     
     def apply_status_effects(self):
         """Apply all active status effects and reduce their duration"""
-        effects_to_remove = []
+        effects = self.status_effects
+        if not effects:
+            return
         
-        for effect, data in self.status_effects.items():
+        combat_log = self.combat_log
+        for effect in effects:
             if effect == "burn" or effect == "poison":
-                damage = data["damage"]
+                damage = effects.value(effect)
                 self.health -= damage
                 self.health = max(0, self.health)
                 if self.health_bar:
                     self.health_bar.update()
-                print(f"{self.name} took {damage} damage from {effect}!")
+                combat_log.record(EventKind.STATUS_TICK, self.name, self.name, damage, effect=effect)
+                self.renderer.show("{} took {} damage from {}!", self.name, damage, effect)
+            else:
+                combat_log.record(EventKind.STATUS_TICK, self.name, self.name, 0, effect=effect)
             
-            data["duration"] -= 1
-            if data["duration"] <= 0:
-                effects_to_remove.append(effect)
-                print(f"{effect.capitalize()} effect on {self.name} has worn off.")
-        
-        # Remove expired effects
-        for effect in effects_to_remove:
-            del self.status_effects[effect]
+            # Expired effects are removed by tick()
+            if effects.tick(effect) <= 0:
+                if effect == "freeze":
+                    self.stats_changed()
+                combat_log.record(EventKind.STATUS_END, self.name, self.name, effect=effect)
+                self.renderer.show("{} effect on {} has worn off.", effect.capitalize(), self.name)
 
 
 # ------------ subclass setup ------------
 class Hero(Character):
+    __slots__ = ("default_weapon", "inventory", "coins", "level",
+                 "experience", "experience_to_level", "abilities")
+
     def __init__(self,
                  name: str,
-                 health: int
+                 health: int,
+                 rng=None,
+                 renderer=None,
+                 combat_log=None,
                  ) -> None:
-        super().__init__(name=name, health=health)
+        super().__init__(name=name, health=health, rng=rng, renderer=renderer, combat_log=combat_log)
 
         self.default_weapon = self.weapon
         self.health_bar = HealthBar(self, color="green")
         
         # Inventory and progression
-        self.inventory = []
+        self.inventory = Inventory()
         self.coins = 50  # Start with some coins
         self.level = 1
         self.experience = 0
@@ -134,25 +221,31 @@ class Hero(Character):
             "Whirlwind": {"level": 5, "cooldown": 0, "max_cooldown": 7}
         }
 
+    def clone(self, rng=None, renderer=None, combat_log=None):
+        clone = super().clone(rng, renderer, combat_log)
+        clone.inventory = self.inventory.copy()
+        clone.abilities = {name: dict(data) for name, data in self.abilities.items()}
+        return clone
+
     def equip(self, weapon) -> None:
         self.weapon = weapon
-        print(f"{self.name} equipped a(n) {self.weapon.name}!")
+        self.renderer.show("{} equipped a(n) {}!", self.name, self.weapon.name)
 
     def drop(self) -> None:
-        print(f"{self.name} dropped the {self.weapon.name}!")
+        self.renderer.show("{} dropped the {}!", self.name, self.weapon.name)
         self.weapon = self.default_weapon
         
     def add_item(self, item):
-        self.inventory.append(item)
-        print(f"\033[{item.color}mYou have looted {item.name}!\033[0m")
+        self.inventory.add(item)
+        self.renderer.show("\033[{}mYou have looted {}!\033[0m", item.color, item.name)
         
     def add_coins(self, amount):
         self.coins += amount
-        print(f"\033[33mYou have looted {amount} gold coins!\033[0m")
+        self.renderer.show("\033[33mYou have looted {} gold coins!\033[0m", amount)
         
     def add_experience(self, amount):
         self.experience += amount
-        print(f"You gained {amount} experience points!")
+        self.renderer.show("You gained {} experience points!", amount)
         
         # Check for level up
         while self.experience >= self.experience_to_level:
@@ -170,66 +263,70 @@ class Hero(Character):
         self.strength += stat_increase
         self.defense += stat_increase
         self.speed += stat_increase
+        self.stats_changed()
         
-        print(f"\033[33;1m*** LEVEL UP! ***\033[0m")
-        print(f"You are now level {self.level}!")
-        print(f"Health: +10, Strength: +{stat_increase}, Defense: +{stat_increase}, Speed: +{stat_increase}")
+        self.renderer.show("\033[33;1m*** LEVEL UP! ***\033[0m")
+        self.renderer.show("You are now level {}!", self.level)
+        self.renderer.show("Health: +10, Strength: +{}, Defense: +{}, Speed: +{}", stat_increase, stat_increase, stat_increase)
         
         # Check for new abilities
         for ability, data in self.abilities.items():
             if data["level"] == self.level:
-                print(f"\033[36;1mNew ability unlocked: {ability}!\033[0m")
+                self.renderer.show("\033[36;1mNew ability unlocked: {}!\033[0m", ability)
     
     def use_ability(self, ability_name, targets):
         if ability_name not in self.abilities:
-            print(f"You don't have the {ability_name} ability.")
+            self.renderer.show("You don't have the {} ability.", ability_name)
             return False
             
         ability = self.abilities[ability_name]
         
         # Check if ability is unlocked
         if self.level < ability["level"]:
-            print(f"{ability_name} unlocks at level {ability['level']}.")
+            self.renderer.show("{} unlocks at level {}.", ability_name, ability['level'])
             return False
             
         # Check cooldown
         if ability["cooldown"] > 0:
-            print(f"{ability_name} is on cooldown for {ability['cooldown']} more turns.")
+            self.renderer.show("{} is on cooldown for {} more turns.", ability_name, ability['cooldown'])
             return False
             
         # Use the ability
         if ability_name == "Heroic Strike":
             if not targets or len(targets) < 1:
-                print("No target for Heroic Strike.")
+                self.renderer.show("No target for Heroic Strike.")
                 return False
                 
             target = targets[0]
-            base_damage = self.weapon.get_damage() * 2
+            base_damage = self.weapon.get_damage(self.rng) * 2
             target.health -= base_damage
             target.health = max(0, target.health)
             if target.health_bar:
                 target.health_bar.update()
-            print(f"\033[33;1mHEROIC STRIKE!\033[0m You deal {base_damage} damage to {target.name}!")
+            self.combat_log.record(EventKind.ABILITY, self.name, target.name, base_damage, ability_name)
+            self.renderer.show("\033[33;1mHEROIC STRIKE!\033[0m You deal {} damage to {}!", base_damage, target.name)
             
         elif ability_name == "Quick Recovery":
             heal_amount = self.health_max // 3
             self.health = min(self.health + heal_amount, self.health_max)
             self.health_bar.update()
-            print(f"\033[32;1mQUICK RECOVERY!\033[0m You heal for {heal_amount} health!")
+            self.combat_log.record(EventKind.ABILITY, self.name, self.name, heal_amount, ability_name)
+            self.renderer.show("\033[32;1mQUICK RECOVERY!\033[0m You heal for {} health!", heal_amount)
             
         elif ability_name == "Whirlwind":
             if not targets:
-                print("No targets for Whirlwind.")
+                self.renderer.show("No targets for Whirlwind.")
                 return False
                 
-            base_damage = self.weapon.get_damage() // 2
-            print(f"\033[31;1mWHIRLWIND ATTACK!\033[0m")
+            base_damage = self.weapon.get_damage(self.rng) // 2
+            self.renderer.show("\033[31;1mWHIRLWIND ATTACK!\033[0m")
             for target in targets:
                 target.health -= base_damage
                 target.health = max(0, target.health)
                 if target.health_bar:
                     target.health_bar.update()
-                print(f"You deal {base_damage} damage to {target.name}!")
+                self.combat_log.record(EventKind.ABILITY, self.name, target.name, base_damage, ability_name)
+                self.renderer.show("You deal {} damage to {}!", base_damage, target.name)
         
         # Set cooldown
         ability["cooldown"] = ability["max_cooldown"]
@@ -244,14 +341,19 @@ class Hero(Character):
 
 # ------------ subclass setup ------------
 class Enemy(Character):
+    __slots__ = ("level", "experience_reward", "coin_reward", "special_abilities")
+
     def __init__(self,
                  name: str,
                  health: int,
                  damage_range: tuple,
                  level: int = 1,
                  weapon = None,
+                 rng=None,
+                 renderer=None,
+                 combat_log=None,
                  ) -> None:
-        super().__init__(name=name, health=health)
+        super().__init__(name=name, health=health, rng=rng, renderer=renderer, combat_log=combat_log)
         
         # Create a basic weapon if none provided
         if weapon is None:
@@ -269,7 +371,7 @@ class Enemy(Character):
         
         # Experience and gold rewards
         self.experience_reward = 20 * level
-        self.coin_reward = random.randint(5 * level, 15 * level)
+        self.coin_reward = self.rng.randint(5 * level, 15 * level)
         
         # Special abilities for higher level enemies
         self.special_abilities = []
@@ -280,22 +382,23 @@ class Enemy(Character):
     
     def use_special_ability(self, targets):
         """Use a special ability if available"""
-        if not self.special_abilities or random.random() > 0.3:  # 30% chance to use special ability
+        if not self.special_abilities or self.rng.random() > 0.3:  # 30% chance to use special ability
             return False
             
-        ability = random.choice(self.special_abilities)
+        ability = self.rng.choice(self.special_abilities)
         
         if ability == "Power Attack":
             if not targets:
                 return False
                 
             target = targets[0]
-            base_damage = self.weapon.get_damage() * 1.5
+            base_damage = self.weapon.get_damage(self.rng) * 1.5
             target.health -= base_damage
             target.health = max(0, target.health)
             if target.health_bar:
                 target.health_bar.update()
-            print(f"\033[31;1m{self.name} uses POWER ATTACK!\033[0m Dealing {base_damage} damage to {target.name}!")
+            self.combat_log.record(EventKind.ABILITY, self.name, target.name, base_damage, ability)
+            self.renderer.show("\033[31;1m{} uses POWER ATTACK!\033[0m Dealing {} damage to {}!", self.name, base_damage, target.name)
             return True
             
         elif ability == "Heal":
@@ -305,7 +408,8 @@ class Enemy(Character):
             heal_amount = self.health_max // 5
             self.health = min(self.health + heal_amount, self.health_max)
             self.health_bar.update()
-            print(f"\033[32;1m{self.name} uses HEAL!\033[0m Recovering {heal_amount} health!")
+            self.combat_log.record(EventKind.ABILITY, self.name, self.name, heal_amount, ability)
+            self.renderer.show("\033[32;1m{} uses HEAL!\033[0m Recovering {} health!", self.name, heal_amount)
             return True
             
         return False
@@ -313,14 +417,20 @@ class Enemy(Character):
 
 # ------------ boss subclass ------------
 class Boss(Enemy):
+    __slots__ = ("phase", "phase_thresholds", "current_phase_index")
+
     def __init__(self,
                  name: str,
                  health: int,
                  damage_range: tuple,
                  level: int = 5,
                  weapon = None,
+                 rng=None,
+                 renderer=None,
+                 combat_log=None,
                  ) -> None:
-        super().__init__(name=name, health=health, damage_range=damage_range, level=level, weapon=weapon)
+        super().__init__(name=name, health=health, damage_range=damage_range, level=level, weapon=weapon,
+                         rng=rng, renderer=renderer, combat_log=combat_log)
         
         # Bosses have enhanced stats
         self.health *= 2
@@ -328,6 +438,7 @@ class Boss(Enemy):
         self.strength += 5
         self.defense += 5
         self.speed += 3
+        self.stats_changed()
         
         # Better rewards
         self.experience_reward *= 3
@@ -356,9 +467,11 @@ class Boss(Enemy):
             # Buff boss in new phase
             self.strength += 3
             self.defense += 2
+            self.stats_changed()
             
-            print(f"\033[35;1m{self.name} enters Phase {self.phase}!\033[0m")
-            print(f"\033[35;1m{self.name}'s power increases!\033[0m")
+            self.combat_log.record(EventKind.PHASE, self.name, self.name, self.phase)
+            self.renderer.show("\033[35;1m{} enters Phase {}!\033[0m", self.name, self.phase)
+            self.renderer.show("\033[35;1m{}'s power increases!\033[0m", self.name)
             return True
             
         return False
@@ -368,27 +481,28 @@ class Boss(Enemy):
         # Always use special abilities in later phases
         ability_chance = 0.3 + (self.phase - 1) * 0.2  # Increases with each phase
         
-        if random.random() > ability_chance:
+        if self.rng.random() > ability_chance:
             return False
             
-        ability = random.choice(self.special_abilities)
+        ability = self.rng.choice(self.special_abilities)
         
         if ability == "Ultimate Attack" and self.phase >= 2:  # Only available in phase 2+
             if not targets:
                 return False
                 
             target = targets[0]
-            base_damage = self.weapon.get_damage() * 2.5
+            base_damage = self.weapon.get_damage(self.rng) * 2.5
             target.health -= base_damage
             target.health = max(0, target.health)
             if target.health_bar:
                 target.health_bar.update()
-            print(f"\033[31;1m{self.name} uses ULTIMATE ATTACK!\033[0m")
-            print(f"A devastating blow deals {base_damage} damage to {target.name}!")
+            self.combat_log.record(EventKind.ABILITY, self.name, target.name, base_damage, ability)
+            self.renderer.show("\033[31;1m{} uses ULTIMATE ATTACK!\033[0m", self.name)
+            self.renderer.show("A devastating blow deals {} damage to {}!", base_damage, target.name)
             return True
             
         elif ability == "Summon Minion" and self.phase >= 3:  # Only available in phase 3+
-            print(f"\033[35;1m{self.name} SUMMONS A MINION!\033[0m")
+            self.renderer.show("\033[35;1m{} SUMMONS A MINION!\033[0m", self.name)
             # The actual summoning logic would be handled in the game class
             return "summon"
             
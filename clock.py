@@ -0,0 +1,81 @@
+# ------------ imports ------------
+import time
+
+
+# ------------ base class ------------
+class Clock:
+    """Paces the pauses a game makes so the player can read the screen
+
+    Every pause is recorded at its logical length whatever the clock does
+    with it, so play time analytics are the same in every mode: elapsed is
+    the logical time spent paused, waited the wall time actually slept.
+    """
+    __slots__ = ("elapsed", "waited", "pauses")
+
+    def __init__(self) -> None:
+        self.elapsed = 0.0
+        self.waited = 0.0
+        self.pauses = 0
+
+    def pause(self, seconds: float) -> None:
+        self.pauses += 1
+        self.elapsed += seconds
+        self.waited += self.wait(seconds)
+
+    def wait(self, seconds: float) -> float:
+        """Wait for a pause of a logical length and return the seconds actually waited"""
+        raise NotImplementedError
+
+
+# ------------ implementations ------------
+class RealClock(Clock):
+    """Waits every pause out in full, like the original game
+
+    sleep is what waits; a server session passes one that waits on its
+    event loop instead of blocking the process.
+    """
+    __slots__ = ("sleep", "scale")
+
+    def __init__(self, sleep=time.sleep) -> None:
+        super().__init__()
+        self.sleep = sleep
+        self.scale = 1.0
+
+    def wait(self, seconds: float) -> float:
+        seconds *= self.scale
+        if seconds > 0:
+            self.sleep(seconds)
+            return seconds
+        return 0.0
+
+
+class AcceleratedClock(RealClock):
+    """Waits scale times as long as the game asks (0.1 plays ten times faster)"""
+    __slots__ = ()
+
+    def __init__(self, scale: float, sleep=time.sleep) -> None:
+        super().__init__(sleep)
+        self.scale = scale
+
+
+class VirtualClock(Clock):
+    """Never waits: pauses only add to the logical time (headless games and searches)"""
+    __slots__ = ()
+
+    def wait(self, seconds: float) -> float:
+        return 0.0
+
+
+# ------------ construction ------------
+clock_modes = ("real", "accelerated", "virtual")
+
+
+def make_clock(mode: str = "real", scale: float = 1.0, sleep=time.sleep) -> Clock:
+    """Build a clock by mode name ("real", "accelerated" with a scale, or "virtual")"""
+    if mode == "virtual":
+        return VirtualClock()
+    if mode == "accelerated":
+        return AcceleratedClock(scale, sleep)
+    if mode == "real":
+        return RealClock(sleep)
+    raise ValueError(f"Unknown clock mode: {mode}")
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+"""
+Vectorized Monte Carlo combat kernel
+
+Simulates N independent one-on-one fights at once as NumPy arrays, using the
+zone enemy and boss stats from Game. Each fight follows Character.attack:
+a uniform Weapon.get_damage roll plus damage boost and strength bonus, a 10%
+critical hit, the speed-based dodge and the defense // 3 reduction, with
+bosses gaining strength and defense at their phase thresholds. Turns follow
+the Initiative timeline, so a faster side attacks more often, and turns
+count the hero's actions like simulation.run_battle. Special abilities,
+status effects (so also freeze's slow) and loot are not modelled; use
+simulation.py when those matter.
+
+Requires NumPy.
+"""
+
+# ------------ imports ------------
+import argparse
+import time
+from typing import NamedTuple
+import numpy as np
+from character import Hero
+from game import Game
+from initiative import Initiative
+from renderer import NullRenderer
+
+
+# ------------ stat blocks ------------
+class FightStats(NamedTuple):
+    won: np.ndarray
+    turns: np.ndarray
+    damage_taken: np.ndarray
+
+    @property
+    def win_rate(self):
+        return float(self.won.mean()) if len(self.won) else 0.0
+
+
+def hero_stats(level: int, hero_health: int = 999):
+    """Return the hero's (health, strength, defense, speed) at a level"""
+    hero = Hero("Hero", hero_health, renderer=NullRenderer())
+    for _ in range(level - 1):
+        hero.level_up()
+    return (hero.health_max, hero.get_total_strength(),
+            hero.get_total_defense(), hero.get_total_speed())
+
+
+def enemy_stat_table(enemies):
+    """Stack enemy stats into an array with one row per enemy"""
+    return np.array([
+        (enemy.health_max,
+         enemy.get_total_strength(),
+         enemy.get_total_defense(),
+         enemy.get_total_speed(),
+         enemy.weapon.damage_range[0],
+         enemy.weapon.damage_range[1],
+         enemy.weapon.damage_boost)
+        for enemy in enemies
+    ], dtype=np.int64)
+
+
+# ------------ kernel ------------
+def _attack(rng, count, low, high, boost, strength, attacker_speed, defender_defense, defender_speed):
+    """Vectorized Character.attack, returning the damage dealt in count fights"""
+    damage = rng.integers(low, high + 1, count) + boost + strength // 2
+    is_critical = rng.random(count) < 0.1
+    damage = np.where(is_critical, damage * 3 // 2, damage)
+    dodge_chance = np.minimum(0.05 + (defender_speed - attacker_speed) * 0.01, 0.25)
+    is_dodged = rng.random(count) < dodge_chance
+    damage = np.maximum(1, damage - defender_defense // 3)
+    return np.where(is_dodged, 0, damage)
+
+
+def simulate_fights(enemies,
+                    hero_level: int,
+                    weapon,
+                    fights: int,
+                    is_boss: bool = False,
+                    hero_health: int = 999,
+                    max_turns: int = 1000,
+                    seed=None) -> FightStats:
+    """Simulate fights of a hero against enemies drawn uniformly from a list"""
+    rng = np.random.default_rng(seed)
+    table = enemy_stat_table(enemies)
+    picks = table[rng.integers(0, len(table), fights)]
+
+    enemy_health = picks[:, 0].copy()
+    enemy_health_max = picks[:, 0]
+    enemy_strength = picks[:, 1].copy()
+    enemy_defense = picks[:, 2].copy()
+    enemy_speed = picks[:, 3]
+    enemy_low, enemy_high, enemy_boost = picks[:, 4], picks[:, 5], picks[:, 6]
+
+    health_max, strength, defense, speed = hero_stats(hero_level, hero_health)
+    hero_health_now = np.full(fights, health_max, dtype=np.int64)
+
+    phase_thresholds = np.array(enemies[0].phase_thresholds if is_boss else [], dtype=np.float64)
+    phase_index = np.zeros(fights, dtype=np.int64)
+
+    # Initiative timeline: each side acts every tempo // (speed + offset)
+    # ticks, the hero at tick 0 and the enemy one delay later; on a tie the
+    # side that did not act last goes first, as it was scheduled earlier
+    hero_delay = max(1, Initiative.tempo // (speed + Initiative.speed_offset))
+    enemy_delay = np.maximum(1, Initiative.tempo // (enemy_speed + Initiative.speed_offset))
+    hero_due = np.zeros(fights, dtype=np.int64)
+    enemy_due = enemy_delay.copy()
+    hero_acted_last = np.zeros(fights, dtype=bool)
+
+    won = np.zeros(fights, dtype=bool)
+    turns = np.zeros(fights, dtype=np.int64)
+    active = np.arange(fights)
+
+    while len(active):
+        hero_turn = ((hero_due[active] < enemy_due[active])
+                     | ((hero_due[active] == enemy_due[active]) & ~hero_acted_last[active]))
+        out_of_turns = hero_turn & (turns[active] >= max_turns)  # Ends undecided
+        heroes = active[hero_turn & ~out_of_turns]
+        enemies = active[~hero_turn]
+
+        # Hero attacks
+        turns[heroes] += 1
+        hero_due[heroes] += hero_delay
+        hero_acted_last[heroes] = True
+        enemy_health[heroes] -= _attack(rng, len(heroes),
+                                        weapon.damage_range[0], weapon.damage_range[1],
+                                        weapon.damage_boost, strength, speed,
+                                        enemy_defense[heroes], enemy_speed[heroes])
+        np.maximum(enemy_health, 0, out=enemy_health)
+        won[heroes[enemy_health[heroes] == 0]] = True
+
+        # Boss phase transitions happen before the boss attacks
+        if len(phase_thresholds) and len(enemies):
+            index = phase_index[enemies]
+            can_advance = index < len(phase_thresholds)
+            threshold = phase_thresholds[np.minimum(index, len(phase_thresholds) - 1)]
+            advance = can_advance & (enemy_health[enemies] / enemy_health_max[enemies] <= threshold)
+            advancing = enemies[advance]
+            phase_index[advancing] += 1
+            enemy_strength[advancing] += 3
+            enemy_defense[advancing] += 2
+
+        # Enemy attacks
+        enemy_due[enemies] += enemy_delay[enemies]
+        hero_acted_last[enemies] = False
+        hero_health_now[enemies] -= _attack(rng, len(enemies),
+                                            enemy_low[enemies], enemy_high[enemies],
+                                            enemy_boost[enemies], enemy_strength[enemies],
+                                            enemy_speed[enemies], defense, speed)
+        np.maximum(hero_health_now, 0, out=hero_health_now)
+
+        active = active[~(out_of_turns | (enemy_health[active] == 0) | (hero_health_now[active] == 0))]
+
+    return FightStats(won=won, turns=turns, damage_taken=health_max - hero_health_now)
+
+
+def sweep(zones, hero_levels, weapons, fights: int, bosses: bool = False, seed=None):
+    """Run the kernel for every (zone, hero level, weapon) combination"""
+    game = Game(headless=True)
+    seeds = np.random.SeedSequence(seed)
+    results = {}
+    combos = [(zone, level, weapon) for zone in zones for level in hero_levels for weapon in weapons]
+    for (zone, level, weapon), child in zip(combos, seeds.spawn(len(combos))):
+        enemies = [game.zone_bosses[zone]] if bosses else game.zone_enemies[zone]
+        results[(zone, level, weapon.name)] = simulate_fights(enemies, level, weapon, fights,
+                                                              is_boss=bosses, seed=child)
+    return results
+
+
+def describe(stats: FightStats) -> dict:
+    """Summarize the turn and damage distributions of a batch of fights"""
+    return {
+        "win_rate": stats.win_rate,
+        "turns_p50": float(np.percentile(stats.turns, 50)),
+        "turns_p90": float(np.percentile(stats.turns, 90)),
+        "damage_taken_mean": float(stats.damage_taken.mean()),
+        "damage_taken_p90": float(np.percentile(stats.damage_taken, 90)),
+    }
+
+
+def main():
+    """Command line entry point for zone balance sweeps"""
+    parser = argparse.ArgumentParser(description="Vectorized zone balance sweep.")
+    parser.add_argument("--zones", type=int, nargs="+", default=[1, 2, 3, 4, 5])
+    parser.add_argument("--levels", type=int, nargs="+", default=[1])
+    parser.add_argument("--weapons", nargs="+", default=["Fists", "Iron Sword", "Short Bow"])
+    parser.add_argument("--fights", type=int, default=100000)
+    parser.add_argument("--bosses", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    weapons_by_name = {weapon.name: weapon for weapon in Game(headless=True).weapons}
+    weapons = [weapons_by_name[name] for name in args.weapons]
+
+    start = time.perf_counter()
+    results = sweep(args.zones, args.levels, weapons, args.fights, args.bosses, args.seed)
+    elapsed = time.perf_counter() - start
+
+    for (zone, level, weapon_name), stats in results.items():
+        summary = ", ".join(f"{key}={value:.3f}" for key, value in describe(stats).items())
+        print(f"zone {zone} | level {level} | {weapon_name}: {summary}")
+    total = args.fights * len(results)
+    print(f"{total} fights in {elapsed:.2f}s ({total / elapsed:.0f} fights/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+# ------------ imports ------------
+import mmap
+import os
+import struct
+from enum import IntEnum
+from typing import NamedTuple
+
+
+# ------------ record format ------------
+class EventKind(IntEnum):
+    HIT = 1            # Regular attack; source is the weapon
+    CRIT = 2           # Critical regular attack
+    DODGE = 3          # Target dodged a regular attack
+    ABILITY = 4        # Ability damage (or healing when actor == target); source is the ability
+    STATUS_APPLY = 5   # Weapon effect applied; amount is its per-turn value
+    STATUS_TICK = 6    # Start-of-turn status damage (0 for freeze)
+    STATUS_END = 7     # Status effect wore off
+    PHASE = 8          # Boss entered a new phase; amount is the phase number
+    SUMMON = 9         # Boss (actor) summoned a minion (target)
+    REWARD_XP = 10     # Experience the hero (target) got for an enemy (actor)
+    REWARD_COINS = 11  # Coins the hero (target) got for an enemy (actor)
+
+
+# Status effect codes stored in the effect field (0 means none)
+effect_codes = {"burn": 1, "poison": 2, "freeze": 3}
+effect_names = {code: name for name, code in effect_codes.items()}
+
+
+class CombatEvent(NamedTuple):
+    battle: int
+    turn: int
+    kind: EventKind
+    effect: str
+    actor: str
+    target: str
+    source: str
+    amount: float
+
+
+# File header: magic, format version, record size
+header = struct.Struct("<4sHH")
+magic = b"CLOG"
+version = 1
+
+# battle, turn, kind, effect, actor, target, source, amount
+# Names (actors, targets, weapons, abilities) are ids into the .names side file
+record = struct.Struct("<IIBBHHHf")
+
+
+# ------------ writer ------------
+class CombatLog:
+    """Append-only binary stream of combat events
+
+    Every event is one fixed-width record, so a file of any size can be
+    memory-mapped and indexed directly (see CombatLogReader). Names are
+    interned to small ids; each new name is appended as one line to a
+    "<path>.names" side file. Records are buffered in memory and written in
+    batches; close() (or leaving a with block) writes the rest.
+    """
+    active = True
+
+    def __init__(self, path: str, buffer_records: int = 4096) -> None:
+        self.path = path
+        self.buffer_records = buffer_records
+        self.battle = 0
+        self.turn = 0
+
+        # Continue the battle numbering and name ids of an existing log
+        self.names = {}
+        if os.path.exists(path + ".names"):
+            with open(path + ".names", encoding="utf-8") as names_file:
+                for name_id, line in enumerate(names_file):
+                    self.names[line.rstrip("\n")] = name_id
+        self.file = open(path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(header.pack(magic, version, record.size))
+        elif self.file.tell() > header.size:
+            with open(path, "rb") as existing:
+                existing.seek(-record.size, os.SEEK_END)
+                self.battle = record.unpack(existing.read(record.size))[0]
+        self.names_file = open(path + ".names", "a", encoding="utf-8")
+
+        self.buffer = bytearray()
+        self.pending = 0
+
+    def name_id(self, name: str) -> int:
+        name_id = self.names.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.names[name] = name_id
+            self.names_file.write(name + "\n")
+        return name_id
+
+    def begin_battle(self) -> None:
+        self.battle += 1
+        self.turn = 0
+
+    def begin_turn(self) -> None:
+        self.turn += 1
+
+    def record(self, kind: EventKind, actor: str, target: str = "", amount=0, source: str = "", effect: str = "") -> None:
+        """Append one event"""
+        name_id = self.name_id
+        self.buffer += record.pack(self.battle, self.turn, kind, effect_codes.get(effect, 0),
+                                   name_id(actor), name_id(target), name_id(source), amount)
+        self.pending += 1
+        if self.pending >= self.buffer_records:
+            self.flush()
+
+    def flush(self) -> None:
+        # Names go first so a reader never sees a record with an unknown name id
+        self.names_file.flush()
+        self.file.write(self.buffer)
+        self.file.flush()
+        self.buffer.clear()
+        self.pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+        self.names_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class NullCombatLog:
+    """Event log that records nothing"""
+    active = False
+    battle = 0
+    turn = 0
+
+    def begin_battle(self) -> None:
+        pass
+
+    def begin_turn(self) -> None:
+        pass
+
+    def record(self, kind, actor, target="", amount=0, source="", effect="") -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+# Used by objects that are created without a log
+null_combat_log = NullCombatLog()
+
+
+# ------------ reader ------------
+class CombatLogReader:
+    """Random access to a combat log through a read-only memory map
+
+    Indexing and iterating decode one record at a time, so scanning never
+    loads the file into memory. records() exposes the raw memoryview of all
+    records for bulk analytics (e.g. numpy.frombuffer with a matching dtype).
+    """
+    def __init__(self, path: str) -> None:
+        with open(path + ".names", encoding="utf-8") as names_file:
+            self.names = [line.rstrip("\n") for line in names_file]
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        file_magic, file_version, record_size = header.unpack_from(self.map, 0)
+        if file_magic != magic or file_version != version or record_size != record.size:
+            raise ValueError(f"{path} is not a version {version} combat log")
+        self.count = (len(self.map) - header.size) // record.size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def raw(self, index: int) -> tuple:
+        """Undecoded (battle, turn, kind, effect, actor, target, source, amount) ids"""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("combat log index out of range")
+        return record.unpack_from(self.map, header.size + index * record.size)
+
+    def __getitem__(self, index: int) -> CombatEvent:
+        return self._decode(self.raw(index))
+
+    def __iter__(self):
+        names = self.names
+        for values in record.iter_unpack(self.records()):
+            yield self._decode(values, names)
+
+    def _decode(self, values, names=None) -> CombatEvent:
+        names = names or self.names
+        battle, turn, kind, effect, actor, target, source, amount = values
+        return CombatEvent(battle=battle,
+                           turn=turn,
+                           kind=EventKind(kind),
+                           effect=effect_names.get(effect, ""),
+                           actor=names[actor],
+                           target=names[target],
+                           source=names[source],
+                           amount=amount)
+
+    def records(self) -> memoryview:
+        """All complete records as one contiguous buffer"""
+        return memoryview(self.map)[header.size:header.size + self.count * record.size]
+
+    def close(self) -> None:
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,216 @@
+# ------------ imports ------------
+import json
+import struct
+import threading
+from array import array
+from bisect import bisect_right
+
+
+# ------------ outcome enumeration ------------
+def attack_outcomes(low: int, high: int, boost: int, strength: int,
+                    attacker_speed: int, defense: int, defender_speed: int) -> list:
+    """Every distinct (probability, damage, is_critical) of one Character.attack
+
+    A dodge has damage 0; a landed hit always deals at least 1. The rules
+    are those of the original attack: a uniform roll in [low, high] plus
+    boost and strength // 2, a 10% crit (int(damage * 1.5)), the dodge
+    chance min(0.05 + speed difference * 0.01, 0.25) and damage reduced by
+    defense // 3.
+    """
+    dodge = min(0.05 + (defender_speed - attacker_speed) * 0.01, 0.25)
+    dodge = min(max(dodge, 0.0), 1.0)
+    reduction = defense // 3
+    roll_probability = (1 - dodge) / (high - low + 1)
+
+    probabilities = {}
+    if dodge > 0:
+        probabilities[(0, False)] = dodge
+    for roll in range(low, high + 1):
+        total = roll + boost + strength // 2
+        for outcome, chance in (((max(1, total - reduction), False), 0.9),
+                                ((max(1, int(total * 1.5) - reduction), True), 0.1)):
+            probabilities[outcome] = probabilities.get(outcome, 0.0) + roll_probability * chance
+    return [(probability, damage, is_critical)
+            for (damage, is_critical), probability in sorted(probabilities.items())]
+
+
+# ------------ tables ------------
+class AttackTable:
+    """Cumulative outcome table for one matchup: one uniform draw picks the outcome"""
+    __slots__ = ("cdf", "damage", "critical", "outcomes")
+
+    def __init__(self, cdf, damage, critical) -> None:
+        self.cdf = cdf            # Cumulative probabilities, the last one is 1.0
+        self.damage = damage      # Damage per outcome (0 = dodged)
+        self.critical = critical  # 1 for critical hits
+        self.outcomes = [(outcome_damage, bool(is_critical)) for outcome_damage, is_critical in zip(damage, critical)]
+
+    @classmethod
+    def build(cls, low, high, boost, strength, attacker_speed, defense, defender_speed):
+        # Plain lists bisect fastest; share() packs them into typed arrays
+        cdf = []
+        damage = []
+        critical = []
+        total = 0.0
+        for probability, outcome_damage, is_critical in attack_outcomes(low, high, boost, strength,
+                                                                         attacker_speed, defense, defender_speed):
+            total += probability
+            cdf.append(total)
+            damage.append(outcome_damage)
+            critical.append(is_critical)
+        cdf[-1] = 1.0  # Absorb rounding so every draw in [0, 1) lands in the table
+        return cls(cdf, damage, critical)
+
+    def roll(self, draw: float):
+        """Map a uniform draw in [0, 1) to (damage, is_critical)"""
+        return self.outcomes[bisect_right(self.cdf, draw)]
+
+    def expected_damage(self) -> float:
+        """Average damage of one attack, dodges included"""
+        expected = 0.0
+        previous = 0.0
+        for cumulative, damage in zip(self.cdf, self.damage):
+            expected += (cumulative - previous) * damage
+            previous = cumulative
+        return expected
+
+
+class DamageTables:
+    """Index of attack tables keyed by (damage range, damage boost, attacker stats, defender stats)
+
+    Stats are (strength, defense, speed) totals as returned by
+    Character.stats(), which are cached per character and invalidated when
+    a level up, boss phase, buff or event changes them. A table is built the
+    first time a matchup is seen and kept while it is among the max_tables
+    most recently used ones, so a long-lived process (the server, a runner
+    worker) holds a bounded working set instead of every matchup it has
+    ever seen.
+
+    The index is shared by every thread (server sessions, MCTS thread
+    pools). A hit only pops and reinserts its key, each of which is atomic;
+    building and evicting happen under a lock, and eviction tolerates hits
+    moving keys in other threads.
+    """
+    def __init__(self, max_tables: int = 1024) -> None:
+        self.tables = {}  # Least recently used first
+        self.lock = threading.Lock()  # Held while building and evicting
+        self.max_tables = max_tables
+        self.built = 0     # Tables built so far; tells sharers when new ones appeared
+        self.block = None  # Shared memory the tables point into, see attach()
+
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    def lookup(self, damage_range, damage_boost, attacker_stats, defender_stats) -> AttackTable:
+        key = (damage_range, damage_boost, attacker_stats, defender_stats)
+        tables = self.tables
+        table = tables.pop(key, None)
+        if table is None:
+            with self.lock:
+                table = tables.pop(key, None)  # Another thread may have just built it
+                if table is None:
+                    table = AttackTable.build(damage_range[0], damage_range[1], damage_boost,
+                                              attacker_stats[0], attacker_stats[2],
+                                              defender_stats[1], defender_stats[2])
+                    self.built += 1
+                    self._evict()
+        tables[key] = table  # Reinserting marks it as the most recently used
+        return table
+
+    def _evict(self) -> None:
+        # Called with the lock held: drop the oldest tables until there is room for one more
+        tables = self.tables
+        while len(tables) >= self.max_tables:
+            try:
+                tables.pop(next(iter(tables)), None)
+            except (RuntimeError, StopIteration):
+                pass  # A hit in another thread moved a key meanwhile; look again
+
+    def merge(self, other) -> None:
+        """Add the tables of another index (an attached block) that this one lacks"""
+        tables = self.tables
+        with self.lock:
+            for key, table in other.tables.items():
+                if key not in tables:
+                    self._evict()
+                    tables[key] = table
+
+    def discard(self, other) -> None:
+        """Drop the tables that came from another index, e.g. before closing its block"""
+        tables = self.tables
+        with self.lock:
+            for key, table in other.tables.items():
+                if tables.get(key) is table:
+                    tables.pop(key, None)
+
+    # ------------ shared memory ------------
+    def share(self, name=None) -> "shared_memory.SharedMemory":
+        """Copy every table into one shared memory block that other processes can attach()
+
+        The caller owns the block: keep it alive while workers use it, then
+        close() and unlink() it. Shared memory needs Python 3.8 or higher.
+        """
+        from multiprocessing import shared_memory  # Only MCTS process pools share tables
+        index = []
+        cdf = array("d")
+        damage = array("i")
+        critical = array("B")
+        with self.lock:
+            entries = list(self.tables.items())
+        for (damage_range, damage_boost, attacker_stats, defender_stats), table in entries:
+            index.append([*damage_range, damage_boost, *attacker_stats, *defender_stats, len(cdf), len(table.cdf)])
+            cdf.extend(table.cdf)
+            damage.extend(table.damage)
+            critical.extend(table.critical)
+        header = json.dumps(index).encode()
+        header_size = (8 + len(header) + 7) // 8 * 8  # Keep the float section aligned
+
+        size = header_size + len(cdf) * 8 + len(damage) * 4 + len(critical)
+        block = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        struct.pack_into("<Q", block.buf, 0, len(header))
+        block.buf[8:8 + len(header)] = header
+        offset = header_size
+        for column in (cdf, damage, critical):
+            raw = column.tobytes()
+            block.buf[offset:offset + len(raw)] = raw
+            offset += len(raw)
+        return block
+
+    @classmethod
+    def attach(cls, name: str):
+        """Index the tables in a shared block (zero-copy); new matchups are still built locally
+
+        Call close() when done to detach from the block.
+        """
+        from multiprocessing import shared_memory
+        block = shared_memory.SharedMemory(name=name)
+        header_length = struct.unpack_from("<Q", block.buf, 0)[0]
+        index = json.loads(bytes(block.buf[8:8 + header_length]))
+        header_size = (8 + header_length + 7) // 8 * 8
+        values = sum(entry[-1] for entry in index)
+
+        cdf = block.buf[header_size:header_size + values * 8].cast("d")
+        damage_start = header_size + values * 8
+        damage = block.buf[damage_start:damage_start + values * 4].cast("i")
+        critical = block.buf[damage_start + values * 4:damage_start + values * 5]
+
+        tables = cls()
+        for low, high, boost, *stats, start, count in index:
+            key = ((low, high), boost, tuple(stats[0:3]), tuple(stats[3:6]))
+            tables.tables[key] = AttackTable(cdf[start:start + count],
+                                             damage[start:start + count],
+                                             critical[start:start + count])
+        tables.block = block
+        return tables
+
+    def close(self) -> None:
+        """Drop every table and detach from shared memory"""
+        self.tables.clear()
+        if self.block is not None:
+            self.block.close()
+            self.block = None
+
+
+# ------------ default index ------------
+# Shared by every character; the tables depend only on stats, never on a game
+damage_tables = DamageTables()
@@ -0,0 +1,239 @@
+# ------------ imports ------------
+from array import array
+from damage_table import damage_tables
+from initiative import Initiative
+from status_effects import StatusEffects
+
+
+# ------------ class setup ------------
+class EnemyPool:
+    """Structure-of-arrays store for large simulated enemy populations
+
+    Every enemy is a row index into parallel typed arrays instead of an Enemy
+    object, so 100k live combatants take a few megabytes. Names and weapons
+    are shared per enemy kind. Combat follows Character.attack and
+    Character.apply_status_effects (same rolls in the same order) but never
+    prints. Pool enemies have one (duration, value) pair per effect, so
+    poison refreshes on them instead of stacking.
+
+    Each enemy also keeps the tick of its next action on the Initiative
+    timeline, starting one delay after tick 0 like the enemies of a new
+    battle. Removing an enemy moves the last row into its place, so row
+    indices are only stable until the next removal.
+    """
+    # Packed status layout shared with StatusEffects: (duration, value) per kind
+    status_offsets = StatusEffects._offsets
+
+    __slots__ = ("names", "weapons", "_kinds", "kind", "level",
+                 "health", "health_max", "strength", "defense", "speed", "effects", "due")
+
+    def __init__(self) -> None:
+        # Per-kind data
+        self.names = []
+        self.weapons = []
+        self._kinds = {}
+
+        # Per-enemy columns
+        self.kind = array("I")
+        self.level = array("i")
+        self.health = array("i")
+        self.health_max = array("i")
+        self.strength = array("i")
+        self.defense = array("i")
+        self.speed = array("i")
+        self.effects = array("i")  # 6 packed status values per enemy
+        self.due = array("q")      # Tick of each enemy's next action
+
+    def __len__(self) -> int:
+        return len(self.health)
+
+    def _kind_of(self, enemy) -> int:
+        key = (enemy.name, id(enemy.weapon))
+        kind = self._kinds.get(key)
+        if kind is None:
+            kind = len(self.names)
+            self._kinds[key] = kind
+            self.names.append(enemy.name)
+            self.weapons.append(enemy.weapon)
+        return kind
+
+    def add(self, enemy, count: int = 1) -> int:
+        """Add count copies of an enemy at full health, returning the first new index"""
+        first = len(self.health)
+        kind = self._kind_of(enemy)
+        self.kind.extend([kind] * count)
+        self.level.extend([enemy.level] * count)
+        self.health.extend([enemy.health_max] * count)
+        self.health_max.extend([enemy.health_max] * count)
+        self.strength.extend([enemy.get_total_strength()] * count)
+        self.defense.extend([enemy.get_total_defense()] * count)
+        self.speed.extend([enemy.get_total_speed()] * count)
+        self.effects.extend([0] * (6 * count))
+        self.due.extend([self._delay(enemy.get_total_speed())] * count)
+        return first
+
+    def add_wave(self, templates, count: int, rng) -> int:
+        """Add count enemies drawn with replacement from templates, returning the first new index
+
+        The kinds are picked with one bulk roll, and every column is filled
+        in one pass, so a 100k wave never creates an Enemy.
+        """
+        first = len(self.health)
+        picks = rng.roll_block(0, len(templates) - 1, count)
+        kinds = [self._kind_of(template) for template in templates]
+        rows = [(template.level, template.health_max, template.get_total_strength(),
+                 template.get_total_defense(), template.get_total_speed()) for template in templates]
+        self.kind.extend(kinds[pick] for pick in picks)
+        for column, position in ((self.level, 0), (self.health, 1), (self.health_max, 1),
+                                 (self.strength, 2), (self.defense, 3), (self.speed, 4)):
+            column.extend(rows[pick][position] for pick in picks)
+        self.effects.extend([0] * (6 * count))
+        delays = [self._delay(row[4]) for row in rows]
+        self.due.extend(delays[pick] for pick in picks)
+        return first
+
+    def remove(self, index: int) -> None:
+        """Remove an enemy in O(1) by moving the last enemy into its row"""
+        last = len(self.health) - 1
+        for column in (self.kind, self.level, self.health, self.health_max,
+                       self.strength, self.defense, self.speed, self.due):
+            column[index] = column[last]
+            column.pop()
+        self.effects[index * 6:index * 6 + 6] = self.effects[last * 6:last * 6 + 6]
+        del self.effects[last * 6:]
+
+    def remove_dead(self) -> int:
+        """Remove every defeated enemy, returning how many were removed"""
+        removed = 0
+        index = len(self.health) - 1
+        while index >= 0:
+            if self.health[index] <= 0:
+                self.remove(index)
+                removed += 1
+            index -= 1
+        return removed
+
+    def name(self, index: int) -> str:
+        return self.names[self.kind[index]]
+
+    def weapon(self, index: int):
+        return self.weapons[self.kind[index]]
+
+    def _stats(self, index: int) -> tuple:
+        # Freeze slows like Character.get_total_speed
+        return (self.strength[index], self.defense[index],
+                max(0, self.speed[index] - self.effects[index * 6 + self.status_offsets["freeze"] + 1]))
+
+    @staticmethod
+    def _delay(speed: int) -> int:
+        return max(1, Initiative.tempo // (speed + Initiative.speed_offset))
+
+    def actions_until(self, tick: int) -> list:
+        """Indices of the enemies acting up to and including tick, in timeline order
+
+        An enemy acts every Initiative delay at its speed when it is due, so
+        fast enemies appear more than once; each one's next action is moved
+        past tick. Ties go to the lower index.
+        """
+        due = self.due
+        actions = []
+        for index in range(len(due)):
+            next_tick = due[index]
+            if next_tick <= tick:
+                delay = self._delay(self._stats(index)[2])
+                while next_tick <= tick:
+                    actions.append((next_tick, index))
+                    next_tick += delay
+                due[index] = next_tick
+        actions.sort()
+        return [index for _, index in actions]
+
+    def attack(self, index: int, target, rng, draw=None) -> int:
+        """Enemy at index attacks a Character, returning the damage dealt
+
+        draw is the uniform roll for the attack table; it is taken from rng
+        when not given.
+        """
+        weapon = self.weapons[self.kind[index]]
+        stats = self._stats(index)
+        if draw is None:
+            draw = rng.random()
+        final_damage = damage_tables.lookup(weapon.damage_range, weapon.damage_boost,
+                                            stats, target.stats()).roll(draw)[0]
+        if not final_damage:
+            return 0
+
+        target.health = max(target.health - final_damage, 0)
+        if target.health_bar:
+            target.health_bar.update()
+
+        effect = weapon.has_special_effect(rng)
+        if effect and target.health > 0:
+            if effect == "burn":
+                target.status_effects.add("burn", 3, final_damage // 4)
+            elif effect == "poison":
+                target.status_effects.add("poison", 3, final_damage // 3)
+            elif effect == "freeze":
+                target.status_effects.add("freeze", 2, 2)
+                target.stats_changed()
+        return final_damage
+
+    def volley(self, indices, target, rng):
+        """Enemies at indices attack a Character in turn until it falls
+
+        The attack rolls are pre-drawn as one block. Returns the index of
+        the enemy that defeated the target, or None.
+        """
+        attack = self.attack
+        for index, draw in zip(indices, rng.block(len(indices))):
+            attack(index, target, rng, draw)
+            if target.health <= 0:
+                return index
+        return None
+
+    def receive_attack(self, index: int, attacker, rng) -> int:
+        """A Character attacks the enemy at index, returning the damage dealt"""
+        weapon = attacker.weapon
+        stats = self._stats(index)
+        final_damage = damage_tables.lookup(weapon.damage_range, weapon.damage_boost,
+                                            attacker.stats(), stats).roll(rng.random())[0]
+        if not final_damage:
+            return 0
+
+        self.health[index] = max(self.health[index] - final_damage, 0)
+
+        effect = attacker.weapon.has_special_effect(rng)
+        if effect and self.health[index] > 0:
+            base = index * 6 + self.status_offsets[effect]
+            if effect == "burn":
+                duration, value = 3, final_damage // 4
+            elif effect == "poison":
+                duration, value = 3, final_damage // 3
+            else:
+                duration, value = 2, 2
+            # Refresh: the longer duration and the stronger value
+            self.effects[base] = max(self.effects[base], duration)
+            self.effects[base + 1] = max(self.effects[base + 1], value)
+        return final_damage
+
+    def apply_status_effects(self, index: int) -> None:
+        """Apply and tick down the status effects of one enemy"""
+        effects = self.effects
+        for kind, offset in self.status_offsets.items():
+            slot = index * 6 + offset
+            if effects[slot] > 0:
+                if kind != "freeze":
+                    self.health[index] = max(0, self.health[index] - effects[slot + 1])
+                effects[slot] -= 1
+                if effects[slot] <= 0:
+                    effects[slot] = 0
+                    effects[slot + 1] = 0
+
+    def apply_all_status_effects(self) -> None:
+        """Apply status effects to every alive enemy that has any"""
+        effects = self.effects
+        health = self.health
+        for index in range(len(health)):
+            base = index * 6
+            if health[index] > 0 and (effects[base] or effects[base + 2] or effects[base + 4]):
+                self.apply_status_effects(index)
@@ -0,0 +1,140 @@
+# ------------ imports ------------
+from typing import NamedTuple
+from character import Enemy, Boss
+from health_bar import HealthBar
+from rng import GameRNG
+from renderer import NullRenderer, default_renderer
+from combat_log import null_combat_log
+from status_effects import StatusEffects
+
+
+# Interned (strength, defense, speed) tuples of spawned enemies
+_stat_keys = {}
+
+
+# ------------ template setup ------------
+class EnemyTemplate(NamedTuple):
+    """Immutable, precomputed stat block that spawns fresh enemies"""
+    name: str
+    level: int
+    health_max: int
+    strength: int
+    defense: int
+    speed: int
+    weapon: object
+    experience_reward: int
+    coin_range: tuple       # (low, high) coin roll made at spawn time
+    coin_multiplier: int
+    special_abilities: tuple
+    is_boss: bool
+    phase_thresholds: tuple
+
+    @classmethod
+    def build(cls, name: str, health: int, damage_range: tuple, level: int = 1, weapon=None, is_boss: bool = False):
+        """Run the Enemy/Boss scaling rules once and capture the result"""
+        # A private stream keeps template building from touching any game's randomness
+        if is_boss:
+            enemy = Boss(name, health, damage_range, level, weapon, rng=GameRNG(0), renderer=NullRenderer())
+        else:
+            enemy = Enemy(name, health, damage_range, level, weapon, rng=GameRNG(0), renderer=NullRenderer())
+        coin_multiplier = 3 if is_boss else 1
+        return cls(name=enemy.name,
+                   level=enemy.level,
+                   health_max=enemy.health_max,
+                   strength=enemy.strength,
+                   defense=enemy.defense,
+                   speed=enemy.speed,
+                   weapon=enemy.weapon,
+                   experience_reward=enemy.experience_reward,
+                   coin_range=(5 * level, 15 * level),
+                   coin_multiplier=coin_multiplier,
+                   special_abilities=tuple(enemy.special_abilities),
+                   is_boss=is_boss,
+                   phase_thresholds=tuple(enemy.phase_thresholds) if is_boss else ())
+
+    def get_total_strength(self):
+        return self.strength
+
+    def get_total_defense(self):
+        return self.defense
+
+    def get_total_speed(self):
+        return self.speed
+
+    def spawn(self, rng, renderer=default_renderer, combat_log=null_combat_log):
+        """Create a full-health enemy from this template in O(1)"""
+        enemy = Boss.__new__(Boss) if self.is_boss else Enemy.__new__(Enemy)
+        enemy.name = self.name
+        enemy.health = self.health_max
+        enemy.health_max = self.health_max
+        enemy.strength = self.strength
+        enemy.defense = self.defense
+        enemy.speed = self.speed
+        enemy.strength_bonus = 0
+        enemy.defense_bonus = 0
+        enemy.speed_bonus = 0
+        # Enemies of one template share a stat tuple, so attack() table caches hit across them
+        stat_key = (self.strength, self.defense, self.speed)
+        enemy.stat_key = _stat_keys.setdefault(stat_key, stat_key)
+        enemy.attack_table = None
+        enemy.status_effects = StatusEffects()
+        enemy.weapon = self.weapon
+        enemy.rng = rng
+        enemy.renderer = renderer
+        enemy.combat_log = combat_log
+        enemy.level = self.level
+        enemy.experience_reward = self.experience_reward
+        enemy.coin_reward = rng.randint(self.coin_range[0], self.coin_range[1]) * self.coin_multiplier
+        enemy.special_abilities = self.special_abilities
+        if self.is_boss:
+            enemy.phase = 1
+            enemy.phase_thresholds = self.phase_thresholds
+            enemy.current_phase_index = 0
+        enemy.health_bar = HealthBar(enemy, color="purple" if self.is_boss else "red")
+        return enemy
+
+    def spawn_many(self, count: int, rng, renderer=default_renderer, combat_log=null_combat_log):
+        """Create count fresh enemies from this template"""
+        spawn = self.spawn
+        return [spawn(rng, renderer, combat_log) for _ in range(count)]
+
+    def minion(self):
+        """Template for the minions this boss summons"""
+        return EnemyTemplate.build(f"{self.name}'s Minion",
+                                   self.health_max // 3,
+                                   (self.weapon.damage_range[0] // 2, self.weapon.damage_range[1] // 2),
+                                   self.level - 1)
+
+
+# ------------ registry setup ------------
+class EnemyRegistry:
+    """Catalogue of zone enemies, zone bosses and boss minions as templates"""
+    def __init__(self, zone_enemies: dict, zone_bosses: dict) -> None:
+        self.zone_enemies = {zone: tuple(templates) for zone, templates in zone_enemies.items()}
+        self.zone_bosses = dict(zone_bosses)
+        self.minions = {boss.name: boss.minion() for boss in self.zone_bosses.values()}
+
+    def spawn_group(self, zone: int, count: int, rng, renderer=default_renderer, combat_log=null_combat_log):
+        """Spawn up to count different enemies from a zone, like Game.trigger_battle"""
+        templates = self.zone_enemies[zone]
+        return [template.spawn(rng, renderer, combat_log) for template in rng.sample(templates, min(count, len(templates)))]
+
+    def spawn_wave(self, zone: int, count: int, rng, renderer=default_renderer, combat_log=null_combat_log):
+        """Spawn count enemies drawn with replacement from a zone"""
+        templates = self.zone_enemies[zone]
+        choice = rng.choice
+        return [choice(templates).spawn(rng, renderer, combat_log) for _ in range(count)]
+
+    def spawn_boss(self, zone: int, rng, renderer=default_renderer, combat_log=null_combat_log):
+        return self.zone_bosses[zone].spawn(rng, renderer, combat_log)
+
+    def spawn_minion(self, boss, rng, renderer=default_renderer, combat_log=null_combat_log):
+        """Spawn a minion for a boss (any Boss, not only registered ones)"""
+        template = self.minions.get(boss.name)
+        if template is None:
+            template = EnemyTemplate.build(f"{boss.name}'s Minion",
+                                           boss.health_max // 3,
+                                           (boss.weapon.damage_range[0] // 2, boss.weapon.damage_range[1] // 2),
+                                           boss.level - 1)
+            self.minions[boss.name] = template
+        return template.spawn(rng, renderer, combat_log)
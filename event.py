@@ -1,4 +1,3 @@
-import random
 from item import Item
 from weapon import Weapon
 
@@ -42,31 +41,34 @@ class Event:
         return loot_options
 
     @staticmethod
-    def handle_special_event(event_name, hero):
+    def handle_special_event(event_name, hero, rng):
         """Handle special events with unique effects"""
         if event_name == "Seeing a Fire":
             # Resting at a fire restores some health
             heal_amount = hero.health_max // 4
             hero.health = min(hero.health + heal_amount, hero.health_max)
-            print(f"You rest by the fire and recover {heal_amount} health.")
+            hero.renderer.show("You rest by the fire and recover {} health.", heal_amount)
             return True
         elif event_name == "Magical Fountain":
             # Fountain can give random buffs
             effects = ["strength", "speed", "defense", "health"]
-            effect = random.choice(effects)
+            effect = rng.choice(effects)
             
             if effect == "health":
                 hero.health = hero.health_max
-                print("You drink from the fountain and your health is fully restored!")
+                hero.renderer.show("You drink from the fountain and your health is fully restored!")
             elif effect == "strength":
                 hero.strength_bonus += 2
-                print("You drink from the fountain and feel stronger! (+2 Strength)")
+                hero.stats_changed()
+                hero.renderer.show("You drink from the fountain and feel stronger! (+2 Strength)")
             elif effect == "speed":
                 hero.speed_bonus += 2
-                print("You drink from the fountain and feel faster! (+2 Speed)")
+                hero.stats_changed()
+                hero.renderer.show("You drink from the fountain and feel faster! (+2 Speed)")
             elif effect == "defense":
                 hero.defense_bonus += 2
-                print("You drink from the fountain and your skin hardens slightly! (+2 Defense)")
+                hero.stats_changed()
+                hero.renderer.show("You drink from the fountain and your skin hardens slightly! (+2 Defense)")
             
             return True
         
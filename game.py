@@ -1,19 +1,76 @@
-import os
-import random
-import time
-from character import Hero, Enemy, Boss
+import copy
+from character import Hero, Boss
+from enemy_templates import EnemyTemplate, EnemyRegistry
 from weapon import Weapon, fists, iron_sword, short_bow, flaming_sword, frost_axe, poison_dagger
 from item import Item
 from shop import Shop
 from event import Event
+from rng import GameRNG
+from renderer import TerminalRenderer, NullRenderer
+from combat_log import EventKind, null_combat_log
+from status_effects import StatusScheduler
+from battlefield import Battlefield
+from initiative import Initiative
+from profiler import Profiler
+from clock import RealClock, VirtualClock
+from save_file import SaveFile
+
+class GameEnded(Exception):
+    """Raised when the game is over, instead of exiting the process"""
+    def __init__(self, message, outcome="defeat"):
+        super().__init__(message)
+        self.message = message
+        self.outcome = outcome  # "defeat", "victory" or "quit"
+
+def console_input(prompt):
+    """Read a line from the terminal (the renderer has already shown the prompt)"""
+    return input()
 
 class Game:
-    def __init__(self):
+    def __init__(self, input_func=console_input, headless=False, seed=None, rng=None, renderer=None, combat_log=None,
+                 save_path="savegame.sav", clock=None):
+        # Input source and presentation mode
+        self.input_func = input_func
+        self.headless = headless  # Headless games never wait and show nothing by default
+        if renderer is None:
+            renderer = NullRenderer() if headless else TerminalRenderer()
+        self.renderer = renderer
+        
+        # Paces pauses and records their logical length (see clock.py)
+        if clock is None:
+            clock = VirtualClock() if headless else RealClock()
+        self.clock = clock
+        
+        # Single random stream for the whole game (replayable from its seed)
+        self.rng = rng or GameRNG(seed)
+        
+        # Structured record of every battle (see combat_log.py)
+        self.combat_log = combat_log or null_combat_log
+        
+        # Turns on which battle status effects tick
+        self.status_scheduler = StatusScheduler()
+        
+        # Phase timers and call counters, while a Profiler is attached (see profiler.py)
+        self.profiler = None
+        
+        # Initialize weapons: every game has its own copies of the weapons in
+        # weapon.py, so a potion's damage boost never reaches another game
+        # running in the same process (server sessions, runner workers)
+        self.own_weapons = {weapon: copy.copy(weapon) for weapon in
+                            (fists, iron_sword, short_bow, flaming_sword, frost_axe, poison_dagger)}
+        self.weapons = list(self.own_weapons.values())
+        
         # Initialize the hero
-        self.hero = Hero("Hero", 999)
+        self.hero = Hero("Hero", 999, rng=self.rng, renderer=self.renderer, combat_log=self.combat_log)
+        self.hero.weapon = self.hero.default_weapon = self.own_weapons[fists]
         
         # Game state
         self.current_enemies = None
+        self.battlefield = None  # Alive and targeting index of the current battle
+        self.initiative = None  # Speed-based turn order of the current battle
+        self.targeting = "first"  # Hero's default target: "first", "weakest" or "threat"
+        self.turns_taken = 0
+        self.defeated_by = None
         self.current_zone = 1
         self.max_zones = 5
         self.boss_defeated = False
@@ -23,7 +80,10 @@ class Game:
         self.events = Event.generate_random_events()
         
         # Initialize shop
-        self.shop = Shop()
+        self.shop = Shop(self.rng, self.renderer)
+        
+        # Incremental save file (see save_file.py)
+        self.save_file = SaveFile(save_path)
         
         # Story progress tracking
         self.story_progress = 0
@@ -35,65 +95,120 @@ class Game:
             "Beware of the dungeon's master who guards the artifact."
         ]
         
-        # Initialize weapons
-        self.weapons = [
-            fists,
-            iron_sword,
-            short_bow,
-            flaming_sword,
-            frost_axe,
-            poison_dagger
-        ]
-        
-        # Initialize enemies for each zone
-        self.zone_enemies = {
+        # Enemy templates for each zone (fresh enemies are spawned for every battle)
+        zone_enemies = {
             1: [
-                Enemy("Skeleton Guard", 30, (3, 8), 1),
-                Enemy("Sewer Rat", 20, (2, 5), 1),
-                Enemy("Slime", 25, (2, 6), 1)
+                EnemyTemplate.build("Skeleton Guard", 30, (3, 8), 1),
+                EnemyTemplate.build("Sewer Rat", 20, (2, 5), 1),
+                EnemyTemplate.build("Slime", 25, (2, 6), 1)
             ],
             2: [
-                Enemy("Bat", 35, (4, 9), 2),
-                Enemy("Lesser Lich", 45, (5, 12), 2),
-                Enemy("Undead Knight", 50, (6, 14), 2)
+                EnemyTemplate.build("Bat", 35, (4, 9), 2),
+                EnemyTemplate.build("Lesser Lich", 45, (5, 12), 2),
+                EnemyTemplate.build("Undead Knight", 50, (6, 14), 2)
             ],
             3: [
-                Enemy("Undying Noble", 60, (8, 16), 3),
-                Enemy("Mimic", 55, (7, 15), 3),
-                Enemy("Lesser Demon", 70, (10, 18), 3)
+                EnemyTemplate.build("Undying Noble", 60, (8, 16), 3),
+                EnemyTemplate.build("Mimic", 55, (7, 15), 3),
+                EnemyTemplate.build("Lesser Demon", 70, (10, 18), 3)
             ],
             4: [
-                Enemy("Shadow Assassin", 75, (12, 20), 4),
-                Enemy("Corrupted Mage", 65, (15, 25), 4),
-                Enemy("Stone Golem", 90, (10, 22), 4)
+                EnemyTemplate.build("Shadow Assassin", 75, (12, 20), 4),
+                EnemyTemplate.build("Corrupted Mage", 65, (15, 25), 4),
+                EnemyTemplate.build("Stone Golem", 90, (10, 22), 4)
             ],
             5: [
-                Enemy("Elite Guard", 100, (15, 25), 5),
-                Enemy("Dark Priest", 85, (18, 28), 5),
-                Enemy("Chaos Beast", 110, (20, 30), 5)
+                EnemyTemplate.build("Elite Guard", 100, (15, 25), 5),
+                EnemyTemplate.build("Dark Priest", 85, (18, 28), 5),
+                EnemyTemplate.build("Chaos Beast", 110, (20, 30), 5)
             ]
         }
         
         # Zone bosses
-        self.zone_bosses = {
-            1: Boss("Dungeon Keeper", 120, (10, 20), 2),
-            2: Boss("Necromancer", 180, (15, 25), 3),
-            3: Boss("Demon Lord", 250, (20, 30), 4),
-            4: Boss("Ancient Golem", 300, (25, 35), 5),
-            5: Boss("Dungeon Master", 400, (30, 50), 6, flaming_sword)
+        zone_bosses = {
+            1: EnemyTemplate.build("Dungeon Keeper", 120, (10, 20), 2, is_boss=True),
+            2: EnemyTemplate.build("Necromancer", 180, (15, 25), 3, is_boss=True),
+            3: EnemyTemplate.build("Demon Lord", 250, (20, 30), 4, is_boss=True),
+            4: EnemyTemplate.build("Ancient Golem", 300, (25, 35), 5, is_boss=True),
+            5: EnemyTemplate.build("Dungeon Master", 400, (30, 50), 6, self.own_weapons[flaming_sword], is_boss=True)
         }
+        
+        self.enemy_registry = EnemyRegistry(zone_enemies, zone_bosses)
+        self.zone_enemies = self.enemy_registry.zone_enemies
+        self.zone_bosses = self.enemy_registry.zone_bosses
+    
+    def clone(self, renderer=None, combat_log=None):
+        """Copy the game state for search without copy.deepcopy
+
+        The hero, the current enemies and the RNG are copied; everything that
+        does not change during play (zones, templates, weapons, events) is
+        shared with the original.
+        """
+        clone = object.__new__(Game)
+        clone.__dict__.update(self.__dict__)
+        clone.rng = self.rng.copy()
+        if renderer is not None:
+            clone.renderer = renderer
+        if combat_log is not None:
+            clone.combat_log = combat_log
+        clone.hero = self.hero.clone(clone.rng, clone.renderer, clone.combat_log)
+        if self.current_enemies is not None:
+            clone.current_enemies = [enemy.clone(clone.rng, clone.renderer, clone.combat_log)
+                                     for enemy in self.current_enemies]
+            if self.battlefield is not None:
+                clone.battlefield = self.battlefield.clone(clone.current_enemies, clone.hero)
+            else:
+                clone.battlefield = Battlefield(clone.current_enemies, clone.hero)
+        if self.initiative is not None:
+            originals = [self.hero] + (self.current_enemies or [])
+            copies = [clone.hero] + (clone.current_enemies or [])
+            clone.initiative = self.initiative.clone(dict(zip(originals, copies)))
+        clone.status_scheduler = StatusScheduler()
+        clone.status_scheduler.begin_battle([clone.hero] + (clone.current_enemies or []))
+        clone.shop = copy.copy(self.shop)
+        clone.shop.rng = clone.rng
+        clone.shop.renderer = clone.renderer
+        # Profiler hooks are bound to this game; copies run uninstrumented and never wait
+        for method in Profiler.phases:
+            clone.__dict__.pop(method, None)
+        clone.profiler = None
+        clone.clock = VirtualClock()
+        return clone
+    
+    def snapshot(self):
+        """Capture the current state so restore() can return to it"""
+        return self.clone()
+    
+    def restore(self, snapshot):
+        """Return to a captured state (the snapshot can be restored again)"""
+        profiler = self.profiler
+        clock = self.clock
+        self.__dict__.update(snapshot.clone(self.renderer).__dict__)
+        self.profiler = profiler
+        self.clock = clock
     
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.renderer.clear()
     
-    def game_over(self, message):
+    def pause(self, seconds):
+        """Wait so the player can read the screen"""
+        self.renderer.flush()
+        self.clock.pause(seconds)
+    
+    def ask(self, prompt):
+        """Ask the player for input"""
+        self.renderer.prompt(prompt)
+        return self.input_func(prompt)
+    
+    def game_over(self, message, outcome="defeat"):
         """End the game with a message"""
         self.clear_screen()
-        print("\n" + "="*50)
-        print(message)
-        print("="*50 + "\n")
-        exit()
+        self.renderer.show("\n" + "="*50)
+        self.renderer.show(message)
+        self.renderer.show("="*50 + "\n")
+        self.renderer.flush()
+        raise GameEnded(message, outcome)
     
     def display_zone_info(self):
         """Display information about the current zone"""
@@ -113,226 +228,307 @@ class Game:
             5: "The final chamber where the dungeon master awaits."
         }
         
-        print("\n" + "="*50)
-        print(f"\033[33;1mZONE {self.current_zone}: {zone_names[self.current_zone]}\033[0m")
-        print(zone_descriptions[self.current_zone])
-        print("="*50 + "\n")
+        self.renderer.show("\n" + "="*50)
+        self.renderer.show("\033[33;1mZONE {}: {}\033[0m", self.current_zone, zone_names[self.current_zone])
+        self.renderer.show(zone_descriptions[self.current_zone])
+        self.renderer.show("="*50 + "\n")
     
     def advance_story(self):
         """Advance the story and display the next story event"""
         if self.story_progress < len(self.story_events):
-            print("\n" + "*"*50)
-            print(f"\033[36;1mSTORY: {self.story_events[self.story_progress]}\033[0m")
-            print("*"*50 + "\n")
+            self.renderer.show("\n" + "*"*50)
+            self.renderer.show("\033[36;1mSTORY: {}\033[0m", self.story_events[self.story_progress])
+            self.renderer.show("*"*50 + "\n")
             self.story_progress += 1
-            time.sleep(2)
+            self.pause(2)
     
     def trigger_random_event(self):
         """Trigger a random event"""
-        event = random.choice(self.events)
+        event = self.rng.choice(self.events)
         return event
     
-    def encounter_enemies(self, enemies, event_description):
-        """Handle a battle with enemies"""
+    def begin_battle(self, enemies):
+        """Make enemies the current battle and reset the per-battle indexes"""
         self.current_enemies = enemies
-        enemy_index = 0  # Track which enemy to target
-        turn_counter = 0  # Track battle turns
-        
-        # Battle loop
-        while any(enemy.health > 0 for enemy in self.current_enemies) and self.hero.health > 0:
-            turn_counter += 1
-            self.clear_screen()
-            
-            # Display event and battle info
-            print("\n" + "="*50)
-            print(f"\033[31;1mBATTLE!\033[0m {event_description}")
-            print("="*50 + "\n")
-            
-            # Display health bars
-            self.hero.health_bar.draw()
-            print("\nEnemies:")
-            for enemy in self.current_enemies:
-                if enemy.health > 0:
-                    enemy.health_bar.draw()
-            
-            # Apply status effects at the start of turn
-            self.hero.apply_status_effects()
-            for enemy in self.current_enemies:
-                if enemy.health > 0:
-                    enemy.apply_status_effects()
-            
-            # Update ability cooldowns
-            self.hero.update_cooldowns()
-            
-            # Check if any enemies died from status effects
-            for enemy in self.current_enemies:
-                if enemy.health <= 0:
-                    print(f"{enemy.name} has been defeated!")
-            
-            # Player's turn
-            if self.hero.health > 0:
-                # Select target enemy (only consider alive enemies)
-                alive_enemies = [e for e in self.current_enemies if e.health > 0]
-                if not alive_enemies:
-                    break  # All enemies defeated
-                
-                # Automatically target the first alive enemy
-                target_enemy = alive_enemies[0]
-                
-                # Show battle options
-                print("\nYour turn! Choose an action:")
-                print("1. Attack")
-                
-                # Show available abilities
-                ability_options = []
-                for i, (ability_name, ability_data) in enumerate(self.hero.abilities.items(), start=2):
-                    if self.hero.level >= ability_data["level"] and ability_data["cooldown"] == 0:
-                        print(f"{i}. {ability_name}")
-                        ability_options.append(ability_name)
-                    elif self.hero.level >= ability_data["level"]:
-                        print(f"{i}. {ability_name} (Cooldown: {ability_data['cooldown']} turns)")
-                        ability_options.append(ability_name)
-                
-                # Get player choice
-                choice = input("Enter your choice: ")
+        self.battlefield = Battlefield(enemies, self.hero)
+        self.initiative = Initiative(self.hero, enemies)
+        self.combat_log.begin_battle()
+        self.status_scheduler.begin_battle([self.hero] + enemies)
+    
+    def alive_enemies(self):
+        """Return the enemies in the current battle that are still standing"""
+        return list(self.battlefield.alive)
+    
+    def start_battle_turn(self):
+        """Apply status effects and cooldowns at the start of a battle turn"""
+        self.combat_log.begin_turn()
+        self.apply_turn_status_effects()
+        self.update_cooldowns()
+    
+    def apply_turn_status_effects(self):
+        """Tick status effects, only on the combatants that have any"""
+        scheduler = self.status_scheduler
+        hero = self.hero
+        defeated = []
+        for character in scheduler.advance():
+            if character.health > 0:
+                character.apply_status_effects()
+                if character is not hero:
+                    self.battlefield.update(character)
+                if character.health <= 0:
+                    defeated.append(character)
+                elif character.status_effects:
+                    scheduler.schedule(character)
+        
+        # Report enemies that died from status effects
+        for character in defeated:
+            if character is not hero:
+                self.renderer.show("{} has been defeated!", character.name)
+    
+    def update_cooldowns(self):
+        """Count the hero's ability cooldowns down by one turn"""
+        self.hero.update_cooldowns()
+    
+    def hero_action(self, action, target=None):
+        """Perform the hero's battle action ("Attack" or an ability name)"""
+        battlefield = self.battlefield
+        self.initiative.act(self.hero)
+        if target is None:
+            # Automatically pick a target with the game's targeting rule
+            target = battlefield.target(self.targeting)
+        
+        if action == "Attack":
+            self.hero.attack(target)
+            battlefield.update(target)
+        elif action == "Whirlwind":
+            # Area attack: every alive enemy is hit and re-indexed in one pass
+            targets = [target] + [enemy for enemy in battlefield.alive if enemy is not target]
+            self.hero.use_ability(action, targets)
+            battlefield.update_many(targets)
+        else:
+            # Single-target abilities never need the rest of the wave
+            self.hero.use_ability(action, [target])
+            battlefield.update(target)
+    
+    def enemy_turn(self):
+        """Let enemies act in initiative order until the hero is due again
+
+        Fast enemies may act several times and slow ones not at all. Returns
+        the enemy that defeated the hero (if any).
+        """
+        battlefield = self.battlefield
+        initiative = self.initiative
+        hero = self.hero
+        targets = [hero]
+        while True:
+            enemy = initiative.act_next(hero)
+            if enemy is None:
+                return None
+            if enemy.health > 0:
+                health = enemy.health
                 
-                if choice == "1":
-                    # Regular attack
-                    self.hero.attack(target_enemy)
-                elif choice.isdigit() and 2 <= int(choice) <= len(ability_options) + 1:
-                    # Use ability
-                    ability_index = int(choice) - 2
-                    if ability_index < len(ability_options):
-                        ability_name = ability_options[ability_index]
-                        self.hero.use_ability(ability_name, alive_enemies)
-                else:
-                    print("Invalid choice. Performing regular attack.")
-                    self.hero.attack(target_enemy)
-            
-            # Check if all enemies are defeated
-            if not any(enemy.health > 0 for enemy in self.current_enemies):
-                break
-            
-            # Enemies' turn
-            for enemy in self.current_enemies:
-                if enemy.health > 0:
-                    # Boss enemies can use special abilities
-                    if isinstance(enemy, Boss):
-                        # Check for phase transition
-                        enemy.check_phase_transition()
-                        
-                        # Try to use a special ability
-                        ability_result = enemy.use_special_ability([self.hero])
-                        
-                        # If the boss wants to summon a minion
-                        if ability_result == "summon":
-                            # Create a minion based on the boss level
-                            minion = Enemy(f"{enemy.name}'s Minion", enemy.health_max // 3, 
-                                          (enemy.weapon.damage_range[0] // 2, enemy.weapon.damage_range[1] // 2),
-                                          enemy.level - 1)
-                            self.current_enemies.append(minion)
-                            print(f"A {minion.name} appears!")
-                        
-                        # If no special ability was used, perform regular attack
-                        if not ability_result or ability_result == "summon":
-                            enemy.attack(self.hero)
-                    else:
-                        # Regular enemies might use special abilities
-                        if not enemy.use_special_ability([self.hero]):
-                            enemy.attack(self.hero)
+                # Boss enemies can use special abilities
+                if isinstance(enemy, Boss):
+                    # Check for phase transition
+                    enemy.check_phase_transition()
                     
-                    # Check if hero is defeated
-                    if self.hero.health <= 0:
-                        self.hero.health_bar.draw()  # Show updated health
-                        self.game_over("Game Over! You were defeated by the enemy.")
-            
-            # Short pause between turns
-            time.sleep(1.5)
-        
-        # Battle rewards
+                    # Try to use a special ability
+                    ability_result = enemy.use_special_ability(targets)
+                    
+                    # If the boss wants to summon a minion
+                    if ability_result == "summon":
+                        # Create a minion based on the boss level
+                        minion = self.enemy_registry.spawn_minion(enemy, self.rng, self.renderer, self.combat_log)
+                        battlefield.add(minion)
+                        initiative.add(minion)
+                        self.status_scheduler.track(minion)
+                        self.combat_log.record(EventKind.SUMMON, enemy.name, minion.name)
+                        self.renderer.show("A {} appears!", minion.name)
+                    
+                    # If no special ability was used, perform regular attack
+                    if not ability_result or ability_result == "summon":
+                        enemy.attack(hero)
+                    
+                    # Phases change a boss's stats
+                    battlefield.update(enemy)
+                else:
+                    # Regular enemies might use special abilities
+                    if not enemy.use_special_ability(targets):
+                        enemy.attack(hero)
+                    elif enemy.health != health:
+                        battlefield.update(enemy)  # Healed
+                
+                # Stop as soon as the hero is defeated
+                if hero.health <= 0:
+                    return enemy
+    
+    def award_battle_rewards(self):
+        """Distribute experience, coins and loot after a won battle"""
         total_xp = 0
         total_coins = 0
         
         for enemy in self.current_enemies:
             if isinstance(enemy, Boss):
-                print(f"\033[33;1mYou have defeated the {enemy.name}!\033[0m")
+                self.renderer.show("\033[33;1mYou have defeated the {}!\033[0m", enemy.name)
             else:
-                print(f"You have defeated the {enemy.name}!")
+                self.renderer.show("You have defeated the {}!", enemy.name)
             
             # Award XP and coins
             if hasattr(enemy, 'experience_reward'):
-                total_xp += enemy.experience_reward
+                xp = enemy.experience_reward
             else:
-                total_xp += 10 * (self.current_zone)
+                xp = 10 * (self.current_zone)
                 
             if hasattr(enemy, 'coin_reward'):
-                total_coins += enemy.coin_reward
+                coins = enemy.coin_reward
             else:
-                total_coins += random.randint(5, 15) * self.current_zone
+                coins = self.rng.randint(5, 15) * self.current_zone
+            
+            total_xp += xp
+            total_coins += coins
+            self.combat_log.record(EventKind.REWARD_XP, enemy.name, self.hero.name, xp)
+            self.combat_log.record(EventKind.REWARD_COINS, enemy.name, self.hero.name, coins)
         
         # Award rewards
         self.hero.add_experience(total_xp)
         self.hero.add_coins(total_coins)
         
         # Chance to find an item after battle
-        if random.random() < 0.3:  # 30% chance
+        if self.rng.chance(0.3):  # 30% chance
             item_types = ["weapon", "armor", "consumable"]
-            item_type = random.choice(item_types)
+            item_type = self.rng.choice(item_types)
             
-            if item_type == "weapon" and random.random() < 0.7:
+            if item_type == "weapon" and self.rng.chance(0.7):
                 # Find a weapon appropriate for the zone
                 possible_weapons = [w for w in self.weapons if w.value <= self.current_zone * 100 and w.value > (self.current_zone - 1) * 50]
                 if possible_weapons:
-                    weapon = random.choice(possible_weapons)
+                    weapon = self.rng.choice(possible_weapons)
                     self.hero.add_item(weapon)
                     self.hero.equip(weapon)
             elif item_type == "armor":
                 armor_names = ["Leather Armor", "Chain Mail", "Plate Armor", "Dragon Scale", "Mystic Robe"]
-                armor = Item(f"{random.choice(armor_names)}", "armor", 50 * self.current_zone, "33")
+                armor = Item(f"{self.rng.choice(armor_names)}", "armor", 50 * self.current_zone, "33")
                 self.hero.add_item(armor)
             elif item_type == "consumable":
                 potion_types = ["Health", "Strength", "Speed"]
-                potion = Item(f"{random.choice(potion_types)} Potion", "consumable", 30, "31")
+                potion = Item(f"{self.rng.choice(potion_types)} Potion", "consumable", 30, "31")
                 self.hero.add_item(potion)
         
         # Restore some of hero's health after battle
         heal_amount = self.hero.health_max // 5
         self.hero.health = min(self.hero.health + heal_amount, self.hero.health_max)
-        print(f"You recover {heal_amount} health after the battle.")
+        self.renderer.show("You recover {} health after the battle.", heal_amount)
         
         # Update health bar
         self.hero.health_bar.update()
-        time.sleep(2)
+    
+    def draw_battle(self, event_description):
+        """Show the battle screen: event banner and every health bar"""
+        self.clear_screen()
+        
+        # Display event and battle info
+        self.renderer.show("\n" + "="*50)
+        self.renderer.show("\033[31;1mBATTLE!\033[0m {}", event_description)
+        self.renderer.show("="*50 + "\n")
+        
+        # Display health bars
+        self.hero.health_bar.draw()
+        self.renderer.show("\nEnemies:")
+        for enemy in self.battlefield.alive:
+            enemy.health_bar.draw()
+    
+    def encounter_enemies(self, enemies, event_description):
+        """Handle a battle with enemies"""
+        self.begin_battle(enemies)
+        turn_counter = 0  # Track battle turns
+        
+        # Battle loop
+        while self.battlefield and self.hero.health > 0:
+            turn_counter += 1
+            self.turns_taken += 1
+            self.draw_battle(event_description)
+            self.start_battle_turn()
+            
+            # Player's turn
+            if self.hero.health > 0:
+                # Select target enemy (only consider alive enemies)
+                if not self.battlefield:
+                    break  # All enemies defeated
+                
+                # Show battle options
+                self.renderer.show("\nYour turn! Choose an action:")
+                self.renderer.show("1. Attack")
+                
+                # Show available abilities
+                ability_options = []
+                for i, (ability_name, ability_data) in enumerate(self.hero.abilities.items(), start=2):
+                    if self.hero.level >= ability_data["level"] and ability_data["cooldown"] == 0:
+                        self.renderer.show("{}. {}", i, ability_name)
+                        ability_options.append(ability_name)
+                    elif self.hero.level >= ability_data["level"]:
+                        self.renderer.show("{}. {} (Cooldown: {} turns)", i, ability_name, ability_data['cooldown'])
+                        ability_options.append(ability_name)
+                
+                # Get player choice
+                choice = self.ask("Enter your choice: ")
+                
+                if choice == "1":
+                    # Regular attack
+                    self.hero_action("Attack")
+                elif choice.isdigit() and 2 <= int(choice) <= len(ability_options) + 1:
+                    # Use ability
+                    self.hero_action(ability_options[int(choice) - 2])
+                else:
+                    self.renderer.show("Invalid choice. Performing regular attack.")
+                    self.hero_action("Attack")
+            
+            # Check if all enemies are defeated
+            if not self.battlefield:
+                break
+            
+            # Enemies' turn
+            killer = self.enemy_turn()
+            if killer:
+                self.defeated_by = killer.name
+                self.hero.health_bar.draw()  # Show updated health
+                self.game_over("Game Over! You were defeated by the enemy.")
+            
+            # Short pause between turns
+            self.pause(1.5)
+        
+        # Battle rewards
+        self.award_battle_rewards()
+        self.pause(2)
     
     def handle_event_loot(self, event):
         """Handle loot from events"""
         if event.name == "Walking by a Corpse and Loot":
             # Set loot for corpse event
             loot_options = Event.generate_loot_options()
-            event.loot = random.choice(loot_options)
+            event.loot = self.rng.choice(loot_options)
         
         if event.loot:
             description, coins, item = event.loot
-            chosen_loot = random.choice([coins, item])
-            print(f"{event.name}: {event.description}")
-            print(description)
+            chosen_loot = self.rng.choice([coins, item])
+            self.renderer.show("{}: {}", event.name, event.description)
+            self.renderer.show(description)
             
             if isinstance(chosen_loot, int) and coins > 0:
                 self.hero.add_coins(coins)
             elif isinstance(chosen_loot, (Item, Weapon)) and item:
                 self.hero.add_item(item)
                 if isinstance(item, Weapon):
-                    choice = input(f"Do you want to equip the {item.name}? (y/n): ")
+                    choice = self.ask(f"Do you want to equip the {item.name}? (y/n): ")
                     if choice.lower() == 'y':
                         self.hero.equip(item)
         else:
-            print(f"{event.name}: {event.description}")
+            self.renderer.show("{}: {}", event.name, event.description)
     
     def handle_special_event(self, event):
         """Handle special events with unique effects"""
-        result = Event.handle_special_event(event.name, self.hero)
+        result = Event.handle_special_event(event.name, self.hero, self.rng)
         if result:
-            print(f"{event.name}: {event.description}")
+            self.renderer.show("{}: {}", event.name, event.description)
             return True
         return False
     
@@ -344,7 +540,7 @@ class Game:
         self.display_zone_info()
         
         # Random chance for different events
-        rand = random.random()
+        rand = self.rng.random()
         
         if rand < 0.1 and self.story_progress < len(self.story_events):
             # Story event
@@ -359,10 +555,10 @@ class Game:
             if event.name == "Walking by a Corpse and Loot":
                 self.handle_event_loot(event)
             elif not self.handle_special_event(event):
-                print(f"\n{event.name}: {event.description}\n")
+                self.renderer.show("\n{}: {}\n", event.name, event.description)
                 
                 # Chance for battle after event
-                if random.random() < 0.6:
+                if self.rng.chance(0.6):
                     self.trigger_battle(event.description)
         else:
             # Battle encounter
@@ -375,11 +571,11 @@ class Game:
     def trigger_battle(self, description):
         """Trigger a battle with random enemies or boss"""
         # Determine if this is a boss battle
-        is_boss_battle = random.random() < 0.2 and not self.boss_defeated
+        is_boss_battle = self.rng.chance(0.2) and not self.boss_defeated
         
         if is_boss_battle:
             # Boss battle
-            boss = self.zone_bosses[self.current_zone]
+            boss = self.enemy_registry.spawn_boss(self.current_zone, self.rng, self.renderer, self.combat_log)
             self.encounter_enemies([boss], f"BOSS BATTLE: {description}")
             
             # Mark boss as defeated if hero survived
@@ -391,18 +587,18 @@ class Game:
                 if self.current_zone == 1:
                     special_reward = Item("Dungeon Key", "key", 0, "33")
                 elif self.current_zone == 2:
-                    special_reward = frost_axe
+                    special_reward = self.own_weapons[frost_axe]
                 elif self.current_zone == 3:
-                    special_reward = poison_dagger
+                    special_reward = self.own_weapons[poison_dagger]
                 elif self.current_zone == 4:
                     special_reward = Item("Ancient Artifact", "artifact", 0, "35;1")
                 elif self.current_zone == 5:
-                    special_reward = flaming_sword
+                    special_reward = self.own_weapons[flaming_sword]
                 
                 if special_reward:
                     self.hero.add_item(special_reward)
                     if isinstance(special_reward, Weapon):
-                        choice = input(f"Do you want to equip the {special_reward.name}? (y/n): ")
+                        choice = self.ask(f"Do you want to equip the {special_reward.name}? (y/n): ")
                         if choice.lower() == 'y':
                             self.hero.equip(special_reward)
                 
@@ -412,16 +608,16 @@ class Game:
                     self.victory()
         else:
             # Regular battle
-            num_enemies = random.randint(1, 3)
-            enemies = random.sample(self.zone_enemies[self.current_zone], min(num_enemies, len(self.zone_enemies[self.current_zone])))
+            num_enemies = self.rng.randint(1, 3)
+            enemies = self.enemy_registry.spawn_group(self.current_zone, num_enemies, self.rng, self.renderer, self.combat_log)
             self.encounter_enemies(enemies, description)
     
     def offer_zone_advancement(self):
         """Offer the player to advance to the next zone"""
-        print(f"\n\033[33;1mYou have defeated the boss of Zone {self.current_zone}!\033[0m")
-        print(f"You can now advance to Zone {self.current_zone + 1}.")
+        self.renderer.show("\n\033[33;1mYou have defeated the boss of Zone {}!\033[0m", self.current_zone)
+        self.renderer.show("You can now advance to Zone {}.", self.current_zone + 1)
         
-        choice = input("Do you want to proceed to the next zone? (y/n): ")
+        choice = self.ask("Do you want to proceed to the next zone? (y/n): ")
         if choice.lower() == 'y':
             self.current_zone += 1
             self.boss_defeated = False
@@ -430,8 +626,8 @@ class Game:
             self.hero.health = self.hero.health_max
             self.hero.health_bar.update()
             
-            print(f"\033[36;1mAdvancing to Zone {self.current_zone}...\033[0m")
-            time.sleep(2)
+            self.renderer.show("\033[36;1mAdvancing to Zone {}...\033[0m", self.current_zone)
+            self.pause(2)
             
             # Advance story when entering new zone
             self.advance_story()
@@ -442,7 +638,7 @@ class Game:
         items = self.shop.display_items()
         
         while True:
-            choice = input("Enter the number of the item you want to buy (or '0' to leave): ")
+            choice = self.ask("Enter the number of the item you want to buy (or '0' to leave): ")
             if choice.isdigit():
                 choice = int(choice)
                 if 0 <= choice <= len(items):
@@ -452,86 +648,87 @@ class Game:
                         if self.shop.buy_item(self.hero, items, choice):
                             # If it's a weapon, ask if player wants to equip it
                             if isinstance(items[choice-1], Weapon):
-                                equip_choice = input(f"Do you want to equip the {items[choice-1].name}? (y/n): ")
+                                equip_choice = self.ask(f"Do you want to equip the {items[choice-1].name}? (y/n): ")
                                 if equip_choice.lower() == 'y':
                                     self.hero.equip(items[choice-1])
                         break
             else:
-                print("Invalid choice. Please try again.")
+                self.renderer.show("Invalid choice. Please try again.")
     
     def view_inventory(self):
         """Display the hero's inventory"""
         self.clear_screen()
         
         # Display hero stats
-        print("\n" + "="*50)
-        print(f"\033[33;1m{self.hero.name} - Level {self.hero.level}\033[0m")
-        print(f"Experience: {self.hero.experience}/{self.hero.experience_to_level}")
-        print(f"Health: {self.hero.health}/{self.hero.health_max}")
-        print(f"Strength: {self.hero.get_total_strength()} (Base: {self.hero.strength} + Bonus: {self.hero.strength_bonus})")
-        print(f"Defense: {self.hero.get_total_defense()} (Base: {self.hero.defense} + Bonus: {self.hero.defense_bonus})")
-        print(f"Speed: {self.hero.get_total_speed()} (Base: {self.hero.speed} + Bonus: {self.hero.speed_bonus})")
-        print("="*50)
-        
-        # Display inventory
-        weapons = [item for item in self.hero.inventory if isinstance(item, Weapon)]
-        consumables = [item for item in self.hero.inventory if isinstance(item, Item) and item.item_type == "consumable"]
-        equipment = [item for item in self.hero.inventory if isinstance(item, Item) and item.item_type in ["armor", "accessory"]]  
-        other_items = [item for item in self.hero.inventory if isinstance(item, Item) and item.item_type not in ["consumable", "armor", "accessory"]]
-        
-        print("\n\033[36;1mINVENTORY:\033[0m")
-        print(f"\033[33mGold: {self.hero.coins}\033[0m")
-        
-        print("\n\033[37;1mWeapons:\033[0m")
+        self.renderer.show("\n" + "="*50)
+        self.renderer.show("\033[33;1m{} - Level {}\033[0m", self.hero.name, self.hero.level)
+        self.renderer.show("Experience: {}/{}", self.hero.experience, self.hero.experience_to_level)
+        self.renderer.show("Health: {}/{}", self.hero.health, self.hero.health_max)
+        self.renderer.show("Strength: {} (Base: {} + Bonus: {})", self.hero.get_total_strength(), self.hero.strength, self.hero.strength_bonus)
+        self.renderer.show("Defense: {} (Base: {} + Bonus: {})", self.hero.get_total_defense(), self.hero.defense, self.hero.defense_bonus)
+        self.renderer.show("Speed: {} (Base: {} + Bonus: {})", self.hero.get_total_speed(), self.hero.speed, self.hero.speed_bonus)
+        self.renderer.show("="*50)
+        
+        # Display inventory (one line per stack of equal items)
+        inventory = self.hero.inventory
+        weapons = inventory.items(inventory.weapons)
+        consumables = inventory.items(inventory.consumables)
+        equipment = inventory.items(inventory.equipment)
+        other_items = inventory.items(inventory.other)
+        
+        self.renderer.show("\n\033[36;1mINVENTORY:\033[0m")
+        self.renderer.show("\033[33mGold: {}\033[0m", self.hero.coins)
+        
+        self.renderer.show("\n\033[37;1mWeapons:\033[0m")
         if weapons:
             for i, weapon in enumerate(weapons):
                 equipped = "(Equipped)" if weapon == self.hero.weapon else ""
-                print(f"{i+1}. \033[{weapon.color}m{weapon.name}\033[0m - Damage: {weapon.damage_range[0]}-{weapon.damage_range[1]} {equipped}")
+                self.renderer.show("{}. \033[{}m{}\033[0m{} - Damage: {}-{} {}", i+1, weapon.color, weapon.name, inventory.label(weapon), weapon.damage_range[0], weapon.damage_range[1], equipped)
         else:
-            print("None")
+            self.renderer.show("None")
         
-        print("\n\033[37;1mEquipment:\033[0m")
+        self.renderer.show("\n\033[37;1mEquipment:\033[0m")
         if equipment:
             for i, item in enumerate(equipment):
-                print(f"{i+1}. \033[{item.color}m{item.name}\033[0m")
+                self.renderer.show("{}. \033[{}m{}\033[0m{}", i+1, item.color, item.name, inventory.label(item))
         else:
-            print("None")
+            self.renderer.show("None")
         
-        print("\n\033[37;1mConsumables:\033[0m")
+        self.renderer.show("\n\033[37;1mConsumables:\033[0m")
         if consumables:
             for i, item in enumerate(consumables):
-                print(f"{i+1}. \033[{item.color}m{item.name}\033[0m")
+                self.renderer.show("{}. \033[{}m{}\033[0m{}", i+1, item.color, item.name, inventory.label(item))
         else:
-            print("None")
+            self.renderer.show("None")
         
         if other_items:
-            print("\n\033[37;1mOther Items:\033[0m")
+            self.renderer.show("\n\033[37;1mOther Items:\033[0m")
             for i, item in enumerate(other_items):
-                print(f"{i+1}. \033[{item.color}m{item.name}\033[0m")
+                self.renderer.show("{}. \033[{}m{}\033[0m{}", i+1, item.color, item.name, inventory.label(item))
         
         # Inventory actions
-        print("\n\033[37;1mActions:\033[0m")
-        print("1. Change Weapon")
-        print("2. Use Consumable")
-        print("3. Return to Main Menu")
+        self.renderer.show("\n\033[37;1mActions:\033[0m")
+        self.renderer.show("1. Change Weapon")
+        self.renderer.show("2. Use Consumable")
+        self.renderer.show("3. Return to Main Menu")
         
-        choice = input("Enter your choice: ")
+        choice = self.ask("Enter your choice: ")
         
         if choice == "1" and weapons:
             self.change_weapon(weapons)
         elif choice == "2" and consumables:
             self.use_consumable(consumables)
         
-        input("\nPress Enter to continue...")
+        self.ask("\nPress Enter to continue...")
     
     def change_weapon(self, weapons):
         """Allow the player to change weapons"""
-        print("\nSelect a weapon to equip:")
+        self.renderer.show("\nSelect a weapon to equip:")
         for i, weapon in enumerate(weapons):
             equipped = "(Equipped)" if weapon == self.hero.weapon else ""
-            print(f"{i+1}. {weapon.name} {equipped}")
+            self.renderer.show("{}. {} {}", i+1, weapon.name, equipped)
         
-        choice = input("Enter the number of the weapon to equip (or 0 to cancel): ")
+        choice = self.ask("Enter the number of the weapon to equip (or 0 to cancel): ")
         if choice.isdigit():
             choice = int(choice)
             if 1 <= choice <= len(weapons):
@@ -539,11 +736,11 @@ class Game:
     
     def use_consumable(self, consumables):
         """Allow the player to use a consumable item"""
-        print("\nSelect a consumable to use:")
+        self.renderer.show("\nSelect a consumable to use:")
         for i, item in enumerate(consumables):
-            print(f"{i+1}. {item.name}")
+            self.renderer.show("{}. {}{}", i+1, item.name, self.hero.inventory.label(item))
         
-        choice = input("Enter the number of the item to use (or 0 to cancel): ")
+        choice = self.ask("Enter the number of the item to use (or 0 to cancel): ")
         if choice.isdigit():
             choice = int(choice)
             if 1 <= choice <= len(consumables):
@@ -554,76 +751,88 @@ class Game:
     def victory(self):
         """Display victory message when game is completed"""
         self.clear_screen()
-        print("\n" + "*"*50)
-        print("\033[33;1mCONGRATULATIONS!\033[0m")
-        print("\033[36;1mYou have defeated the Dungeon Master and completed the game!\033[0m")
-        print("The artifact's power is now yours. You can feel its energy coursing through your veins.")
-        print("With newfound strength, you make your way out of the dungeon and into the light.")
-        print("\033[32;1mTHE END\033[0m")
-        print("*"*50)
+        self.renderer.show("\n" + "*"*50)
+        self.renderer.show("\033[33;1mCONGRATULATIONS!\033[0m")
+        self.renderer.show("\033[36;1mYou have defeated the Dungeon Master and completed the game!\033[0m")
+        self.renderer.show("The artifact's power is now yours. You can feel its energy coursing through your veins.")
+        self.renderer.show("With newfound strength, you make your way out of the dungeon and into the light.")
+        self.renderer.show("\033[32;1mTHE END\033[0m")
+        self.renderer.show("*"*50)
         
         # Display final stats
-        print(f"\n\033[37;1mFinal Stats:\033[0m")
-        print(f"Level: {self.hero.level}")
-        print(f"Gold collected: {self.hero.coins}")
-        print(f"Strength: {self.hero.get_total_strength()}")
-        print(f"Defense: {self.hero.get_total_defense()}")
-        print(f"Speed: {self.hero.get_total_speed()}")
-        
-        input("\nPress Enter to exit...")
-        exit()
+        self.renderer.show("\n\033[37;1mFinal Stats:\033[0m")
+        self.renderer.show("Level: {}", self.hero.level)
+        self.renderer.show("Gold collected: {}", self.hero.coins)
+        self.renderer.show("Strength: {}", self.hero.get_total_strength())
+        self.renderer.show("Defense: {}", self.hero.get_total_defense())
+        self.renderer.show("Speed: {}", self.hero.get_total_speed())
+        
+        self.ask("\nPress Enter to exit...")
+        raise GameEnded("You have defeated the Dungeon Master and completed the game!", "victory")
+    
+    def save_game(self):
+        """Save the game so it can be continued later"""
+        self.save_file.save(self)
+        self.renderer.show("\033[32mGame saved.\033[0m")
+        self.pause(1)
+    
+    def load_game(self):
+        """Continue from the save file"""
+        self.save_file.load(self)
     
     def quit_game(self):
         """Quit the game"""
         self.clear_screen()
-        print("Are you sure you want to quit? Your progress will be lost.")
-        choice = input("(y/n): ")
+        self.renderer.show("Are you sure you want to quit? Unsaved progress will be lost.")
+        choice = self.ask("(y/n): ")
         if choice.lower() == 'y':
-            self.game_over("You have quit the game. Thanks for playing!")
+            self.game_over("You have quit the game. Thanks for playing!", "quit")
     
     def select_weapon(self):
         """Allow the player to select a starting weapon"""
-        starting_weapons = [fists, iron_sword, short_bow]
+        starting_weapons = [self.own_weapons[weapon] for weapon in (fists, iron_sword, short_bow)]
         
         self.clear_screen()
-        print("\n" + "="*50)
-        print("\033[36;1mWelcome to the Dungeon!\033[0m")
-        print("Before you begin your adventure, choose your weapon:")
-        print("="*50)
+        self.renderer.show("\n" + "="*50)
+        self.renderer.show("\033[36;1mWelcome to the Dungeon!\033[0m")
+        self.renderer.show("Before you begin your adventure, choose your weapon:")
+        self.renderer.show("="*50)
         
         for i, weapon in enumerate(starting_weapons):
-            print(f"{i+1}. \033[{weapon.color}m{weapon.name}\033[0m (Damage: {weapon.damage_range[0]}-{weapon.damage_range[1]})")
+            self.renderer.show("{}. \033[{}m{}\033[0m (Damage: {}-{})", i+1, weapon.color, weapon.name, weapon.damage_range[0], weapon.damage_range[1])
         
         while True:
-            choice = input("Enter your choice (1-3): ")
+            choice = self.ask("Enter your choice (1-3): ")
             if choice.isdigit() and 1 <= int(choice) <= len(starting_weapons):
                 self.hero.equip(starting_weapons[int(choice)-1])
                 break
             else:
-                print("Invalid choice. Please try again.")
+                self.renderer.show("Invalid choice. Please try again.")
         
         # Start the story
         self.advance_story()
     
-    def main_menu(self):
+    def main_menu(self, new_game=True):
         """Display the main menu"""
-        # First select a weapon
-        self.select_weapon()
+        # First select a weapon (a loaded game already has one)
+        if new_game:
+            self.select_weapon()
         
         while not self.game_completed:
             self.clear_screen()
-            print("\n" + "="*50)
-            print(f"\033[36;1mMAIN MENU\033[0m")
-            print(f"Zone: {self.current_zone}/{self.max_zones} | Level: {self.hero.level} | Gold: {self.hero.coins}")
-            print("="*50)
+            self.renderer.show("\n" + "="*50)
+            self.renderer.show("\033[36;1mMAIN MENU\033[0m")
+            self.renderer.show("Zone: {}/{} | Level: {} | Gold: {}", self.current_zone, self.max_zones, self.hero.level, self.hero.coins)
+            self.renderer.show("="*50)
             
-            print("\n1. Explore")
-            print("2. View Inventory")
-            print("3. Visit Shop")
-            print("4. Rest (Restore Health)")
-            print("5. Quit Game")
+            self.renderer.show("\n1. Explore")
+            self.renderer.show("2. View Inventory")
+            self.renderer.show("3. Visit Shop")
+            self.renderer.show("4. Rest (Restore Health)")
+            self.renderer.show("5. Save Game")
+            self.renderer.show("6. Quit Game")
             
-            choice = input("\nEnter your choice: ")
+            choice = self.ask("\nEnter your choice: ")
             
             if choice == "1":
                 self.explore()
@@ -634,10 +843,12 @@ class Game:
             elif choice == "4":
                 self.rest()
             elif choice == "5":
+                self.save_game()
+            elif choice == "6":
                 self.quit_game()
             else:
-                print("Invalid choice. Please try again.")
-                time.sleep(1)
+                self.renderer.show("Invalid choice. Please try again.")
+                self.pause(1)
     
     def rest(self):
         """Allow the hero to rest and restore health"""
@@ -645,28 +856,29 @@ class Game:
         
         # Check if hero is already at full health
         if self.hero.health >= self.hero.health_max:
-            print("You are already at full health!")
-            time.sleep(2)
+            self.renderer.show("You are already at full health!")
+            self.pause(2)
             return
         
         # Rest costs gold based on how much health is missing
         missing_health = self.hero.health_max - self.hero.health
         cost = max(5, missing_health // 2)
         
-        print(f"Resting will restore you to full health for {cost} gold.")
-        choice = input("Do you want to rest? (y/n): ")
+        self.renderer.show("Resting will restore you to full health for {} gold.", cost)
+        choice = self.ask("Do you want to rest? (y/n): ")
         
         if choice.lower() == 'y':
             if self.hero.coins >= cost:
                 self.hero.coins -= cost
                 self.hero.health = self.hero.health_max
                 self.hero.health_bar.update()
-                print(f"\033[32mYou rest and recover to full health!\033[0m")
+                self.renderer.show("\033[32mYou rest and recover to full health!\033[0m")
                 
                 # Clear status effects
-                self.hero.status_effects = {}
-                print("All status effects have been cleared.")
+                self.hero.status_effects.clear()
+                self.hero.stats_changed()
+                self.renderer.show("All status effects have been cleared.")
             else:
-                print("You don't have enough gold to rest.")
+                self.renderer.show("You don't have enough gold to rest.")
         
-        time.sleep(2)
+        self.pause(2)
@@ -1,5 +1,6 @@
 # ------------ imports ------------
 import os
+from functools import lru_cache
 
 # ------------ setup ------------
 os.system("")
@@ -30,6 +31,16 @@ class HealthBar:
                     "bold_cyan": "\033[96;1m",
                     "bold_white": "\033[97;1m"
                     }
+    
+    # Status effect indicators
+    status_symbols: dict = {
+        "poison": "☠",
+        "burn": "🔥",
+        "freeze": "❄"
+    }
+
+    __slots__ = ("entity", "length", "max_value", "current_value",
+                 "is_colored", "color", "previous_value", "animation_frames", "phase_markers")
 
     def __init__(self,
                  entity,
@@ -48,12 +59,22 @@ class HealthBar:
         self.previous_value = self.current_value
         self.animation_frames = 0
         
-        # Status effect indicators
-        self.status_symbols = {
-            "poison": "☠",
-            "burn": "🔥",
-            "freeze": "❄"
-        }
+        # Boss phase marker line, built on the first boss draw
+        self.phase_markers = None
+
+    def clone(self, entity):
+        """Copy this bar for a copy of its entity"""
+        clone = HealthBar.__new__(HealthBar)
+        clone.entity = entity
+        clone.length = self.length
+        clone.max_value = self.max_value
+        clone.current_value = self.current_value
+        clone.is_colored = self.is_colored
+        clone.color = self.color
+        clone.previous_value = self.previous_value
+        clone.animation_frames = self.animation_frames
+        clone.phase_markers = self.phase_markers
+        return clone
 
     def update(self) -> None:
         self.previous_value = self.current_value
@@ -61,76 +82,116 @@ class HealthBar:
         self.animation_frames = 5  # Show animation for 5 frames
 
     def draw(self) -> None:
-        # Calculate health bar segments
-        remaining_bars = round(self.current_value / self.max_value * self.length)
-        lost_bars = self.length - remaining_bars
+        entity = self.entity
+        renderer = entity.renderer
         
-        # Determine health color based on percentage
-        health_percent = self.current_value / self.max_value
-        bar_color = self.color
-        
-        if health_percent <= 0.25:
-            bar_color = self.colors["red"]
-        elif health_percent <= 0.5:
-            bar_color = self.colors["yellow"]
-        
-        # Show damage animation if health decreased recently
-        damage_indicator = ""
+        # Damage animation if health changed recently
+        delta = 0
         if self.animation_frames > 0:
-            if self.current_value < self.previous_value:
-                damage = self.previous_value - self.current_value
-                damage_indicator = f" \033[91m(-{damage})\033[0m"
-            elif self.current_value > self.previous_value:
-                heal = self.current_value - self.previous_value
-                damage_indicator = f" \033[92m(+{heal})\033[0m"
+            delta = self.current_value - self.previous_value
             self.animation_frames -= 1
         
-        # Add status effect indicators
-        status_indicators = ""
-        if hasattr(self.entity, 'status_effects'):
-            for status, data in self.entity.status_effects.items():
-                if status in self.status_symbols:
-                    status_color = "31" if status == "burn" else "32" if status == "poison" else "36"  # Red for burn, green for poison, cyan for freeze
-                    status_indicators += f" \033[{status_color}m{self.status_symbols[status]}\033[0m"
-        
-        # Add level indicator if entity has level
-        level_indicator = ""
-        if hasattr(self.entity, 'level'):
-            level_indicator = f" [Lvl {self.entity.level}]"
+        if not renderer.active:
+            return
         
-        # Print the health bar
-        print(f"{self.entity.name}{level_indicator}'s HEALTH: {self.entity.health}/{self.entity.health_max}{damage_indicator}{status_indicators}")
-        print(f"{self.barrier}"
-              f"{bar_color if self.is_colored else ''}"
-              f"{remaining_bars * self.symbol_remaining}"
-              f"{lost_bars * self.symbol_lost}"
-              f"{self.colors['default'] if self.is_colored else ''}"
-              f"{self.barrier}")
+        level = entity.level if hasattr(entity, 'level') else None
+        statuses = tuple(entity.status_effects) if hasattr(entity, 'status_effects') else ()
+        header, body = _bar_lines(entity.name, level, entity.health, entity.health_max,
+                                  self.current_value, self.max_value, self.length,
+                                  self.color, self.is_colored, statuses, delta)
+        renderer.show(header)
+        renderer.show(body)
         
     def draw_boss_health(self) -> None:
         """Special health bar display for boss enemies"""
         if not hasattr(self.entity, 'phase'):
             self.draw()
             return
-            
-        # Calculate health bar segments
-        remaining_bars = round(self.current_value / self.max_value * self.length)
-        lost_bars = self.length - remaining_bars
+        
+        renderer = self.entity.renderer
+        if not renderer.active:
+            return
         
         # Boss health bars have phase indicators
-        phase_markers = ""
-        for threshold in self.entity.phase_thresholds:
-            marker_position = round((1 - threshold) * self.length)
-            phase_markers += f"\033[33m|\033[0m" + " " * (marker_position - 1)
+        if self.phase_markers is None:
+            self.phase_markers = _phase_marker_line(tuple(self.entity.phase_thresholds), self.length)
         
         # Print boss header
-        print(f"\033[95;1m==== BOSS: {self.entity.name} [Phase {self.entity.phase}] ====\033[0m")
-        print(f"HEALTH: {self.entity.health}/{self.entity.health_max}")
+        renderer.show("\033[95;1m==== BOSS: {} [Phase {}] ====\033[0m", self.entity.name, self.entity.phase)
+        renderer.show("HEALTH: {}/{}", self.entity.health, self.entity.health_max)
         
         # Print the health bar
-        print(f"{self.barrier}"
-              f"{self.color if self.is_colored else ''}"
-              f"{remaining_bars * self.symbol_remaining}"
-              f"{lost_bars * self.symbol_lost}"
-              f"{self.colors['default'] if self.is_colored else ''}"
-              f"{self.barrier}")
+        remaining_bars = round(self.current_value / self.max_value * self.length)
+        renderer.show(_bar_body(self.color, self.length, self.is_colored, remaining_bars))
+
+
+# ------------ cached drawing ------------
+def _build_bar_body(color: str, length: int, is_colored: bool, remaining: int) -> str:
+    return (f"{HealthBar.barrier}"
+            f"{color if is_colored else ''}"
+            f"{remaining * HealthBar.symbol_remaining}"
+            f"{(length - remaining) * HealthBar.symbol_lost}"
+            f"{HealthBar.colors['default'] if is_colored else ''}"
+            f"{HealthBar.barrier}")
+
+
+@lru_cache(maxsize=None)
+def _bar_bodies(color: str, length: int, is_colored: bool) -> tuple:
+    """All length + 1 bar bodies for one color, indexed by filled segments"""
+    return tuple(_build_bar_body(color, length, is_colored, remaining) for remaining in range(length + 1))
+
+
+def _bar_body(color: str, length: int, is_colored: bool, remaining: int) -> str:
+    if 0 <= remaining <= length:
+        return _bar_bodies(color, length, is_colored)[remaining]
+    # Health above the bar's maximum (e.g. right after a level up) overflows the bar
+    return _build_bar_body(color, length, is_colored, remaining)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _indicators(statuses: tuple, delta: int) -> str:
+    """Damage/heal animation and status effect suffix of a health line"""
+    indicators = ""
+    if delta < 0:
+        indicators = f" \033[91m(-{-delta})\033[0m"
+    elif delta > 0:
+        indicators = f" \033[92m(+{delta})\033[0m"
+    for status in statuses:
+        if status in HealthBar.status_symbols:
+            status_color = "31" if status == "burn" else "32" if status == "poison" else "36"  # Red for burn, green for poison, cyan for freeze
+            indicators += f" \033[{status_color}m{HealthBar.status_symbols[status]}\033[0m"
+    return indicators
+
+
+# typed=True keeps float health (from 1.5x ability damage) printing as it always has
+@lru_cache(maxsize=4096, typed=True)
+def _bar_lines(name: str, level, health: int, health_max: int,
+               current_value: int, max_value: int, length: int,
+               color: str, is_colored: bool, statuses: tuple, delta: int) -> tuple:
+    """The two lines of a health bar; redrawing an unchanged bar is a cache hit"""
+    # Calculate health bar segments
+    remaining_bars = round(current_value / max_value * length)
+    
+    # Determine health color based on percentage
+    health_percent = current_value / max_value
+    bar_color = color
+    if health_percent <= 0.25:
+        bar_color = HealthBar.colors["red"]
+    elif health_percent <= 0.5:
+        bar_color = HealthBar.colors["yellow"]
+    
+    # Add level indicator if entity has level
+    level_indicator = f" [Lvl {level}]" if level is not None else ""
+    
+    header = f"{name}{level_indicator}'s HEALTH: {health}/{health_max}{_indicators(statuses, delta)}"
+    return header, _bar_body(bar_color, length, is_colored, remaining_bars)
+
+
+@lru_cache(maxsize=64)
+def _phase_marker_line(phase_thresholds: tuple, length: int) -> str:
+    """Phase threshold markers laid out under a boss health bar"""
+    phase_markers = ""
+    for threshold in phase_thresholds:
+        marker_position = round((1 - threshold) * length)
+        phase_markers += f"\033[33m|\033[0m" + " " * (marker_position - 1)
+    return phase_markers
@@ -0,0 +1,137 @@
+# ------------ imports ------------
+from collections import deque
+
+
+# ------------ class setup ------------
+class Initiative:
+    """Speed-based turn order on a tick timeline
+
+    Every combatant is due at a tick; after acting it is due again
+    tempo // (speed + speed_offset) ticks later, with speed read from the
+    cached stat totals at that moment, so haste, buffs and freeze's slow
+    change how often it acts from its next action on. The hero starts at
+    tick 0 and enemies one delay later, so a battle opens with the hero's
+    action and equal speeds alternate like the old fixed turn order (ties
+    go to whoever was scheduled first).
+
+    Ticks are small integers and a delay is at most tempo // speed_offset
+    ticks, so the timeline is a bucket queue: each tick holds a FIFO of the
+    combatants due then, in the order they were scheduled. Scheduling and
+    taking the next action are O(1) without any comparisons. Deletion is
+    lazy: an entry whose combatant was rescheduled or defeated is dropped
+    when its tick comes up.
+    """
+    tempo = 1000
+    speed_offset = 20
+
+    __slots__ = ("now", "due", "buckets", "head")
+
+    def __init__(self, hero=None, enemies=()) -> None:
+        self.now = 0
+        self.due = {}      # combatant -> tick of its next action
+        self.buckets = {}  # tick -> deque of combatants scheduled for it
+        self.head = 0      # No bucket before this tick holds a live entry
+        if hero is not None:
+            self._schedule(hero, 0)
+        for enemy in enemies:
+            self.add(enemy)
+
+    def delay(self, character) -> int:
+        """Ticks between two actions of a combatant at its current speed"""
+        return max(1, self.tempo // (character.stats()[2] + self.speed_offset))
+
+    def _schedule(self, character, tick: int) -> None:
+        self.due[character] = tick
+        bucket = self.buckets.get(tick)
+        if bucket is None:
+            self.buckets[tick] = deque((character,))
+        else:
+            bucket.append(character)
+        if tick < self.head:
+            self.head = tick
+
+    def add(self, character) -> None:
+        """Bring a combatant in (a summoned minion acts one delay from now)"""
+        self._schedule(character, self.now + self.delay(character))
+
+    def next_actor(self):
+        """The combatant due next, without taking its action"""
+        buckets = self.buckets
+        due = self.due
+        tick = self.head
+        while buckets:
+            bucket = buckets.get(tick)
+            if bucket is not None:
+                while bucket:
+                    character = bucket[0]
+                    if due.get(character) == tick:
+                        if character.health > 0:
+                            self.head = tick
+                            return character
+                        del due[character]
+                    bucket.popleft()
+                del buckets[tick]
+            tick += 1
+        self.head = tick
+        return None
+
+    def act(self, character) -> None:
+        """Advance the timeline to a combatant's action and schedule its next one"""
+        tick = self.due.get(character, self.now)
+        if tick > self.now:
+            self.now = tick
+        bucket = self.buckets.get(tick)
+        if bucket and bucket[0] is character:
+            bucket.popleft()  # The usual case: the combatant due next acts
+        self._schedule(character, tick + max(1, self.tempo // (character.stats()[2] + self.speed_offset)))
+
+    def act_next(self, stop):
+        """next_actor() and act() in one step: take the next action unless stop is due
+
+        Returns the combatant that acted, or None when stop (the hero) is
+        due next or nobody is left. This is the loop of an enemy turn.
+        """
+        buckets = self.buckets
+        due = self.due
+        tick = self.head
+        bucket = buckets.get(tick)
+        if bucket:
+            character = bucket[0]
+            if due.get(character) != tick or character.health <= 0:
+                character = None
+        else:
+            character = None
+        if character is None:
+            # Stale or defeated entries first, or the head bucket ran out
+            character = self.next_actor()
+            if character is None:
+                return None
+            tick = self.head
+            bucket = buckets[tick]
+        if character is stop:
+            return None
+        if tick > self.now:
+            self.now = tick
+        bucket.popleft()
+        tick += max(1, self.tempo // (character.stats()[2] + self.speed_offset))
+        due[character] = tick
+        bucket = buckets.get(tick)
+        if bucket is None:
+            buckets[tick] = deque((character,))
+        else:
+            bucket.append(character)
+        return character
+
+    def clone(self, copies: dict):
+        """Copy the timeline for copied combatants ({original: copy})"""
+        clone = Initiative()
+        clone.now = self.now
+        clone.head = self.head
+        due = self.due
+        clone.due = {copies[character]: tick for character, tick in due.items() if character in copies}
+        for tick, bucket in self.buckets.items():
+            live = deque(copies[character] for character in bucket
+                         if character in copies and due.get(character) == tick)
+            if live:
+                clone.buckets[tick] = live
+        return clone
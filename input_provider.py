@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""
+Input providers and recorded sessions
+
+Every decision in a game goes through Game.ask, which calls the game's
+input_func with the prompt. An input provider is such a callable: a
+policy answering prompts (PolicyInput), a recorded session being replayed
+(ReplayInput), or any provider wrapped to record what it answers
+(RecordingInput). A replay runs headless on a virtual clock at full CPU
+speed and, with the seed stored in the session file, shows exactly the
+same output as the session it was recorded from.
+"""
+
+# ------------ imports ------------
+import argparse
+import json
+import os
+import sys
+import tempfile
+from game import Game, GameEnded, console_input
+from renderer import BufferedRenderer
+from save_file import capture_state, restore_state
+
+
+# ------------ session file format ------------
+# JSON lines: a header with the seed (and the loaded save state when the
+# session continued a saved game), then one {"prompt", "answer"} per input.
+session_format = "cursed-skeleton-session"
+session_version = 1
+
+
+class ReplayMismatch(Exception):
+    """A replayed game asked something other than the recorded session did"""
+
+
+# ------------ providers ------------
+class InputProvider:
+    """Answers the game's prompts: called with the prompt, returns the line the player typed"""
+    def __call__(self, prompt: str = "") -> str:
+        raise NotImplementedError
+
+
+class PolicyInput(InputProvider):
+    """Answers with a policy(game, prompt) callable and enforces a step limit"""
+    def __init__(self, game, policy, max_steps=None) -> None:
+        self.game = game
+        self.policy = policy
+        self.max_steps = max_steps
+        self.steps = 0
+
+    def __call__(self, prompt: str = "") -> str:
+        self.steps += 1
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise GameEnded("Step limit reached", "step_limit")
+        return self.policy(self.game, prompt)
+
+
+class ReplayInput(InputProvider):
+    """Answers with the inputs of a recorded session, in order
+
+    Every prompt is checked against the recorded one, so a replay that
+    drifts from its recording (a rules change, a different seed) stops at
+    the first differing prompt with ReplayMismatch. When the recorded
+    inputs run out, the game ends with outcome "replay_end".
+    """
+    def __init__(self, inputs, check_prompts: bool = True) -> None:
+        self.inputs = inputs  # [{"prompt": ..., "answer": ...}]
+        self.check_prompts = check_prompts
+        self.steps = 0
+
+    def __call__(self, prompt: str = "") -> str:
+        if self.steps >= len(self.inputs):
+            raise GameEnded("The recorded session ended.", "replay_end")
+        recorded = self.inputs[self.steps]
+        self.steps += 1
+        if self.check_prompts and recorded["prompt"] != prompt:
+            raise ReplayMismatch(f"Input {self.steps} was asked {prompt!r}, "
+                                 f"the recording was asked {recorded['prompt']!r}")
+        return recorded["answer"]
+
+
+class RecordingInput(InputProvider):
+    """Passes prompts to another provider and writes every answer to a session file
+
+    Create it once the game is ready to play (after loading a save, if
+    any), as the header captures the game's seed and loaded state. Each
+    input is written and flushed as it is answered, so a session that
+    crashes is still replayable up to that point.
+    """
+    def __init__(self, path: str, game, source=console_input, new_game: bool = True) -> None:
+        self.source = source
+        self.file = open(path, "w", encoding="utf-8")
+        header = {"format": session_format, "version": session_version,
+                  "seed": game.rng.initial_seed, "new_game": new_game,
+                  "state": None if new_game else capture_state(game)}
+        self._write(header)
+
+    def _write(self, entry: dict) -> None:
+        self.file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.file.flush()
+
+    def __call__(self, prompt: str = "") -> str:
+        answer = self.source(prompt)
+        self._write({"prompt": prompt, "answer": answer})
+        return answer
+
+    def close(self) -> None:
+        self.file.close()
+
+
+# ------------ sessions ------------
+def read_session(path: str):
+    """Return the header and the recorded inputs of a session file"""
+    with open(path, encoding="utf-8") as session:
+        header = json.loads(session.readline())
+        if header.get("format") != session_format:
+            raise ValueError(f"{path} is not a session file")
+        if header.get("version") != session_version:
+            raise ValueError(f"Unsupported session version {header.get('version')} in {path}")
+        inputs = [json.loads(line) for line in session if line.strip()]
+    return header, inputs
+
+
+def play_session(make_input, seed=None, renderer=None, state=None, save_path=None):
+    """Play one headless game from its start, or from a captured state, to its end
+
+    make_input(game) returns the game's input provider. Returns the game
+    and how it ended ("victory", "defeat", "quit", ...). Saves made during
+    the game go to save_path, or to a temporary directory that is removed
+    afterwards.
+    """
+    with tempfile.TemporaryDirectory() as save_dir:
+        game = Game(headless=True, seed=seed, renderer=renderer,
+                    save_path=save_path or os.path.join(save_dir, "session.sav"))
+        if state is not None:
+            restore_state(game, state)
+        game.input_func = make_input(game)
+        try:
+            game.main_menu(state is None)
+            outcome = "victory"
+        except GameEnded as ended:
+            outcome = ended.outcome
+    return game, outcome
+
+
+def replay_session(path: str, renderer=None, check_prompts: bool = True):
+    """Replay a recorded session file; returns the game and how it ended"""
+    header, inputs = read_session(path)
+    return play_session(lambda game: ReplayInput(inputs, check_prompts), header["seed"], renderer, header["state"])
+
+
+def main():
+    """Command line entry point: record a policy-played session or replay one"""
+    parser = argparse.ArgumentParser(description="Record or replay game sessions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="play a seeded game with the runner's policy and record it")
+    record.add_argument("session")
+    record.add_argument("--seed", type=int, default=0)
+    record.add_argument("--max-steps", type=int, default=20000)
+    replay = commands.add_parser("replay", help="replay a recorded session")
+    replay.add_argument("session")
+    replay.add_argument("--transcript", default=None, help="write everything the game shows to this file")
+    replay.add_argument("--no-check", action="store_true", help="do not stop when prompts differ")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        from runner import explorer_policy  # runner imports this module
+
+        def record(game):
+            return RecordingInput(args.session, game, PolicyInput(game, explorer_policy, args.max_steps))
+
+        game, outcome = play_session(record, args.seed)
+        game.input_func.close()
+        print(f"{outcome}: {game.input_func.source.steps} inputs recorded to {args.session}", file=sys.stderr)
+        return
+
+    transcript = open(args.transcript, "w", encoding="utf-8", newline="") if args.transcript else None
+    try:
+        renderer = BufferedRenderer(transcript) if transcript else None
+        game, outcome = replay_session(args.session, renderer, not args.no_check)
+        if renderer:
+            renderer.flush()
+    finally:
+        if transcript:
+            transcript.close()
+    print(f"{outcome}: zone {game.current_zone}, level {game.hero.level}, {game.hero.coins} gold", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
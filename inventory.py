@@ -0,0 +1,113 @@
+# ------------ imports ------------
+from weapon import Weapon
+
+
+# ------------ class setup ------------
+class Inventory:
+    """The hero's items, kept in per-kind buckets of stacks
+
+    Each bucket (weapons, equipment, consumables, other) is an insertion
+    ordered dict from stack key to [item, count], so adding and removing an
+    item are O(1) and listing a bucket never looks at the other kinds.
+    Items are interned prototypes and stack by prototype id; weapons carry
+    their own damage boost and stack only with themselves. Iterating
+    yields every item as many times as it is held, in bucket order.
+    """
+    __slots__ = ("weapons", "equipment", "consumables", "other", "size")
+
+    def __init__(self, items=()) -> None:
+        self.weapons = {}
+        self.equipment = {}
+        self.consumables = {}
+        self.other = {}
+        self.size = 0
+        for item in items:
+            self.add(item)
+
+    @staticmethod
+    def key(item):
+        """Stack key of an item"""
+        if isinstance(item, Weapon):
+            return item
+        return item.id
+
+    def bucket(self, item) -> dict:
+        """The bucket an item belongs in"""
+        if isinstance(item, Weapon):
+            return self.weapons
+        if item.item_type == "consumable":
+            return self.consumables
+        if item.item_type in ("armor", "accessory"):
+            return self.equipment
+        return self.other
+
+    def add(self, item, count: int = 1) -> None:
+        stacks = self.bucket(item)
+        key = self.key(item)
+        stack = stacks.get(key)
+        if stack is None:
+            stacks[key] = [item, count]
+        else:
+            stack[1] += count
+        self.size += count
+
+    def remove(self, item) -> None:
+        """Take one of an item out (ValueError if none is held, like list.remove)"""
+        stacks = self.bucket(item)
+        key = self.key(item)
+        stack = stacks.get(key)
+        if stack is None:
+            raise ValueError(f"{item.name} is not in the inventory")
+        stack[1] -= 1
+        if stack[1] == 0:
+            del stacks[key]
+        self.size -= 1
+
+    def count(self, item) -> int:
+        """How many of an item (or items stacking with it) are held"""
+        stack = self.bucket(item).get(self.key(item))
+        return stack[1] if stack else 0
+
+    def clear(self) -> None:
+        for stacks in (self.weapons, self.equipment, self.consumables, self.other):
+            stacks.clear()
+        self.size = 0
+
+    def copy(self):
+        clone = Inventory.__new__(Inventory)
+        clone.weapons = {key: list(stack) for key, stack in self.weapons.items()}
+        clone.equipment = {key: list(stack) for key, stack in self.equipment.items()}
+        clone.consumables = {key: list(stack) for key, stack in self.consumables.items()}
+        clone.other = {key: list(stack) for key, stack in self.other.items()}
+        clone.size = self.size
+        return clone
+
+    # ------------ listing ------------
+    def stacks(self):
+        """Every (item, count) stack, in bucket order"""
+        for stacks in (self.weapons, self.equipment, self.consumables, self.other):
+            for item, count in stacks.values():
+                yield item, count
+
+    def items(self, bucket: dict) -> list:
+        """The distinct items of a bucket (one per stack), in the order they were first added"""
+        return [stack[0] for stack in bucket.values()]
+
+    def label(self, item) -> str:
+        """Count suffix for listings (" x3"), empty for a single item"""
+        count = self.count(item)
+        return f" x{count}" if count > 1 else ""
+
+    def __iter__(self):
+        for item, count in list(self.stacks()):
+            for _ in range(count):
+                yield item
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, item) -> bool:
+        return self.key(item) in self.bucket(item)
+
+    def __repr__(self) -> str:
+        return f"Inventory({self.size} items)"
@@ -1,10 +1,41 @@
+from itertools import count
+
 # Item class for different types of items
 class Item:
-    def __init__(self, name: str, item_type: str, value: int, color: str):
-        self.name = name
-        self.item_type = item_type
-        self.value = value
-        self.color = color
+    """Immutable, interned item prototype
+
+    Item(name, item_type, value, color) returns the one shared prototype
+    for those fields, creating it the first time, so a drop allocates
+    nothing and inventories hold (prototype id, quantity) stacks.
+    """
+    __slots__ = ("name", "item_type", "value", "color", "id")
+    
+    prototypes = {}  # (name, item_type, value, color) -> prototype
+    _ids = count()
+    
+    def __new__(cls, name: str, item_type: str, value: int, color: str):
+        key = (name, item_type, value, color)
+        item = cls.prototypes.get(key)
+        if item is None:
+            item = object.__new__(cls)
+            for attribute, field in zip(cls.__slots__, key + (next(cls._ids),)):
+                object.__setattr__(item, attribute, field)
+            # setdefault keeps one prototype if two threads create it at once
+            item = cls.prototypes.setdefault(key, item)
+        return item
+    
+    def __setattr__(self, attribute, value):
+        raise AttributeError(f"Item prototypes are immutable (tried to set {attribute} of {self.name})")
+    
+    def __delattr__(self, attribute):
+        raise AttributeError(f"Item prototypes are immutable (tried to delete {attribute} of {self.name})")
+    
+    def __reduce__(self):
+        # Unpickling interns again, so copies in other processes stay shared
+        return (Item, (self.name, self.item_type, self.value, self.color))
+    
+    def __repr__(self):
+        return f"Item({self.name!r}, {self.item_type!r}, {self.value!r}, {self.color!r})"
         
     def use(self, character):
         """Use the item on a character"""
@@ -12,27 +43,30 @@ class Item:
             if "Health Potion" in self.name:
                 heal_amount = 30
                 character.health = min(character.health + heal_amount, character.health_max)
-                print(f"\033[32mYou used {self.name} and recovered {heal_amount} health!\033[0m")
+                character.renderer.show("\033[32mYou used {} and recovered {} health!\033[0m", self.name, heal_amount)
                 return True
             elif "Strength Potion" in self.name:
                 if hasattr(character, 'weapon') and character.weapon:
                     # Temporarily boost weapon damage
                     character.weapon.damage_boost = 10
-                    print(f"\033[31mYou used {self.name} and your weapon damage increased!\033[0m")
+                    character.renderer.show("\033[31mYou used {} and your weapon damage increased!\033[0m", self.name)
                     return True
         elif self.item_type == "buff":
             if "Strength Up" in self.name:
                 character.strength_bonus = 5
-                print(f"\033[32mYou used {self.name} and gained +5 strength!\033[0m")
+                character.stats_changed()
+                character.renderer.show("\033[32mYou used {} and gained +5 strength!\033[0m", self.name)
                 return True
             elif "Speed Up" in self.name:
                 character.speed_bonus = 5
-                print(f"\033[34mYou used {self.name} and gained +5 speed!\033[0m")
+                character.stats_changed()
+                character.renderer.show("\033[34mYou used {} and gained +5 speed!\033[0m", self.name)
                 return True
             elif "Defense Up" in self.name:
                 character.defense_bonus = 5
-                print(f"\033[33mYou used {self.name} and gained +5 defense!\033[0m")
+                character.stats_changed()
+                character.renderer.show("\033[33mYou used {} and gained +5 defense!\033[0m", self.name)
                 return True
         
-        print(f"You can't use {self.name} right now.")
+        character.renderer.show("You can't use {} right now.", self.name)
         return False
@@ -5,11 +5,22 @@ Text-Based Battle Game
 
 A dungeon crawler RPG with turn-based combat, inventory management,
 and character progression.
+
+Set GAME_PROFILE=<path> to time every battle phase and count RNG draws,
+renderer writes and damage rolls while playing; collapsed stacks for a
+flamegraph are written to <path> and flat stats to <path>.json on exit.
+Set GAME_PACE to scale the pauses between turns (0.5 halves them, 0 skips
+them), and GAME_RECORD=<path> to record the session for
+`input_provider.py replay <path>`.
 """
 
 import os
 import time
-from game import Game
+from clock import AcceleratedClock
+from game import Game, GameEnded
+from input_provider import RecordingInput
+from profiler import Profiler
+from screen import CompositedRenderer
 
 def display_intro():
     """Display the game introduction"""
@@ -32,8 +43,32 @@ def display_intro():
 def main():
     """Main entry point for the game"""
     display_intro()
-    game = Game()
-    game.main_menu()
+    pace = os.environ.get("GAME_PACE")
+    clock = AcceleratedClock(float(pace)) if pace else None
+    game = Game(renderer=CompositedRenderer(), clock=clock)
+    profile_path = os.environ.get("GAME_PROFILE")
+    profiler = Profiler().attach(game) if profile_path else None
+    new_game = True
+    if game.save_file.exists():
+        choice = input("A saved game was found. Continue it? (y/n): ")
+        if choice.lower() == 'y':
+            game.load_game()
+            new_game = False
+    record_path = os.environ.get("GAME_RECORD")
+    recorder = RecordingInput(record_path, game, game.input_func, new_game) if record_path else None
+    if recorder:
+        game.input_func = recorder
+    try:
+        game.main_menu(new_game)
+    except GameEnded:
+        pass
+    finally:
+        if recorder:
+            recorder.close()
+        if profiler:
+            profiler.detach()
+            profiler.write_collapsed(profile_path)
+            profiler.write_stats(profile_path + ".json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+
+"""
+Monte Carlo Tree Search battle player
+
+Picks the hero's action (Attack, Heroic Strike, Quick Recovery or
+Whirlwind, and a target) by playing the battle forward many times on
+silent copies of the game (Game.clone), so every rule the real battle
+uses, including enemy and boss special abilities, applies to the search.
+
+The search is open loop: tree nodes are action sequences and every
+iteration samples new dice from its own random stream. Root-parallel
+search runs independent trees in a thread or process pool and adds up
+their root statistics.
+"""
+
+# ------------ imports ------------
+import argparse
+import gc
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from combat_log import null_combat_log
+from damage_table import DamageTables, damage_tables
+from renderer import NullRenderer
+from rng import GameRNG
+from simulation import BattleSimulator, greedy_ability, run_battle, summarize
+
+
+# ------------ battle model ------------
+def legal_actions(game):
+    """Every (action, target index) the hero can choose right now"""
+    hero = game.hero
+    targets = [index for index, enemy in enumerate(game.current_enemies) if enemy.health > 0]
+    actions = [("Attack", index) for index in targets]
+    for name, data in hero.abilities.items():
+        if hero.level >= data["level"] and data["cooldown"] == 0:
+            if name == "Heroic Strike":
+                actions.extend((name, index) for index in targets)
+            else:
+                actions.append((name, None))
+    return actions
+
+
+def battle_over(game) -> bool:
+    return game.hero.health <= 0 or not any(enemy.health > 0 for enemy in game.current_enemies)
+
+
+def play_turn(game, action) -> None:
+    """Finish the current turn with a hero action and start the next one, like run_battle"""
+    name, index = action
+    target = game.current_enemies[index] if index is not None else None
+    game.hero_action(name, target)
+    if not any(enemy.health > 0 for enemy in game.current_enemies):
+        return
+    if game.enemy_turn():
+        return
+    game.start_battle_turn()
+
+
+def evaluate(game) -> float:
+    """Score a position from the hero's point of view, in [0, 1]"""
+    hero = game.hero
+    if hero.health <= 0:
+        return 0.0
+    hero_share = hero.health / hero.health_max
+    enemies = game.current_enemies
+    enemy_share = sum(enemy.health for enemy in enemies) / sum(enemy.health_max for enemy in enemies)
+    if enemy_share <= 0:
+        return 0.5 + 0.5 * hero_share  # Won: more health left is better
+    return 0.25 + 0.25 * (hero_share - enemy_share)
+
+
+def rollout_policy(game, rng):
+    """Mostly greedy play with some random moves"""
+    if rng.chance(0.2):
+        return rng.choice(legal_actions(game))
+    name = greedy_ability(game.hero, game.alive_enemies())
+    if name in ("Attack", "Heroic Strike"):
+        return name, next(index for index, enemy in enumerate(game.current_enemies) if enemy.health > 0)
+    return name, None
+
+
+def search_copy(game):
+    """A silent copy of a game that can be searched (and pickled for a process pool)"""
+    copy = game.clone(NullRenderer(), null_combat_log)
+    copy.input_func = None
+    copy.save_file = None
+    return copy
+
+
+# ------------ search ------------
+class _Node:
+    __slots__ = ("children", "visits", "value")
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.visits = 0
+        self.value = 0.0
+
+
+def search(game, time_budget: float = 0.01, iterations=None, seed=None,
+           exploration: float = 0.7, rollout_depth: int = 20, rng=None) -> dict:
+    """Run one search from a game position and return {action: (visits, total value)}
+
+    The game is never modified. The search stops after time_budget seconds
+    or after a fixed number of iterations, whichever is given (iterations
+    wins, which makes a seeded search reproducible). It draws from rng, or
+    from a new stream seeded with seed.
+    """
+    rng = rng or GameRNG(seed)
+    root = _Node()
+    deadline = time.perf_counter() + time_budget
+    done = 0
+    while True:
+        if iterations is not None:
+            if done >= iterations:
+                break
+        elif done and time.perf_counter() >= deadline:
+            break
+        done += 1
+        state = game.clone()
+        state.rng.seed(rng.getrandbits(64))
+        node = root
+        path = [node]
+
+        # Selection and expansion
+        depth = 0
+        while not battle_over(state):
+            actions = legal_actions(state)
+            untried = [action for action in actions if action not in node.children]
+            if untried:
+                action = rng.choice(untried)
+                child = node.children[action] = _Node()
+            else:
+                log_visits = math.log(node.visits or 1)
+                action, child = max(((action, node.children[action]) for action in actions),
+                                    key=lambda pair: pair[1].value / pair[1].visits
+                                    + exploration * math.sqrt(log_visits / pair[1].visits))
+            play_turn(state, action)
+            node = child
+            path.append(node)
+            depth += 1
+            if child.visits == 0:
+                break
+
+        # Rollout
+        while depth < rollout_depth and not battle_over(state):
+            play_turn(state, rollout_policy(state, rng))
+            depth += 1
+
+        # Backpropagation
+        reward = evaluate(state)
+        for node in path:
+            node.visits += 1
+            node.value += reward
+
+    return {action: (child.visits, child.value) for action, child in root.children.items()}
+
+
+# Damage table block this worker process has attached (only the newest is kept)
+_attached_tables = None
+
+
+def _search_worker(arguments):
+    global _attached_tables
+    game, time_budget, iterations, rng, tables_name = arguments
+    if tables_name is not None and (_attached_tables is None or _attached_tables.block.name != tables_name):
+        if _attached_tables is not None:
+            damage_tables.discard(_attached_tables)
+            gc.collect()  # Copies of earlier positions can still hold its tables
+            _attached_tables.close()
+        _attached_tables = DamageTables.attach(tables_name)
+        damage_tables.merge(_attached_tables)
+    return search(game, time_budget, iterations, rng=rng)
+
+
+class MCTSPlayer:
+    """Chooses battle actions with (optionally root-parallel) MCTS
+
+    With workers > 1, each decision runs that many independent searches in a
+    pool ("thread" or "process") and picks the action with the most visits
+    over all of them. Process pools avoid the GIL at the cost of pickling
+    the position once per worker; the damage tables the game has built so
+    far are handed to process workers through shared memory instead of
+    being rebuilt in every process. Call close() (or use a with block) to
+    shut the pool down.
+    """
+    def __init__(self, time_budget: float = 0.01, iterations=None, workers: int = 1,
+                 pool: str = "process", seed=None) -> None:
+        self.time_budget = time_budget
+        self.iterations = iterations
+        self.workers = workers
+        self.rng = GameRNG(seed)
+        self.executor = None
+        self.share_tables = workers > 1 and pool == "process"
+        self.shared_tables = None  # Shared memory copy of damage_tables
+        self.shared_built = 0      # damage_tables.built when it was copied
+        if workers > 1:
+            executor_class = ProcessPoolExecutor if pool == "process" else ThreadPoolExecutor
+            self.executor = executor_class(max_workers=workers)
+
+    def _tables_name(self):
+        """Name of a shared block holding the damage tables currently kept (process pools only)
+
+        The block is copied again whenever new tables were built since; the
+        ones damage_tables has evicted are left out of the new copy.
+        """
+        if not self.share_tables:
+            return None
+        if self.shared_tables is None or self.shared_built != damage_tables.built:
+            self._release_tables()
+            self.shared_built = damage_tables.built
+            self.shared_tables = damage_tables.share()
+        return self.shared_tables.name
+
+    def _release_tables(self) -> None:
+        # Workers keep their own mapping, so the name can go right away
+        if self.shared_tables is not None:
+            self.shared_tables.close()
+            self.shared_tables.unlink()
+            self.shared_tables = None
+
+    def choose(self, game):
+        """Return the (action, target enemy or None) the hero should take"""
+        position = search_copy(game)
+        if self.executor is None:
+            statistics = [search(position, self.time_budget, self.iterations, rng=self.rng.fork())]
+        else:
+            # Every search gets its own stream, forked from the player's
+            tables_name = self._tables_name()
+            jobs = [(position, self.time_budget, self.iterations, stream, tables_name)
+                    for stream in self.rng.spawn(self.workers)]
+            statistics = list(self.executor.map(_search_worker, jobs))
+
+        totals = {}
+        for result in statistics:
+            for action, (visits, value) in result.items():
+                total_visits, total_value = totals.get(action, (0, 0.0))
+                totals[action] = (total_visits + visits, total_value + value)
+        name, index = max(totals, key=lambda action: totals[action])
+        return name, game.current_enemies[index] if index is not None else None
+
+    def policy(self, game):
+        """A run_battle policy that searches the given game's battle"""
+        return lambda hero, enemies: self.choose(game)
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        self._release_tables()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# ------------ command line ------------
+def main():
+    """Compare MCTS against the greedy policy on the same seeded battles"""
+    parser = argparse.ArgumentParser(description="Measure battle difficulty with an MCTS hero.")
+    parser.add_argument("--zone", type=int, default=1)
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--battles", type=int, default=20)
+    parser.add_argument("--boss", action="store_true")
+    parser.add_argument("--budget", type=float, default=0.01, help="seconds of search per decision")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--pool", choices=["process", "thread"], default="process")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    baseline = BattleSimulator(zone=args.zone, hero_level=args.level, policy=greedy_ability,
+                               boss=args.boss, seed=args.seed)
+    print(f"greedy: {summarize(baseline.run(args.battles))}")
+
+    simulator = BattleSimulator(zone=args.zone, hero_level=args.level, boss=args.boss, seed=args.seed)
+    results = []
+    start = time.perf_counter()
+    with MCTSPlayer(args.budget, workers=args.workers, pool=args.pool, seed=args.seed) as player:
+        policy = player.policy(simulator.game)
+        for _ in range(args.battles):
+            simulator.game.hero = simulator.new_hero()
+            results.append(run_battle(simulator.game, simulator.new_enemies(), policy))
+    elapsed = time.perf_counter() - start
+    print(f"mcts: {summarize(results)}")
+    print(f"decisions/second: {sum(result.turns for result in results) / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# ------------ imports ------------
+import json
+import time
+from damage_table import AttackTable
+from weapon import Weapon
+
+
+# ------------ class setup ------------
+class Profiler:
+    """Opt-in phase timers and call counters for one game
+
+    attach() wraps the game's battle phase methods, its RNG's primitive
+    draws, its renderer's writes and the damage rolls; detach() puts the
+    originals back. Nothing is wrapped until then, so a game that is not
+    being profiled runs exactly the same code at the same speed.
+
+    Phases nest (a turn's phases run inside "battle"), and every count is
+    recorded against the phase stack it happened in, so the results export
+    both as a flat stats dict and as flamegraph collapsed stacks.
+    """
+    # Game method -> phase name
+    phases = {
+        "encounter_enemies": "battle",
+        "draw_battle": "draw",
+        "apply_turn_status_effects": "status",
+        "update_cooldowns": "cooldowns",
+        "ask": "input",
+        "hero_action": "player_action",
+        "enemy_turn": "enemy_ai",
+        "award_battle_rewards": "rewards",
+    }
+    # Counter -> (where, methods): RNG draws are counted at the two
+    # primitives every other Random method goes through
+    counters = {
+        "rng_draws": ("rng", ("random", "getrandbits")),
+        "renderer_writes": ("renderer", ("show", "prompt")),
+    }
+    # Damage rolls: regular attacks roll an AttackTable, abilities roll
+    # Weapon.get_damage; both classes are patched for one profiler at a time
+    damage_rolls = ((AttackTable, "roll"), (Weapon, "get_damage"))
+    attached = None
+
+    def __init__(self, clock=time.perf_counter_ns) -> None:
+        self.clock = clock
+        self.path = ()     # Names of the open phases, outermost first
+        self.open = []     # (path, start) of every open phase
+        self.times = {}    # path -> total nanoseconds, nested phases included
+        self.calls = {}    # path -> times entered
+        self.counts = {}   # (path, counter) -> count
+        self.game = None
+        self.originals = []  # (object, attribute, value before attach)
+
+    # ------------ recording ------------
+    def begin(self, name: str) -> None:
+        self.open.append((self.path, self.clock()))
+        self.path = self.path + (name,)
+
+    def end(self) -> None:
+        path = self.path
+        self.path, start = self.open.pop()
+        self.times[path] = self.times.get(path, 0) + self.clock() - start
+        self.calls[path] = self.calls.get(path, 0) + 1
+
+    def count(self, counter: str) -> None:
+        key = (self.path, counter)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def reset(self) -> None:
+        """Drop everything recorded so far (phases that are open keep running)"""
+        self.times.clear()
+        self.calls.clear()
+        self.counts.clear()
+
+    # ------------ hooks ------------
+    def _timed(self, name: str, method):
+        def timed(*args, **kwargs):
+            self.begin(name)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.end()
+        return timed
+
+    def _counted(self, counter: str, method):
+        def counted(*args, **kwargs):
+            self.count(counter)
+            return method(*args, **kwargs)
+        return counted
+
+    def _patch(self, target, attribute: str, replacement) -> None:
+        self.originals.append((target, attribute, target.__dict__.get(attribute)))
+        setattr(target, attribute, replacement)
+
+    def attach(self, game) -> "Profiler":
+        """Start profiling a game"""
+        if Profiler.attached is not None:
+            raise RuntimeError("Another profiler is already attached")
+        Profiler.attached = self
+        self.game = game
+        game.profiler = self
+        for method, name in self.phases.items():
+            self._patch(game, method, self._timed(name, getattr(game, method)))
+        for counter, (where, methods) in self.counters.items():
+            target = getattr(game, where)
+            for method in methods:
+                self._patch(target, method, self._counted(counter, getattr(target, method)))
+        for target, method in self.damage_rolls:
+            self._patch(target, method, self._counted("damage_rolls", getattr(target, method)))
+        return self
+
+    def detach(self) -> None:
+        """Stop profiling and restore every wrapped method (the results are kept)"""
+        for target, attribute, original in reversed(self.originals):
+            if original is None:
+                delattr(target, attribute)
+            else:
+                setattr(target, attribute, original)
+        self.originals.clear()
+        if self.game is not None:
+            self.game.profiler = None
+            self.game = None
+        if Profiler.attached is self:
+            Profiler.attached = None
+
+    # ------------ export ------------
+    def stats(self) -> dict:
+        """Flat results: "<phase path>.calls", "<phase path>.seconds" and counter totals
+
+        Phase paths are dot-joined ("battle.draw"). Counters appear both as
+        totals ("rng_draws") and per phase ("battle.enemy_ai.rng_draws").
+        """
+        stats = {}
+        for path, calls in sorted(self.calls.items()):
+            name = ".".join(path)
+            stats[name + ".calls"] = calls
+            stats[name + ".seconds"] = self.times[path] / 1e9
+        totals = {}
+        for (path, counter), count in sorted(self.counts.items()):
+            totals[counter] = totals.get(counter, 0) + count
+            if path:
+                stats[".".join(path) + "." + counter] = count
+        stats.update(totals)
+        return stats
+
+    def collapsed(self, metric: str = "time") -> list:
+        """Collapsed-stack lines ("battle;enemy_ai 1234") for flamegraph.pl, speedscope and co
+
+        With metric "time" the values are microseconds spent in each phase
+        itself, nested phases excluded; with a counter name ("rng_draws")
+        they are the counts made directly in each phase.
+        """
+        if metric == "time":
+            own = dict(self.times)
+            for path, spent in self.times.items():
+                if len(path) > 1 and path[:-1] in own:
+                    own[path[:-1]] -= spent
+            values = {path: spent // 1000 for path, spent in own.items()}
+        else:
+            values = {path: count for (path, counter), count in self.counts.items() if counter == metric}
+        return [f"{';'.join(path) or 'idle'} {value}"
+                for path, value in sorted(values.items()) if value > 0]
+
+    def write_collapsed(self, path: str, metric: str = "time") -> None:
+        with open(path, "w") as collapsed_file:
+            for line in self.collapsed(metric):
+                collapsed_file.write(line + "\n")
+
+    def write_stats(self, path: str) -> None:
+        with open(path, "w") as stats_file:
+            json.dump(self.stats(), stats_file, indent=2)
@@ -0,0 +1,102 @@
+# ------------ imports ------------
+import os
+import sys
+
+
+# ------------ base class ------------
+class Renderer:
+    """Destination for everything the game shows to the player
+
+    show() takes a str.format template and its arguments separately, so
+    renderers that discard output never pay for building the text. A
+    template is only formatted when arguments are given.
+    """
+    active = True  # False when output is discarded; callers may skip work
+
+    def show(self, template: str = "", *args) -> None:
+        """Display one line of text"""
+        raise NotImplementedError
+
+    def prompt(self, text: str) -> None:
+        """Display an input prompt (without a line break) right before reading input"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Start a new screen"""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Make everything shown so far visible"""
+
+
+# ------------ implementations ------------
+class TerminalRenderer(Renderer):
+    """Prints straight to the terminal, exactly like the original game"""
+    def __init__(self, stream=None) -> None:
+        self.stream = stream  # None means whatever sys.stdout is at the time
+
+    def show(self, template: str = "", *args) -> None:
+        print(template.format(*args) if args else template, file=self.stream)
+
+    def prompt(self, text: str) -> None:
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        stream.flush()
+
+    def clear(self) -> None:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+    def flush(self) -> None:
+        (self.stream or sys.stdout).flush()
+
+
+class BufferedRenderer(Renderer):
+    """Collects a whole frame in memory and writes it with a single write() call
+
+    A frame is everything shown between two flushes; the game flushes before
+    every prompt and pause, which is once per battle turn.
+    """
+    clear_sequence = "\033[2J\033[H"
+
+    def __init__(self, stream=None) -> None:
+        self.stream = stream
+        self.parts = []
+
+    def show(self, template: str = "", *args) -> None:
+        self.parts.append(template.format(*args) if args else template)
+        self.parts.append("\n")
+
+    def prompt(self, text: str) -> None:
+        self.parts.append(text)
+        self.flush()
+
+    def clear(self) -> None:
+        self.parts.clear()
+        self.parts.append(self.clear_sequence)
+
+    def flush(self) -> None:
+        if not self.parts:
+            return
+        stream = self.stream or sys.stdout
+        stream.write("".join(self.parts))
+        stream.flush()
+        self.parts.clear()
+
+
+class NullRenderer(Renderer):
+    """Discards everything without ever formatting a string"""
+    active = False
+
+    def show(self, template: str = "", *args) -> None:
+        pass
+
+    def prompt(self, text: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+# ------------ default renderer ------------
+# Used by objects that are created outside of a Game
+default_renderer = TerminalRenderer()
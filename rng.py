@@ -0,0 +1,69 @@
+# ------------ imports ------------
+import random
+
+
+# ------------ class setup ------------
+class GameRNG(random.Random):
+    """Seedable random stream that a Game passes to everything it owns
+
+    Every stream has a concrete seed (drawn from the OS when none is given),
+    so any session can be replayed exactly from its seed, and fork() hands
+    out independent child streams for parallel workers (runner games, MCTS
+    searches). block() and roll_block() pre-draw rolls in bulk for
+    consumers that make many at once, like EnemyPool waves.
+    """
+    def __init__(self, seed=None) -> None:
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.initial_seed = seed
+        super().__init__(seed)
+
+    def __reduce__(self):
+        return (self.__class__, (self.initial_seed,), self.getstate())
+
+    def fork(self):
+        """Create an independent child stream, deterministically derived from this one"""
+        return GameRNG(self.getrandbits(64))
+
+    def spawn(self, count: int):
+        """Create several independent child streams"""
+        return [self.fork() for _ in range(count)]
+
+    def copy(self):
+        """Create an independent stream at the same position, without reseeding"""
+        clone = self.__class__.__new__(self.__class__)
+        clone.initial_seed = self.initial_seed
+        clone.setstate(self.getstate())
+        return clone
+
+    def snapshot(self):
+        """Capture the current position in the stream"""
+        return self.getstate()
+
+    def restore(self, state) -> None:
+        """Rewind or fast-forward to a captured position"""
+        self.setstate(state)
+
+    def randint(self, a: int, b: int) -> int:
+        """Roll an integer in [a, b] with a single random() draw"""
+        return a + int(self.random() * (b - a + 1))
+
+    def chance(self, probability: float) -> bool:
+        """Roll a check that succeeds with the given probability"""
+        return self.random() < probability
+
+    def block(self, count: int):
+        """Pre-draw a block of uniform floats for bulk consumers"""
+        draw = self.random
+        return [draw() for _ in range(count)]
+
+    def roll_block(self, a: int, b: int, count: int):
+        """Pre-draw a block of integer rolls in [a, b]"""
+        draw = self.random
+        span = b - a + 1
+        return [a + int(draw() * span) for _ in range(count)]
+
+
+# ------------ default stream ------------
+# Used by objects that are created outside of a Game
+default_rng = GameRNG()
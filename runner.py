@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+"""
+Parallel full-playthrough runner
+
+Plays complete headless games, from weapon selection to victory or defeat,
+with a scripted policy answering every prompt. Runs are fanned out over a
+multiprocessing pool, each on its own stream forked from the base seed,
+and a summary of every run (with the seed that replays it) is streamed
+back as soon as it finishes.
+"""
+
+# ------------ imports ------------
+import argparse
+import json
+import multiprocessing
+import sys
+from typing import NamedTuple
+from game import Game, GameEnded
+from input_provider import PolicyInput
+from rng import GameRNG
+from simulation import greedy_ability
+
+
+# ------------ scripted policy ------------
+def explorer_policy(game, prompt):
+    """Answer a game prompt: explore, fight greedily, rest when hurt and accept every offer"""
+    hero = game.hero
+    if prompt.startswith("Enter your choice (1-3)"):
+        return "2"  # Iron Sword
+    if prompt == "Enter your choice: " and game.current_enemies and game.alive_enemies():
+        # Battle prompt: abilities are numbered from 2 in unlock order
+        action = greedy_ability(hero, game.alive_enemies())
+        if action == "Attack":
+            return "1"
+        unlocked = [name for name, data in hero.abilities.items() if hero.level >= data["level"]]
+        return str(unlocked.index(action) + 2)
+    if prompt == "\nEnter your choice: ":
+        # Main menu: rest when badly hurt and able to afford it, otherwise explore
+        cost = max(5, (hero.health_max - hero.health) // 2)
+        if hero.health < hero.health_max // 2 and hero.coins >= cost:
+            return "4"
+        return "1"
+    if prompt.startswith("Enter the number of the item you want to buy"):
+        return "0"
+    if prompt == "(y/n): ":
+        return "n"  # Never quit
+    if prompt.endswith("(y/n): "):
+        return "y"
+    return ""
+
+
+# ------------ single run ------------
+class RunSummary(NamedTuple):
+    seed: int
+    outcome: str
+    zone: int
+    level: int
+    coins: int
+    death_cause: str
+    turns: int
+    steps: int
+    paused_seconds: float  # Logical pause time a player would have waited
+
+
+def play_game(seed: int, policy=explorer_policy, max_steps: int = 20000) -> RunSummary:
+    """Play one full headless game with a seed and return its summary"""
+    game = Game(headless=True, seed=seed)
+
+    scripted_input = PolicyInput(game, policy, max_steps)
+    game.input_func = scripted_input
+    try:
+        game.main_menu()
+        outcome = "victory"
+    except GameEnded as ended:
+        outcome = ended.outcome
+
+    return RunSummary(seed=seed,
+                      outcome=outcome,
+                      zone=game.current_zone,
+                      level=game.hero.level,
+                      coins=game.hero.coins,
+                      death_cause=game.defeated_by or "",
+                      turns=game.turns_taken,
+                      steps=scripted_input.steps,
+                      paused_seconds=game.clock.elapsed)
+
+
+# ------------ process pool ------------
+def run_playthroughs(runs: int, processes=None, base_seed: int = 0, chunksize: int = 16):
+    """Yield run summaries as pool workers finish games, one forked seed per run"""
+    streams = GameRNG(base_seed)
+    seeds = (streams.fork().initial_seed for _ in range(runs))
+    with multiprocessing.Pool(processes) as pool:
+        for summary in pool.imap_unordered(play_game, seeds, chunksize):
+            yield summary
+
+
+def main():
+    """Command line entry point for parallel playthroughs"""
+    parser = argparse.ArgumentParser(description="Play full headless games in parallel.")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-", help="JSON lines output file ('-' for stdout)")
+    args = parser.parse_args()
+
+    outcomes = {}
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for summary in run_playthroughs(args.runs, args.processes, args.seed):
+            output.write(json.dumps(summary._asdict()) + "\n")
+            outcomes[summary.outcome] = outcomes.get(summary.outcome, 0) + 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"Outcomes: {outcomes}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# ------------ imports ------------
+import json
+import os
+import weapon as weapon_module
+from inventory import Inventory
+from item import Item
+from weapon import Weapon
+
+
+# ------------ format ------------
+# A save file is JSON lines: a header, one full snapshot, then deltas that
+# hold only the keys whose values changed since the previous line.
+save_format = "cursed-skeleton-save"
+save_version = 1
+
+# Weapons defined in weapon.py, by variable name. A game's own copies of
+# them are saved by reference ("weapon:<name>")
+module_weapons = {name: value for name, value in vars(weapon_module).items() if isinstance(value, Weapon)}
+
+
+# ------------ state capture ------------
+def _weapon_table(game):
+    """Number every weapon the game state can reach
+
+    The game's copies of the module weapons and its shop weapons are
+    stored as references; anything else (event loot) is stored by value
+    once and referenced by its index, so shared objects stay shared after a
+    load.
+    """
+    table = []
+    index = {}
+
+    def add(weapon, entry):
+        if id(weapon) not in index:
+            index[id(weapon)] = len(table)
+            table.append(dict(entry, damage_boost=weapon.damage_boost))
+        return index[id(weapon)]
+
+    for name, weapon in module_weapons.items():
+        add(game.own_weapons[weapon], {"ref": f"weapon:{name}"})
+    for position, weapon in enumerate(game.shop.weapons):
+        add(weapon, {"ref": f"shop:{position}"})
+
+    def ref(weapon):
+        return add(weapon, {"value": [weapon.name, weapon.weapon_type, list(weapon.damage_range),
+                                      weapon.value, weapon.color, weapon.special_effect,
+                                      weapon.special_effect_chance]})
+    return table, ref
+
+
+def capture_state(game) -> dict:
+    """Flatten everything a save needs into a dict of JSON values"""
+    hero = game.hero
+    weapons, weapon_ref = _weapon_table(game)
+    inventory = []
+    for item, count in hero.inventory.stacks():
+        entry = ({"weapon": weapon_ref(item)} if isinstance(item, Weapon)
+                 else {"item": [item.name, item.item_type, item.value, item.color]})
+        if count > 1:
+            entry["count"] = count  # Older saves list every item separately
+        inventory.append(entry)
+    rng_version, rng_internal, rng_gauss = game.rng.getstate()
+    return {
+        "game.current_zone": game.current_zone,
+        "game.boss_defeated": game.boss_defeated,
+        "game.game_completed": game.game_completed,
+        "game.story_progress": game.story_progress,
+        "game.turns_taken": game.turns_taken,
+        "game.defeated_by": game.defeated_by,
+        "rng.seed": game.rng.initial_seed,
+        "rng.state": [rng_version, list(rng_internal), rng_gauss],
+        "hero.name": hero.name,
+        "hero.health": hero.health,
+        "hero.health_max": hero.health_max,
+        "hero.stats": [hero.strength, hero.defense, hero.speed],
+        "hero.bonuses": [hero.strength_bonus, hero.defense_bonus, hero.speed_bonus],
+        "hero.status_effects": hero.status_effects.snapshot(),
+        "hero.weapon": weapon_ref(hero.weapon),
+        "hero.default_weapon": weapon_ref(hero.default_weapon),
+        "hero.inventory": inventory,
+        "hero.coins": hero.coins,
+        "hero.progress": [hero.level, hero.experience, hero.experience_to_level],
+        "hero.cooldowns": {name: ability["cooldown"] for name, ability in hero.abilities.items()},
+        # Last, so the table includes the loot weapons found above
+        "weapons": weapons,
+    }
+
+
+def restore_state(game, state: dict) -> None:
+    """Put a captured state back into a game built from the same code"""
+    weapons = []
+    for entry in state["weapons"]:
+        if "ref" in entry:
+            kind, key = entry["ref"].split(":")
+            weapon = game.own_weapons[module_weapons[key]] if kind == "weapon" else game.shop.weapons[int(key)]
+        else:
+            name, weapon_type, damage_range, value, color, special_effect, chance = entry["value"]
+            weapon = Weapon(name, weapon_type, tuple(damage_range), value, color)
+            weapon.special_effect = special_effect
+            weapon.special_effect_chance = chance
+        weapon.damage_boost = entry["damage_boost"]
+        weapons.append(weapon)
+
+    game.current_zone = state["game.current_zone"]
+    game.boss_defeated = state["game.boss_defeated"]
+    game.game_completed = state["game.game_completed"]
+    game.story_progress = state["game.story_progress"]
+    game.turns_taken = state["game.turns_taken"]
+    game.defeated_by = state["game.defeated_by"]
+    game.current_enemies = None
+    game.battlefield = None
+    game.initiative = None
+
+    rng_version, rng_internal, rng_gauss = state["rng.state"]
+    game.rng.initial_seed = state["rng.seed"]
+    game.rng.setstate((rng_version, tuple(rng_internal), rng_gauss))
+
+    hero = game.hero
+    hero.name = state["hero.name"]
+    hero.health = state["hero.health"]
+    hero.health_max = state["hero.health_max"]
+    hero.strength, hero.defense, hero.speed = state["hero.stats"]
+    hero.strength_bonus, hero.defense_bonus, hero.speed_bonus = state["hero.bonuses"]
+    hero.stats_changed()
+    hero.status_effects.restore(state["hero.status_effects"])
+    hero.weapon = weapons[state["hero.weapon"]]
+    hero.default_weapon = weapons[state["hero.default_weapon"]]
+    hero.inventory = Inventory()
+    for entry in state["hero.inventory"]:
+        item = weapons[entry["weapon"]] if "weapon" in entry else Item(*entry["item"])
+        hero.inventory.add(item, entry.get("count", 1))
+    hero.coins = state["hero.coins"]
+    hero.level, hero.experience, hero.experience_to_level = state["hero.progress"]
+    for name, cooldown in state["hero.cooldowns"].items():
+        hero.abilities[name]["cooldown"] = cooldown
+
+    # Health bars show the restored health without a damage animation
+    hero.health_bar.max_value = hero.health_max
+    hero.health_bar.current_value = hero.health
+    hero.health_bar.previous_value = hero.health
+    hero.health_bar.animation_frames = 0
+
+
+# ------------ save file ------------
+class SaveFile:
+    """Versioned save file written as incremental snapshots
+
+    The first save writes a full snapshot; later saves append only the keys
+    that changed. After compact_every deltas the file is rewritten as a
+    single snapshot, so loading never replays a long chain.
+    """
+    def __init__(self, path: str, compact_every: int = 32) -> None:
+        self.path = path
+        self.compact_every = compact_every
+        self.last_state = None  # State as of the last line written or read
+        self.deltas = 0
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def save(self, game) -> None:
+        state = capture_state(game)
+        if self.last_state is None or self.deltas >= self.compact_every or not self.exists():
+            self._write_snapshot(state)
+        else:
+            last_state = self.last_state
+            changes = {key: value for key, value in state.items() if last_state.get(key) != value}
+            if changes:
+                with open(self.path, "a", encoding="utf-8") as save:
+                    save.write(json.dumps({"delta": changes}, separators=(",", ":")) + "\n")
+                self.deltas += 1
+        self.last_state = state
+
+    def _write_snapshot(self, state: dict) -> None:
+        # Write next to the old file and swap, so a crash never leaves a broken save
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as save:
+            save.write(json.dumps({"format": save_format, "version": save_version}) + "\n")
+            save.write(json.dumps({"snapshot": state}, separators=(",", ":")) + "\n")
+        os.replace(temporary_path, self.path)
+        self.deltas = 0
+
+    def read(self) -> dict:
+        """Return the state stored in the file, with every delta applied"""
+        with open(self.path, encoding="utf-8") as save:
+            header = json.loads(save.readline())
+            if header.get("format") != save_format:
+                raise ValueError(f"{self.path} is not a save file")
+            if header.get("version") != save_version:
+                raise ValueError(f"Unsupported save version {header.get('version')} in {self.path}")
+            state = json.loads(save.readline())["snapshot"]
+            deltas = 0
+            for line in save:
+                state.update(json.loads(line)["delta"])
+                deltas += 1
+        self.last_state = state
+        self.deltas = deltas
+        return state
+
+    def load(self, game) -> None:
+        restore_state(game, self.read())
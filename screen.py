@@ -0,0 +1,102 @@
+# ------------ imports ------------
+import re
+import shutil
+import sys
+from renderer import Renderer
+
+
+# ------------ helpers ------------
+_ansi_pattern = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+
+
+def visible_width(text: str) -> int:
+    """Number of terminal columns a line takes, ignoring ANSI escape codes"""
+    return len(_ansi_pattern.sub("", text))
+
+
+# ------------ class setup ------------
+class CompositedRenderer(Renderer):
+    """Diff-based screen compositor
+
+    Everything shown between two clear() calls is one frame, kept in memory
+    as a list of lines. flush() compares the frame with what is already on
+    the terminal and rewrites only the lines that changed, using cursor
+    addressing, in a single write. A battle turn that only changes a few
+    health bars therefore sends a few lines instead of a whole screen, and
+    never forks a shell to clear it.
+    """
+    clear_all = "\033[2J\033[H"
+    clear_line = "\033[K"
+    clear_below = "\033[J"
+
+    def __init__(self, stream=None) -> None:
+        self.stream = stream
+        self.lines = [""]        # Frame being built; the last line is still open
+        self.screen = None       # {row: line} currently on the terminal, None if unknown
+        self.prompt_row = None   # Row where the player typed their last input
+        self.changed = False
+        self.width, self.height = shutil.get_terminal_size()
+
+    def _write(self, text: str) -> None:
+        parts = text.split("\n")
+        self.lines[-1] += parts[0]
+        self.lines.extend(parts[1:])
+        self.changed = True
+
+    def show(self, template: str = "", *args) -> None:
+        self._write(template.format(*args) if args else template)
+        self.lines.append("")
+
+    def prompt(self, text: str) -> None:
+        self._write(text)
+        self.flush()
+        # The player's answer is echoed after the prompt and Enter starts a new line
+        self.prompt_row = self._layout()[-1][0]
+        self.lines.append("")
+        if self.prompt_row >= self.height:
+            # Pressing Enter on the bottom row scrolls the whole terminal
+            self.screen = None
+
+    def clear(self) -> None:
+        if self.screen is not None and self.prompt_row is not None:
+            # The echoed answer is still on screen and must be overwritten
+            self.screen.pop(self.prompt_row, None)
+        self.prompt_row = None
+        self.lines = [""]
+        self.changed = True
+        self.width, self.height = shutil.get_terminal_size()
+
+    def _layout(self):
+        """Pair every frame line with the (1-based) terminal row it starts on"""
+        layout = []
+        row = 1
+        width = self.width
+        for line in self.lines:
+            layout.append((row, line))
+            row += max(1, -(-visible_width(line) // width))
+        return layout
+
+    def flush(self) -> None:
+        if not self.changed:
+            return
+        layout = self._layout()
+        last_row, last_line = layout[-1]
+        if self.screen is None or last_row > self.height:
+            # Unknown screen contents or a frame taller than the terminal: redraw everything
+            output = self.clear_all + "\n".join(self.lines)
+            self.screen = None if last_row > self.height else dict(layout)
+        else:
+            parts = []
+            screen = self.screen
+            for row, line in layout[:-1]:
+                if screen.get(row) != line:
+                    parts.append(f"\033[{row};1H{line}{self.clear_line}")
+            # The open last line is always written so the cursor ends up right after it
+            parts.append(f"\033[{last_row};1H{last_line}{self.clear_below}")
+            output = "".join(parts)
+            self.screen = dict(layout)
+        self.changed = False
+
+        stream = self.stream or sys.stdout
+        stream.write(output)
+        stream.flush()
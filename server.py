@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+"""
+Multi-session game server
+
+Hosts many concurrent games in one process over TCP (plain telnet works)
+or a local Unix socket. The event loop owns every connection: input lines
+are read asynchronously into a per-session asyncio queue, output frames are
+written back from the loop, and each game's clock waits out the pauses
+between turns on loop timers. Each game's own synchronous code runs on a
+small-stack worker thread that blocks only on its own queue and timers, so
+an idle player costs a thread and a Game object instead of a whole
+interpreter.
+"""
+
+# ------------ imports ------------
+import argparse
+import asyncio
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from clock import AcceleratedClock
+from game import Game, GameEnded
+from renderer import BufferedRenderer
+
+
+# ------------ helpers ------------
+_telnet_commands = re.compile(rb"\xff[\xfb-\xfe].|\xff[\xf0-\xfa]", re.DOTALL)
+_save_names = re.compile(r"[^A-Za-z0-9_-]")
+
+
+class _SessionStream:
+    """File-like output a session's renderer writes whole frames to, from its game thread"""
+    def __init__(self, session) -> None:
+        self.session = session
+
+    def write(self, text: str) -> None:
+        session = self.session
+        if not session.closed:
+            data = text.replace("\n", "\r\n").encode()
+            session.loop.call_soon_threadsafe(session.writer.write, data)
+
+    def flush(self) -> None:
+        pass
+
+
+# ------------ sessions ------------
+class Session:
+    """One connected player: an asyncio reader feeding a game thread"""
+    def __init__(self, server, reader, writer, seed=None) -> None:
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.seed = seed
+        self.loop = asyncio.get_running_loop()
+        self.lines = asyncio.Queue()  # Input lines; None once the player is gone
+        self.closed = False
+        self.renderer = BufferedRenderer(_SessionStream(self))
+        self.playing = None  # Future of the game thread
+
+    async def run(self) -> None:
+        reading = asyncio.ensure_future(self.read_input())
+        self.playing = self.loop.run_in_executor(self.server.executor, self.play)
+        try:
+            await asyncio.shield(self.playing)
+        finally:
+            reading.cancel()
+            self.disconnect()
+            self.writer.close()
+
+    def disconnect(self) -> None:
+        """End the game at its next input or pause (called on the event loop)"""
+        if not self.closed:
+            self.closed = True
+            self.lines.put_nowait(None)
+
+    async def read_input(self) -> None:
+        try:
+            while True:
+                data = await self.reader.readline()
+                if not data:
+                    break
+                line = _telnet_commands.sub(b"", data).decode("utf-8", "ignore")
+                await self.lines.put(line.rstrip("\r\n"))
+        except ConnectionError:
+            pass
+        finally:
+            self.disconnect()
+
+    # ------------ game thread side ------------
+    def read_line(self, prompt: str = "") -> str:
+        """Game input_func: block this game's thread until the player sends a line"""
+        line = asyncio.run_coroutine_threadsafe(self.lines.get(), self.loop).result()
+        if line is None:
+            raise GameEnded("The player disconnected.", "quit")
+        return line
+
+    def sleep(self, seconds: float) -> None:
+        """Clock sleep: wait on an event loop timer (skipped once the player is gone)"""
+        if not self.closed:
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(seconds), self.loop).result()
+
+    def play(self) -> None:
+        """Run one whole game, from the player's name to victory, defeat or disconnect"""
+        renderer = self.renderer
+        try:
+            renderer.prompt("Enter your name: ")
+            name = _save_names.sub("", self.read_line())[:32] or "player"
+            save_path = os.path.join(self.server.save_dir, name + ".sav")
+
+            clock = AcceleratedClock(self.server.pause_scale, sleep=self.sleep)
+            game = Game(input_func=self.read_line, seed=self.seed, renderer=renderer,
+                        save_path=save_path, clock=clock)
+            new_game = True
+            if game.save_file.exists():
+                renderer.prompt("A saved game was found. Continue it? (y/n): ")
+                if self.read_line().lower() == "y":
+                    game.load_game()
+                    new_game = False
+            game.main_menu(new_game)
+        except GameEnded:
+            pass
+        finally:
+            renderer.flush()
+
+
+# ------------ server ------------
+class GameServer:
+    """Accepts connections and runs a Session for each, up to max_sessions at once
+
+    pause_scale multiplies every in-game pause (0 disables them). With a
+    base seed, the n-th session plays seed + n, so sessions can be replayed.
+    """
+    def __init__(self, max_sessions: int = 4096, save_dir: str = "saves", pause_scale: float = 1.0,
+                 seed=None) -> None:
+        os.makedirs(save_dir, exist_ok=True)
+        self.max_sessions = max_sessions
+        self.save_dir = save_dir  # Saves are kept per player name
+        self.pause_scale = pause_scale
+        self.seed = seed
+        self.sessions = set()
+        self.started = 0
+        self.executor = ThreadPoolExecutor(max_workers=max_sessions, thread_name_prefix="session")
+
+    async def handle(self, reader, writer) -> None:
+        """Connection callback for asyncio.start_server and start_unix_server"""
+        if len(self.sessions) >= self.max_sessions:
+            writer.write(b"The server is full, please try again later.\r\n")
+            await writer.drain()
+            writer.close()
+            return
+
+        seed = None if self.seed is None else self.seed + self.started
+        self.started += 1
+        session = Session(self, reader, writer, seed)
+        self.sessions.add(session)
+        try:
+            await session.run()
+        finally:
+            self.sessions.discard(session)
+
+    async def serve(self, host: str = "0.0.0.0", port: int = 4000, unix_path=None, backlog: int = 1024) -> None:
+        """Serve over TCP, or over a Unix socket when unix_path is given, until cancelled"""
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle, path=unix_path, backlog=backlog)
+        else:
+            server = await asyncio.start_server(self.handle, host, port, backlog=backlog)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Disconnect every session and wait for their game threads to finish"""
+        playing = []
+        for session in self.sessions:
+            session.disconnect()
+            if session.playing is not None:
+                playing.append(session.playing)
+        await asyncio.gather(*playing, return_exceptions=True)
+        self.executor.shutdown()
+
+
+def main():
+    """Command line entry point for the game server"""
+    parser = argparse.ArgumentParser(description="Host many concurrent games over TCP or a Unix socket.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--unix", default=None, help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--max-sessions", type=int, default=4096)
+    parser.add_argument("--save-dir", default="saves", help="directory for each player's save file")
+    parser.add_argument("--pause-scale", type=float, default=1.0, help="multiply in-game pauses (0 disables them)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    # Game threads only need a shallow stack; the default reserves megabytes each
+    threading.stack_size(512 * 1024)
+    server = GameServer(args.max_sessions, args.save_dir, args.pause_scale, args.seed)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
-import random
 from item import Item
 from weapon import Weapon
+from rng import default_rng
+from renderer import default_renderer
 
 class Shop:
-    def __init__(self):
+    def __init__(self, rng=None, renderer=None):
+        self.rng = rng or default_rng
+        self.renderer = renderer or default_renderer
         self.buffs = [
             Item("Strength Up", "buff", 50, "32"),  # Green
             Item("Speed Up", "buff", 50, "34"),  # Blue
@@ -42,21 +45,21 @@ class Shop:
 
     def display_items(self):
         items = [
-            random.choice(self.buffs),
-            random.choice(self.weapons),
-            random.choice(self.armors),
-            random.choice(self.consumables)
+            self.rng.choice(self.buffs),
+            self.rng.choice(self.weapons),
+            self.rng.choice(self.armors),
+            self.rng.choice(self.consumables)
         ]
-        print("\n" + "="*50)
-        print("Welcome to the Shop!")
-        print("="*50)
+        self.renderer.show("\n" + "="*50)
+        self.renderer.show("Welcome to the Shop!")
+        self.renderer.show("="*50)
         for i, item in enumerate(items):
             if isinstance(item, Weapon):
-                print(f"{i + 1}. \033[{item.color}m{item.name}\033[0m - {item.value} Gold (Damage: {item.damage_range[0]}-{item.damage_range[1]})")
+                self.renderer.show("{}. \033[{}m{}\033[0m - {} Gold (Damage: {}-{})", i + 1, item.color, item.name, item.value, item.damage_range[0], item.damage_range[1])
             else:
-                print(f"{i + 1}. \033[{item.color}m{item.name}\033[0m - {item.value} Gold")
-        print(f"{len(items) + 1}. Exit Shop")
-        print("="*50)
+                self.renderer.show("{}. \033[{}m{}\033[0m - {} Gold", i + 1, item.color, item.name, item.value)
+        self.renderer.show("{}. Exit Shop", len(items) + 1)
+        self.renderer.show("="*50)
         return items
 
     def buy_item(self, hero, items, choice):
@@ -64,8 +67,8 @@ class Shop:
         if hero.coins >= item.value:
             hero.coins -= item.value
             hero.add_item(item)
-            print(f"\033[{item.color}mYou bought {item.name}!\033[0m")
+            self.renderer.show("\033[{}mYou bought {}!\033[0m", item.color, item.name)
             return True
         else:
-            print("Not enough gold to buy this item.")
+            self.renderer.show("Not enough gold to buy this item.")
             return False
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+
+"""
+Headless battle simulation
+
+Runs the same combat rules as Game.encounter_enemies (Character.attack,
+Hero.use_ability, Enemy/Boss special abilities and boss phases) without
+printing, clearing the screen or sleeping, so thousands of battles can be
+played to balance the zones.
+"""
+
+# ------------ imports ------------
+import argparse
+import time
+from typing import NamedTuple
+from battlefield import Battlefield
+from character import Hero
+from combat_log import CombatLog
+from enemy_pool import EnemyPool
+from game import Game
+from initiative import Initiative
+
+
+# ------------ hero policies ------------
+def always_attack(hero, enemies):
+    """Always perform a regular attack on the first enemy"""
+    return "Attack"
+
+
+def greedy_ability(hero, enemies):
+    """Use the strongest ready ability, falling back to a regular attack"""
+    ready = [name for name, data in hero.abilities.items()
+             if hero.level >= data["level"] and data["cooldown"] == 0]
+    if "Quick Recovery" in ready and hero.health <= hero.health_max // 2:
+        return "Quick Recovery"
+    if "Whirlwind" in ready and len(enemies) > 1:
+        return "Whirlwind"
+    if "Heroic Strike" in ready:
+        return "Heroic Strike"
+    return "Attack"
+
+
+POLICIES = {
+    "attack": always_attack,
+    "greedy": greedy_ability,
+}
+
+
+# ------------ battle engine ------------
+class BattleResult(NamedTuple):
+    won: bool
+    turns: int
+    damage_taken: int
+    killed_by: str
+
+
+def run_battle(game, enemies, policy=always_attack, max_turns=1000):
+    """Play one battle of the game's hero against enemies without any I/O
+
+    The turn structure and the order of random draws match
+    Game.encounter_enemies, so a seeded interactive battle that makes the
+    same choices as the policy ends the same way. A policy returns either an
+    action name ("Attack" or an ability) or an (action, target) tuple.
+    """
+    hero = game.hero
+    start_health = hero.health
+    game.begin_battle(enemies)
+    battlefield = game.battlefield
+    turns = 0
+    killer = None
+
+    while turns < max_turns and hero.health > 0 and battlefield:
+        turns += 1
+        game.start_battle_turn()
+
+        # Player's turn
+        if hero.health > 0:
+            if not battlefield:
+                break
+            decision = policy(hero, game.alive_enemies())
+            if isinstance(decision, tuple):
+                game.hero_action(*decision)
+            else:
+                game.hero_action(decision)
+
+        if not battlefield:
+            break
+
+        # Enemies' turn
+        killer = game.enemy_turn()
+        if killer:
+            break
+
+    won = hero.health > 0 and not battlefield
+    damage_taken = max(0, start_health - hero.health)
+    if won:
+        game.award_battle_rewards()
+
+    return BattleResult(won=won,
+                        turns=turns,
+                        damage_taken=damage_taken,
+                        killed_by=killer.name if killer else "")
+
+
+def run_pool_battle(game, pool, max_turns=1000):
+    """Play one battle of the game's hero against an EnemyPool without any I/O
+
+    For waves too large to spawn as Enemy objects. The turn structure
+    follows run_battle on the Initiative timeline: status effects tick,
+    the hero attacks the game's target ("first" or "weakest" row), then
+    every pool enemy due before the hero's next action attacks, with one
+    bulk draw for their rolls. Everyone makes regular attacks only: hero
+    and enemy abilities, boss phases and summons, and rewards are left out.
+    """
+    if game.targeting not in ("first", "weakest"):
+        raise ValueError(f"Pool battles cannot target {game.targeting!r} enemies")
+    hero = game.hero
+    rng = game.rng
+    start_health = hero.health
+    hero_due = 0
+    turns = 0
+    killer = None
+
+    while turns < max_turns and hero.health > 0 and len(pool):
+        turns += 1
+        if hero.status_effects:
+            hero.apply_status_effects()
+        pool.apply_all_status_effects()
+        pool.remove_dead()
+        if hero.health <= 0 or not len(pool):
+            break
+
+        # Hero's turn
+        if game.targeting == "weakest":
+            target = min(range(len(pool)), key=pool.health.__getitem__)
+        else:
+            target = 0
+        pool.receive_attack(target, hero, rng)
+        if pool.health[target] <= 0:
+            pool.remove(target)
+            if not len(pool):
+                break
+
+        # Enemies' turn: everyone due until the hero acts again
+        hero_due += max(1, Initiative.tempo // (hero.stats()[2] + Initiative.speed_offset))
+        killer = pool.volley(pool.actions_until(hero_due), hero, rng)
+        if killer is not None:
+            break
+
+    won = hero.health > 0 and not len(pool)
+    return BattleResult(won=won,
+                        turns=turns,
+                        damage_taken=max(0, start_health - hero.health),
+                        killed_by=pool.name(killer) if killer is not None else "")
+
+
+# ------------ batch simulation ------------
+class BattleSimulator:
+    """Plays many independent battles in one zone with a fixed hero build"""
+    def __init__(self,
+                 zone: int = 1,
+                 hero_level: int = 1,
+                 weapon=None,
+                 policy=always_attack,
+                 boss: bool = False,
+                 hero_health: int = 999,
+                 seed=None,
+                 combat_log=None,
+                 wave: int = 0,
+                 targeting: str = "first",
+                 pool: bool = False) -> None:
+        self.game = Game(headless=True, seed=seed, combat_log=combat_log)
+        self.game.current_zone = zone
+        self.game.targeting = targeting
+        self.zone = zone
+        self.hero_level = hero_level
+        self.weapon = weapon
+        self.policy = policy
+        self.boss = boss
+        self.hero_health = hero_health
+        self.wave = wave  # Horde size; 0 plays Game.trigger_battle's groups of 1 to 3
+        self.pool = pool  # Keep wave enemies in an EnemyPool (see run_pool_battle)
+
+    def new_hero(self):
+        """Create a hero at the configured level with the configured weapon"""
+        game = self.game
+        hero = Hero("Hero", self.hero_health, rng=game.rng, renderer=game.renderer, combat_log=game.combat_log)
+        for _ in range(self.hero_level - 1):
+            hero.level_up()
+        if self.weapon is not None:
+            hero.equip(self.weapon)
+        return hero
+
+    def new_enemies(self):
+        """Pick enemies the same way Game.trigger_battle does, or a horde led by the zone boss"""
+        game = self.game
+        registry = game.enemy_registry
+        if self.wave and self.pool:
+            pool = EnemyPool()
+            pool.add_wave(registry.zone_enemies[self.zone], self.wave, game.rng)
+            pool.add(registry.zone_bosses[self.zone])
+            return pool
+        if self.wave:
+            return (registry.spawn_wave(self.zone, self.wave, game.rng, game.renderer, game.combat_log)
+                    + [registry.spawn_boss(self.zone, game.rng, game.renderer, game.combat_log)])
+        if self.boss:
+            return [registry.spawn_boss(self.zone, game.rng, game.renderer, game.combat_log)]
+        return registry.spawn_group(self.zone, game.rng.randint(1, 3), game.rng, game.renderer, game.combat_log)
+
+    def run(self, battles: int):
+        """Play a number of battles and return their results"""
+        results = []
+        for _ in range(battles):
+            self.game.hero = self.new_hero()
+            if self.wave and self.pool:
+                results.append(run_pool_battle(self.game, self.new_enemies()))
+            else:
+                results.append(run_battle(self.game, self.new_enemies(), self.policy))
+        return results
+
+
+def summarize(results):
+    """Aggregate battle results into win rate and averages"""
+    count = len(results) or 1
+    wins = sum(1 for result in results if result.won)
+    return {
+        "battles": len(results),
+        "win_rate": wins / count,
+        "avg_turns": sum(result.turns for result in results) / count,
+        "avg_damage_taken": sum(result.damage_taken for result in results) / count,
+    }
+
+
+def main():
+    """Command line entry point for batch battle simulation"""
+    parser = argparse.ArgumentParser(description="Simulate battles without any I/O.")
+    parser.add_argument("--zone", type=int, default=1)
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--battles", type=int, default=1000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="attack")
+    parser.add_argument("--boss", action="store_true")
+    parser.add_argument("--wave", type=int, default=0, help="fight hordes of this many enemies plus the zone boss")
+    parser.add_argument("--targeting", choices=Battlefield.targetings, default="first")
+    parser.add_argument("--pool", action="store_true",
+                        help="keep wave enemies in a compact EnemyPool (regular attacks only)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--log", default=None, help="append combat events to this binary log")
+    args = parser.parse_args()
+    if args.pool and not args.wave:
+        parser.error("--pool needs --wave")
+    if args.pool and args.targeting == "threat":
+        parser.error("--pool targets the first or the weakest enemy")
+
+    combat_log = CombatLog(args.log) if args.log else None
+    simulator = BattleSimulator(zone=args.zone,
+                                hero_level=args.level,
+                                policy=POLICIES[args.policy],
+                                boss=args.boss,
+                                seed=args.seed,
+                                combat_log=combat_log,
+                                wave=args.wave,
+                                targeting=args.targeting,
+                                pool=args.pool)
+    start = time.perf_counter()
+    results = simulator.run(args.battles)
+    elapsed = time.perf_counter() - start
+    if combat_log:
+        combat_log.close()
+
+    for key, value in summarize(results).items():
+        print(f"{key}: {value}")
+    print(f"battles/minute: {args.battles / elapsed * 60:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# ------------ class setup ------------
+class StatusEffects:
+    """Burn, poison and freeze effects packed into one fixed-size list
+
+    Every effect kind owns two slots: its remaining duration and its value
+    (damage per turn for burn and poison, slow for freeze). A duration of 0
+    means the effect is not active.
+
+    Burn and freeze refresh: applying them again keeps the longer duration
+    and the stronger value. Poison stacks: every application is its own
+    stack with its own duration, up to max_stacks, and the packed value is
+    the damage of all stacks together.
+    """
+    kinds = ("burn", "poison", "freeze")
+    _offsets = {"burn": 0, "poison": 2, "freeze": 4}
+    max_stacks = {"poison": 3}
+
+    __slots__ = ("_packed", "_stacks", "scheduler", "owner")
+
+    def __init__(self) -> None:
+        self._packed = [0, 0, 0, 0, 0, 0]
+        self._stacks = {}  # Stacking kind -> [[duration, value], ...]
+        self.scheduler = None  # Set by StatusScheduler.track
+        self.owner = None
+
+    def add(self, kind: str, duration: int, value: int) -> None:
+        """Start an effect, or refresh or stack it if it is already active"""
+        offset = self._offsets[kind]
+        packed = self._packed
+        limit = self.max_stacks.get(kind)
+        if limit:
+            stacks = self._stacks.setdefault(kind, [])
+            if len(stacks) >= limit:
+                stacks.remove(min(stacks))  # The stack closest to running out
+            stacks.append([duration, value])
+            packed[offset] = max(stack[0] for stack in stacks)
+            packed[offset + 1] = sum(stack[1] for stack in stacks)
+        else:
+            packed[offset] = max(packed[offset], duration)
+            packed[offset + 1] = max(packed[offset + 1], value)
+        if self.scheduler is not None:
+            self.scheduler.schedule(self.owner)
+
+    def remove(self, kind: str) -> None:
+        offset = self._offsets[kind]
+        self._packed[offset] = 0
+        self._packed[offset + 1] = 0
+        self._stacks.pop(kind, None)
+
+    def clear(self) -> None:
+        self._packed[:] = (0, 0, 0, 0, 0, 0)
+        self._stacks.clear()
+
+    def duration(self, kind: str) -> int:
+        return self._packed[self._offsets[kind]]
+
+    def value(self, kind: str) -> int:
+        return self._packed[self._offsets[kind] + 1]
+
+    def stacks(self, kind: str) -> int:
+        """Number of separate applications of an active effect"""
+        if kind in self._stacks:
+            return len(self._stacks[kind])
+        return 1 if kind in self else 0
+
+    def tick(self, kind: str) -> int:
+        """Reduce an effect's duration by one turn, removing it when it runs out"""
+        offset = self._offsets[kind]
+        remaining = self._packed[offset] - 1
+        stacks = self._stacks.get(kind)
+        if stacks:
+            stacks[:] = [[duration - 1, value] for duration, value in stacks if duration > 1]
+            self._packed[offset + 1] = sum(stack[1] for stack in stacks)
+        if remaining <= 0:
+            remaining = 0
+            self._packed[offset + 1] = 0
+            self._stacks.pop(kind, None)
+        self._packed[offset] = remaining
+        return remaining
+
+    def snapshot(self) -> list:
+        """The packed (duration, value) pairs as a plain list, followed by the stacks"""
+        snapshot = list(self._packed)
+        for kind in self.max_stacks:
+            stacks = self._stacks.get(kind, ())
+            snapshot.append(len(stacks))
+            for duration, value in stacks:
+                snapshot += (duration, value)
+        return snapshot
+
+    def restore(self, packed) -> None:
+        self._packed[:] = packed[:6]
+        self._stacks.clear()
+        position = 6
+        for kind in self.max_stacks:
+            if position < len(packed):
+                count = packed[position]
+                stacks = [list(packed[start:start + 2]) for start in range(position + 1, position + 1 + 2 * count, 2)]
+                position += 1 + 2 * count
+            else:
+                # Saves from before stacking: an active effect is one stack
+                stacks = [[self.duration(kind), self.value(kind)]] if kind in self else []
+            if stacks:
+                self._stacks[kind] = stacks
+
+    def copy(self):
+        """Copy the effects (not the scheduler, which belongs to one game)"""
+        clone = StatusEffects()
+        clone._packed[:] = self._packed
+        for kind, stacks in self._stacks.items():
+            clone._stacks[kind] = [list(stack) for stack in stacks]
+        return clone
+
+    def __contains__(self, kind: str) -> bool:
+        offset = self._offsets.get(kind)
+        return offset is not None and self._packed[offset] > 0
+
+    def __iter__(self):
+        packed = self._packed
+        return iter([kind for kind, offset in self._offsets.items() if packed[offset] > 0])
+
+    def __len__(self) -> int:
+        packed = self._packed
+        return (packed[0] > 0) + (packed[2] > 0) + (packed[4] > 0)
+
+    def __bool__(self) -> bool:
+        packed = self._packed
+        return packed[0] > 0 or packed[2] > 0 or packed[4] > 0
+
+    def __repr__(self) -> str:
+        return f"StatusEffects({', '.join(f'{kind}={self.duration(kind)}' for kind in self)})"
+
+
+# ------------ scheduler ------------
+class StatusScheduler:
+    """The combatants whose status effects tick on the next battle turn
+
+    A tracked combatant is added when an effect is applied to it and kept
+    after every tick while an effect is left, so a turn only visits
+    combatants that have effects instead of every combatant in the battle.
+    Every active effect acts on every turn (damage or slow), so its expiry
+    is the duration countdown done during that visit and needs no timer of
+    its own.
+    """
+    __slots__ = ("due",)
+
+    def __init__(self) -> None:
+        self.due = {}  # Ordered set of combatants
+
+    def track(self, character) -> None:
+        """Have effects applied to a combatant schedule themselves here"""
+        effects = character.status_effects
+        effects.scheduler = self
+        effects.owner = character
+        if effects:
+            self.schedule(character)
+
+    def begin_battle(self, characters) -> None:
+        """Forget the last battle and track every combatant of a new one"""
+        self.due.clear()
+        for character in characters:
+            self.track(character)
+
+    def schedule(self, character) -> None:
+        """Make a combatant's effects tick on the next turn"""
+        self.due[character] = None
+
+    def advance(self) -> list:
+        """Move to the next turn and return the combatants due on it"""
+        due = list(self.due)
+        self.due.clear()
+        return due
+
+    def __len__(self) -> int:
+        return len(self.due)
@@ -0,0 +1,53 @@
+# ------------ imports ------------
+import unittest
+from battlefield import Battlefield
+from character import Enemy, Hero
+from item import Item
+
+
+# ------------ targeting ------------
+class BattlefieldTest(unittest.TestCase):
+    """Targeting queries follow health and stat changes"""
+    def setUp(self):
+        self.hero = Hero("Hero", 100)
+        self.hero.defense = 22
+        self.hero.stats_changed()
+        # Against defense 22 the steady hitter is the bigger threat; with 5
+        # more defense most of its damage is absorbed and the wild one is
+        self.steady = Enemy("Steady", 50, (11, 11))
+        self.wild = Enemy("Wild", 60, (1, 19))
+        self.enemies = [self.steady, self.wild]
+        self.battlefield = Battlefield(self.enemies, self.hero)
+
+    def test_weakest_and_first(self):
+        battlefield = self.battlefield
+        self.assertIs(battlefield.target("first"), self.steady)
+        self.assertIs(battlefield.target("weakest"), self.steady)
+        self.wild.health = 40
+        battlefield.update(self.wild)
+        self.assertIs(battlefield.target("weakest"), self.wild)
+        self.steady.health = 0
+        battlefield.update(self.steady)
+        self.assertEqual(len(battlefield), 1)
+        self.assertIs(battlefield.target("first"), self.wild)
+
+    def test_threat_follows_hero_buffs(self):
+        self.assertIs(self.battlefield.target("threat"), self.steady)
+        Item("Defense Up", "buff", 50, "33").use(self.hero)
+        self.assertIs(self.battlefield.target("threat"), self.wild)
+        self.hero.defense_bonus = 0
+        self.hero.stats_changed()
+        self.assertIs(self.battlefield.target("threat"), self.steady)
+
+    def test_clone_keeps_threat_order(self):
+        hero = Hero("Hero", 100)
+        hero.defense = 27
+        hero.stats_changed()
+        enemies = [Enemy("Steady", 50, (11, 11)), Enemy("Wild", 60, (1, 19))]
+        clone = self.battlefield.clone(enemies, hero)
+        self.assertIs(clone.target("threat"), enemies[1])
+        self.assertIs(self.battlefield.target("threat"), self.steady)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# ------------ imports ------------
+import unittest
+from game import Game
+from simulation import greedy_ability, run_battle
+
+
+# ------------ clone/restore equivalence ------------
+class CloneTest(unittest.TestCase):
+    """A clone or a restored snapshot plays on exactly like the original"""
+    def setUp(self):
+        game = self.game = Game(headless=True, seed=11)
+        game.current_zone = 5
+        for _ in range(4):
+            game.hero.level_up()
+        rng, renderer = game.rng, game.renderer
+        enemies = [game.enemy_registry.spawn_boss(5, rng, renderer)] + game.enemy_registry.spawn_group(5, 2, rng, renderer)
+        game.begin_battle(enemies)
+        for _ in range(5):
+            game.start_battle_turn()
+            game.hero_action("Attack")
+            game.enemy_turn()
+
+    def position(self, game):
+        return (game.hero.health, game.hero.status_effects.snapshot(),
+                [(enemy.health, enemy.status_effects.snapshot()) for enemy in game.current_enemies])
+
+    def finish(self, game):
+        return run_battle(game, game.current_enemies, greedy_ability)
+
+    def test_clone_leaves_original_alone(self):
+        before = self.position(self.game)
+        clone = self.game.clone()
+        self.finish(clone)
+        self.assertEqual(self.position(self.game), before)
+
+    def test_clone_plays_like_original(self):
+        result = self.finish(self.game.clone())
+        self.assertEqual(self.finish(self.game), result)
+
+    def test_restore_replays_from_snapshot(self):
+        snapshot = self.game.snapshot()
+        result = self.finish(self.game)
+        for _ in range(2):  # A snapshot can be restored more than once
+            self.game.restore(snapshot)
+            self.assertEqual(self.finish(self.game), result)
+        self.assertIs(self.game.hero.health_bar.entity, self.game.hero)
+        for enemy in self.game.current_enemies:
+            self.assertIs(enemy.health_bar.entity, enemy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+# ------------ imports ------------
+import unittest
+from simulation import BattleSimulator, run_battle
+
+try:
+    from combat_kernel import simulate_fights
+except ImportError:  # NumPy is optional
+    simulate_fights = None
+
+
+# ------------ kernel vs game parity ------------
+@unittest.skipIf(simulate_fights is None, "combat_kernel needs NumPy")
+class KernelParityTest(unittest.TestCase):
+    """The kernel's one-on-one fights match simulation.run_battle's
+
+    The matchups use zone 1 and 2 enemies (no special abilities) and
+    weapons without special effects, the only rules the kernel leaves out,
+    so both sides play the same battles and only the random draws differ.
+    """
+    battles = 2000
+    fights = 20000
+
+    def compare(self, zone, level, weapon_name, hero_health):
+        simulator = BattleSimulator(zone=zone, hero_level=level, hero_health=hero_health, seed=5)
+        game = simulator.game
+        simulator.weapon = {weapon.name: weapon for weapon in game.weapons}[weapon_name]
+        templates = game.zone_enemies[zone]
+        results = []
+        for _ in range(self.battles):
+            game.hero = simulator.new_hero()
+            enemy = game.rng.choice(templates).spawn(game.rng, game.renderer)
+            results.append(run_battle(game, [enemy]))
+        kernel = simulate_fights(templates, level, simulator.weapon, self.fights, hero_health=hero_health, seed=1)
+
+        self.assertAlmostEqual(kernel.win_rate, sum(result.won for result in results) / self.battles, delta=0.04)
+        turns = sum(result.turns for result in results) / self.battles
+        self.assertAlmostEqual(float(kernel.turns.mean()), turns, delta=0.03 * turns)
+        damage_taken = sum(result.damage_taken for result in results) / self.battles
+        self.assertAlmostEqual(float(kernel.damage_taken.mean()), damage_taken, delta=0.05 * damage_taken)
+
+    def test_equal_speeds(self):
+        self.compare(zone=1, level=1, weapon_name="Fists", hero_health=30)
+
+    def test_faster_hero(self):
+        # Speed 11 against 5 and 6: the hero acts about twice per enemy action
+        self.compare(zone=1, level=4, weapon_name="Fists", hero_health=1)
+        self.compare(zone=2, level=3, weapon_name="Short Bow", hero_health=10)
+
+    def test_faster_enemy(self):
+        # Speed 5 against the zone 2 enemies' 6
+        self.compare(zone=2, level=1, weapon_name="Short Bow", hero_health=70)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# ------------ imports ------------
+import os
+import tempfile
+import unittest
+from combat_log import CombatEvent, CombatLog, CombatLogReader, EventKind, record
+from game import Game
+from simulation import greedy_ability, run_battle
+
+
+# ------------ write/read round trips ------------
+class CombatLogRoundTripTest(unittest.TestCase):
+    """What a CombatLog writes, a CombatLogReader reads back"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "combat.log")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_events_round_trip(self):
+        events = [(EventKind.HIT, "Hero", "Goblin", 7.0, "Iron Sword", ""),
+                  (EventKind.STATUS_APPLY, "Hero", "Goblin", 3.0, "Flaming Sword", "burn"),
+                  (EventKind.STATUS_TICK, "Goblin", "Goblin", 3.0, "", "burn"),
+                  (EventKind.REWARD_COINS, "Goblin", "Hero", 12.0, "", "")]
+        with CombatLog(self.path, buffer_records=3) as log:  # Forces a flush midway
+            log.begin_battle()
+            log.begin_turn()
+            for event in events:
+                log.record(*event)
+
+        expected = [CombatEvent(1, 1, kind, effect, actor, target, source, amount)
+                    for kind, actor, target, amount, source, effect in events]
+        with CombatLogReader(self.path) as reader:
+            self.assertEqual(len(reader), len(events))
+            self.assertEqual(list(reader), expected)
+            self.assertEqual(reader[-1], expected[-1])
+            self.assertEqual(len(reader.records()), len(events) * record.size)
+            with self.assertRaises(IndexError):
+                reader[len(events)]
+
+    def test_appending_continues_battles_and_names(self):
+        for _ in range(2):
+            with CombatLog(self.path) as log:
+                log.begin_battle()
+                log.begin_turn()
+                log.record(EventKind.HIT, "Hero", "Goblin", 5, "Fists")
+        with CombatLogReader(self.path) as reader:
+            self.assertEqual([event.battle for event in reader], [1, 2])
+            self.assertEqual(len(reader.names), len(set(reader.names)))
+
+    def test_battle_log_matches_battle(self):
+        with CombatLog(self.path) as log:
+            game = Game(headless=True, seed=4, combat_log=log)
+            enemies = game.enemy_registry.spawn_group(1, 3, game.rng, game.renderer)
+            result = run_battle(game, enemies, greedy_ability)
+        with CombatLogReader(self.path) as reader:
+            events = list(reader)
+        self.assertTrue(result.won)
+        self.assertEqual({event.battle for event in events}, {1})
+        self.assertEqual(max(event.turn for event in events), result.turns)
+        rewarded = [event.actor for event in events if event.kind == EventKind.REWARD_XP]
+        self.assertEqual(sorted(rewarded), sorted(enemy.name for enemy in enemies))
+        hits = sum(event.kind in (EventKind.HIT, EventKind.CRIT) and event.actor == game.hero.name for event in events)
+        self.assertGreater(hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
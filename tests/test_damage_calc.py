@@ -0,0 +1,59 @@
+# ------------ imports ------------
+import unittest
+from damage_calc import attack_distribution, attack_stats, kill_curve
+from damage_table import AttackTable
+from simulation import BattleSimulator, run_battle
+
+
+# ------------ exact distributions ------------
+class DamageCalcTest(unittest.TestCase):
+    """The exact distributions agree with the attack tables and with played battles"""
+    matchups = [(1, 3, 0, 5, 5, 5, 5),       # Fists against an equal enemy
+                (5, 10, 10, 9, 7, 3, 12),    # Boosted sword against a fast enemy (dodges)
+                (8, 15, 0, 5, 5, 40, 5)]     # Heavy armor: most hits deal the minimum 1
+
+    def test_distribution_sums_to_one(self):
+        for stats in self.matchups:
+            distribution = attack_distribution(*stats)
+            self.assertAlmostEqual(sum(chance for _, chance in distribution), 1.0)
+            self.assertEqual([damage for damage, _ in distribution],
+                             sorted(damage for damage, _ in distribution))
+
+    def test_mean_matches_attack_table(self):
+        for stats in self.matchups:
+            mean = sum(damage * chance for damage, chance in attack_distribution(*stats))
+            self.assertAlmostEqual(mean, AttackTable.build(*stats).expected_damage())
+
+    def test_kill_curve_is_monotonic(self):
+        for stats in self.matchups:
+            curve = kill_curve(stats, 30, 12)
+            self.assertEqual(len(curve), 12)
+            self.assertTrue(all(0.0 <= chance <= 1.0 for chance in curve))
+            self.assertTrue(all(earlier <= later for earlier, later in zip(curve, curve[1:])))
+
+    def test_kill_curve_matches_battles(self):
+        # The hero cannot die and zone 1 enemies have no abilities, so a
+        # won battle's turns are the hero attacks it took to kill
+        battles = 3000
+        simulator = BattleSimulator(zone=1, hero_level=1, hero_health=10**6, seed=3)
+        game = simulator.game
+        simulator.weapon = {weapon.name: weapon for weapon in game.weapons}["Fists"]
+        template = game.zone_enemies[1][0]
+        turns = []
+        for _ in range(battles):
+            game.hero = simulator.new_hero()
+            enemy = template.spawn(game.rng, game.renderer)
+            stats = attack_stats(game.hero, enemy)
+            result = run_battle(game, [enemy])
+            self.assertTrue(result.won)
+            turns.append(result.turns)
+
+        curve = kill_curve(stats, template.health_max, max(turns))
+        for attacks, chance in enumerate(curve, 1):
+            observed = sum(count <= attacks for count in turns) / battles
+            self.assertAlmostEqual(observed, chance, delta=0.03)
+        self.assertAlmostEqual(curve[-1], 1.0, places=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
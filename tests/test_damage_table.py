@@ -0,0 +1,51 @@
+# ------------ imports ------------
+import sys
+import threading
+import unittest
+from damage_table import DamageTables
+
+
+# ------------ bounded index ------------
+class DamageTablesTest(unittest.TestCase):
+    """The index keeps at most max_tables tables, even with many threads looking up"""
+    def matchup(self, n):
+        return (5, 10), 0, (5, 3, n % 7), (4, 2, n % 11)
+
+    def test_least_recently_used_is_evicted(self):
+        tables = DamageTables(max_tables=2)
+        first = tables.lookup(*self.matchup(0))
+        tables.lookup(*self.matchup(1))
+        self.assertIs(tables.lookup(*self.matchup(0)), first)  # Now the most recently used
+        tables.lookup(*self.matchup(2))
+        self.assertEqual(len(tables), 2)
+        self.assertIs(tables.lookup(*self.matchup(0)), first)
+        self.assertEqual(tables.built, 3)
+
+    def test_threaded_lookups(self):
+        tables = DamageTables(max_tables=4)
+        errors = []
+
+        def look_up(offset):
+            try:
+                for n in range(3000):
+                    table = tables.lookup(*self.matchup(n + offset))
+                    self.assertEqual(table.cdf[-1], 1.0)
+            except Exception as error:
+                errors.append(error)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+        try:
+            threads = [threading.Thread(target=look_up, args=(offset,)) for offset in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(tables), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
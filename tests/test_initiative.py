@@ -0,0 +1,103 @@
+# ------------ imports ------------
+import unittest
+from character import Enemy
+from initiative import Initiative
+
+
+# ------------ helpers ------------
+def combatant(name, speed):
+    enemy = Enemy(name, 100, (1, 2))
+    enemy.speed = speed
+    enemy.stats_changed()
+    return enemy
+
+
+def take_turns(initiative, count):
+    """Names of the next count combatants to act, acting for each"""
+    names = []
+    for _ in range(count):
+        character = initiative.next_actor()
+        initiative.act(character)
+        names.append(character.name)
+    return names
+
+
+# ------------ turn order ------------
+class InitiativeTest(unittest.TestCase):
+    """Combatants act in tick order at their current speed"""
+    def test_equal_speeds_alternate(self):
+        hero, enemy = combatant("Hero", 5), combatant("Goblin", 5)
+        initiative = Initiative(hero, [enemy])
+        self.assertEqual(take_turns(initiative, 6), ["Hero", "Goblin"] * 3)
+
+    def test_twice_as_fast_acts_twice(self):
+        # Delays of 1000 // (30 + 20) = 20 and 1000 // (5 + 20) = 40 ticks
+        fast, slow = combatant("Fast", 30), combatant("Slow", 5)
+        self.assertEqual(Initiative().delay(slow), 2 * Initiative().delay(fast))
+        initiative = Initiative(slow, [fast])
+        # Slow opens at tick 0 and Fast comes in at 20; from tick 40 on
+        # every slow turn is followed by exactly two fast ones
+        self.assertEqual(take_turns(initiative, 2), ["Slow", "Fast"])
+        self.assertEqual(take_turns(initiative, 30), ["Slow", "Fast", "Fast"] * 10)
+
+    def test_ties_go_to_first_scheduled(self):
+        hero = combatant("Hero", 5)
+        enemies = [combatant(f"Goblin {n}", 5) for n in range(3)]
+        initiative = Initiative(hero, enemies)
+        self.assertEqual(take_turns(initiative, 8), ["Hero", "Goblin 0", "Goblin 1", "Goblin 2"] * 2)
+
+    def test_defeated_are_skipped(self):
+        hero, first, second = combatant("Hero", 5), combatant("First", 5), combatant("Second", 5)
+        initiative = Initiative(hero, [first, second])
+        take_turns(initiative, 1)
+        first.health = 0
+        self.assertIs(initiative.next_actor(), second)
+        self.assertNotIn(first, initiative.due)
+        self.assertEqual(take_turns(initiative, 4), ["Second", "Hero", "Second", "Hero"])
+
+    def test_act_next_stops_at_hero(self):
+        hero = combatant("Hero", 5)
+        enemies = [combatant("Fast", 30), combatant("Slow", 5)]
+        initiative = Initiative(hero, enemies)
+        initiative.act(hero)
+        acted = []
+        while True:
+            enemy = initiative.act_next(hero)
+            if enemy is None:
+                break
+            acted.append(enemy.name)
+        self.assertIs(initiative.next_actor(), hero)
+        # Fast is due at 20, then at 40 along with Slow and the hero, who
+        # were scheduled before it
+        self.assertEqual(acted, ["Fast", "Slow"])
+
+    def test_speed_change_applies_from_next_action(self):
+        hero, enemy = combatant("Hero", 5), combatant("Goblin", 5)
+        initiative = Initiative(hero, [enemy])
+        take_turns(initiative, 2)
+        self.assertEqual((initiative.due[hero], initiative.due[enemy]), (40, 80))
+        enemy.speed = 30  # Haste: a delay of 20 instead of 40
+        enemy.stats_changed()
+        self.assertEqual(take_turns(initiative, 2), ["Hero", "Goblin"])  # Already scheduled
+        self.assertEqual(initiative.due[enemy], 100)
+        self.assertEqual(take_turns(initiative, 7), ["Hero", "Goblin", "Hero", "Goblin", "Goblin", "Hero", "Goblin"])
+
+    def test_summons_act_one_delay_later(self):
+        hero, enemy = combatant("Hero", 5), combatant("Goblin", 5)
+        initiative = Initiative(hero, [enemy])
+        take_turns(initiative, 2)
+        initiative.add(combatant("Minion", 5))
+        self.assertEqual(take_turns(initiative, 3), ["Hero", "Goblin", "Minion"])
+
+    def test_clone_keeps_order(self):
+        hero = combatant("Hero", 5)
+        enemies = [combatant("Fast", 30), combatant("Slow", 5)]
+        initiative = Initiative(hero, enemies)
+        take_turns(initiative, 3)
+        copies = {character: combatant(character.name, character.speed) for character in [hero] + enemies}
+        clone = initiative.clone(copies)
+        self.assertEqual(take_turns(clone, 10), take_turns(initiative, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
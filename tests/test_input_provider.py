@@ -0,0 +1,74 @@
+# ------------ imports ------------
+import io
+import json
+import os
+import tempfile
+import unittest
+from input_provider import PolicyInput, RecordingInput, ReplayMismatch, play_session, read_session, replay_session
+from renderer import BufferedRenderer
+from runner import explorer_policy
+
+
+# ------------ replay determinism ------------
+class ReplayTest(unittest.TestCase):
+    """A replayed session shows exactly what the recorded one showed"""
+    seed = 7
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "session.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, max_steps=None):
+        """Play a policy game into the session file; returns its outcome and transcript"""
+        output = io.StringIO()
+        renderer = BufferedRenderer(output)
+
+        def recording(game):
+            return RecordingInput(self.path, game, PolicyInput(game, explorer_policy, max_steps))
+
+        game, outcome = play_session(recording, self.seed, renderer)
+        game.input_func.close()
+        renderer.flush()
+        return game, outcome, output.getvalue()
+
+    def replay(self, check_prompts=True):
+        output = io.StringIO()
+        renderer = BufferedRenderer(output)
+        game, outcome = replay_session(self.path, renderer, check_prompts)
+        renderer.flush()
+        return game, outcome, output.getvalue()
+
+    def test_replay_matches_recording(self):
+        recorded_game, recorded_outcome, recorded = self.record()
+        game, outcome, replayed = self.replay()
+        self.assertEqual(outcome, recorded_outcome)
+        self.assertEqual(replayed, recorded)
+        self.assertEqual((game.current_zone, game.hero.level, game.hero.coins),
+                         (recorded_game.current_zone, recorded_game.hero.level, recorded_game.hero.coins))
+
+    def test_replay_ends_with_recording(self):
+        self.record(max_steps=50)
+        header, inputs = read_session(self.path)
+        self.assertEqual(header["seed"], self.seed)
+        self.assertEqual(len(inputs), 50)
+        _, outcome, _ = self.replay()
+        self.assertEqual(outcome, "replay_end")
+
+    def test_drifted_replay_stops(self):
+        self.record(max_steps=50)
+        with open(self.path, encoding="utf-8") as session:
+            lines = session.readlines()
+        header = json.loads(lines[0])
+        header["seed"] += 1
+        lines[0] = json.dumps(header) + "\n"
+        with open(self.path, "w", encoding="utf-8") as session:
+            session.writelines(lines)
+        with self.assertRaises(ReplayMismatch):
+            self.replay()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# ------------ imports ------------
+import pickle
+import unittest
+from copy import copy
+from inventory import Inventory
+from item import Item
+from weapon import iron_sword
+
+
+# ------------ stack accounting ------------
+class InventoryTest(unittest.TestCase):
+    """Adds and removes keep the stacks, the buckets and the size in step"""
+    def setUp(self):
+        self.potion = Item("Health Potion", "consumable", 20, "31")
+        self.armor = Item("Leather Armor", "armor", 50, "33")
+        self.gem = Item("Ruby", "treasure", 100, "35")
+        self.inventory = Inventory([self.potion, self.armor, self.potion, self.gem, self.potion])
+
+    def test_stacks(self):
+        inventory = self.inventory
+        self.assertEqual(len(inventory), 5)
+        self.assertEqual(inventory.count(self.potion), 3)
+        self.assertEqual(inventory.label(self.potion), " x3")
+        self.assertEqual(inventory.label(self.armor), "")
+        self.assertEqual(list(inventory.stacks()), [(self.armor, 1), (self.potion, 3), (self.gem, 1)])
+        self.assertEqual(list(inventory), [self.armor, self.potion, self.potion, self.potion, self.gem])
+
+    def test_buckets(self):
+        inventory = self.inventory
+        self.assertEqual(inventory.items(inventory.consumables), [self.potion])
+        self.assertEqual(inventory.items(inventory.equipment), [self.armor])
+        self.assertEqual(inventory.items(inventory.other), [self.gem])
+        self.assertEqual(inventory.weapons, {})
+
+    def test_remove(self):
+        inventory = self.inventory
+        inventory.remove(self.potion)
+        self.assertEqual(inventory.count(self.potion), 2)
+        inventory.remove(self.armor)
+        self.assertNotIn(self.armor, inventory)
+        self.assertEqual(inventory.equipment, {})
+        self.assertEqual(len(inventory), 3)
+        with self.assertRaises(ValueError):
+            inventory.remove(self.armor)
+        self.assertEqual(len(inventory), 3)
+
+    def test_weapons_stack_only_with_themselves(self):
+        inventory = Inventory()
+        sword, boosted = copy(iron_sword), copy(iron_sword)
+        boosted.damage_boost = 10
+        inventory.add(sword)
+        inventory.add(boosted)
+        inventory.add(sword)
+        self.assertEqual(inventory.count(sword), 2)
+        self.assertEqual(inventory.count(boosted), 1)
+        self.assertEqual(len(inventory.weapons), 2)
+
+    def test_copy_is_independent(self):
+        clone = self.inventory.copy()
+        clone.remove(self.potion)
+        clone.add(self.gem, 2)
+        self.assertEqual(self.inventory.count(self.potion), 3)
+        self.assertEqual(self.inventory.count(self.gem), 1)
+        self.assertEqual(len(self.inventory), 5)
+        self.assertEqual(len(clone), 6)
+
+    def test_clear(self):
+        self.inventory.clear()
+        self.assertEqual(len(self.inventory), 0)
+        self.assertEqual(list(self.inventory), [])
+
+
+# ------------ interned items ------------
+class ItemTest(unittest.TestCase):
+    """Items with the same fields are one shared, immutable prototype"""
+    def test_interned(self):
+        potion = Item("Health Potion", "consumable", 20, "31")
+        self.assertIs(Item("Health Potion", "consumable", 20, "31"), potion)
+        self.assertIsNot(Item("Health Potion", "consumable", 25, "31"), potion)
+        self.assertNotEqual(Item("Health Potion", "consumable", 25, "31").id, potion.id)
+
+    def test_immutable(self):
+        potion = Item("Health Potion", "consumable", 20, "31")
+        with self.assertRaises(AttributeError):
+            potion.value = 0
+        with self.assertRaises(AttributeError):
+            del potion.name
+        self.assertEqual(potion.value, 20)
+
+    def test_pickle_interns_again(self):
+        potion = Item("Health Potion", "consumable", 20, "31")
+        self.assertIs(pickle.loads(pickle.dumps(potion)), potion)
+        self.assertIs(copy(potion), potion)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# ------------ imports ------------
+import os
+import tempfile
+import unittest
+from game import Game, GameEnded
+from item import Item
+from runner import explorer_policy
+from save_file import SaveFile, capture_state
+
+
+# ------------ helpers ------------
+def play(game, steps, save_every=0):
+    """Play a game with the runner's policy for a number of inputs, saving along the way"""
+    answered = 0
+
+    def answer(prompt):
+        nonlocal answered
+        answered += 1
+        if answered > steps:
+            raise GameEnded("Step limit reached", "step_limit")
+        if save_every and answered % save_every == 0:
+            game.save_game()
+        return explorer_policy(game, prompt)
+
+    game.input_func = answer
+    try:
+        game.main_menu()
+    except GameEnded:
+        pass
+
+
+# ------------ save/load round trips ------------
+class SaveRoundTripTest(unittest.TestCase):
+    """Loading a save restores exactly the state that was saved"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "test.sav")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load(self, path=None):
+        game = Game(headless=True, seed=99, save_path=path or self.path)
+        game.load_game()
+        return game
+
+    def test_round_trip_after_play(self):
+        game = Game(headless=True, seed=5, save_path=self.path)
+        play(game, 460, save_every=150)
+        game.save_game()
+        loaded = self.load()
+        self.assertEqual(capture_state(loaded), capture_state(game))
+        self.assertEqual(loaded.rng.random(), game.rng.random())
+
+    def test_deltas_and_compaction(self):
+        game = Game(headless=True, seed=3, save_path=self.path)
+        game.save_file = SaveFile(self.path, compact_every=2)
+        play(game, 300, save_every=20)
+        game.save_game()
+        with open(self.path, encoding="utf-8") as save:
+            self.assertLessEqual(len(save.readlines()), 2 + 2)  # Header, snapshot, at most two deltas
+        self.assertEqual(capture_state(self.load()), capture_state(game))
+
+    def test_weapons_and_boosts(self):
+        game = Game(headless=True, seed=1, save_path=self.path)
+        hero = game.hero
+        sword = game.weapons[1]
+        hero.inventory.add(sword)
+        hero.equip(sword)
+        Item("Strength Potion", "consumable", 40, "32").use(hero)
+        game.save_game()
+
+        loaded = self.load()
+        self.assertEqual(loaded.hero.weapon.name, sword.name)
+        self.assertEqual(loaded.hero.weapon.damage_boost, sword.damage_boost)
+        self.assertIn(loaded.hero.weapon, loaded.hero.inventory)
+        # The boost stays with the game that drank the potion
+        self.assertTrue(any(weapon is loaded.hero.weapon for weapon in loaded.weapons))
+        self.assertEqual(Game(headless=True, seed=2).weapons[1].damage_boost, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
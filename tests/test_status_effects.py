@@ -0,0 +1,113 @@
+# ------------ imports ------------
+import unittest
+from character import Enemy
+from game import Game
+from renderer import NullRenderer
+from status_effects import StatusEffects, StatusScheduler
+
+
+# ------------ helpers ------------
+def goblin(name="Goblin"):
+    return Enemy(name, 50, (1, 2), renderer=NullRenderer())
+
+
+# ------------ effects ------------
+class StatusEffectsTest(unittest.TestCase):
+    """Burn and freeze refresh, poison stacks"""
+    def test_burn_refreshes(self):
+        effects = StatusEffects()
+        effects.add("burn", 3, 4)
+        effects.add("burn", 2, 6)
+        self.assertEqual((effects.duration("burn"), effects.value("burn")), (3, 6))
+        self.assertEqual(effects.stacks("burn"), 1)
+
+    def test_poison_stacks_up_to_three(self):
+        effects = StatusEffects()
+        for duration, value in ((3, 1), (2, 2), (3, 3)):
+            effects.add("poison", duration, value)
+        self.assertEqual(effects.stacks("poison"), 3)
+        self.assertEqual((effects.duration("poison"), effects.value("poison")), (3, 6))
+        effects.add("poison", 3, 4)  # Replaces the stack closest to running out
+        self.assertEqual(effects.stacks("poison"), 3)
+        self.assertEqual(effects.value("poison"), 1 + 3 + 4)
+
+    def test_poison_stacks_run_out_separately(self):
+        effects = StatusEffects()
+        effects.add("poison", 1, 5)
+        effects.add("poison", 2, 3)
+        self.assertEqual(effects.tick("poison"), 1)
+        self.assertEqual((effects.stacks("poison"), effects.value("poison")), (1, 3))
+        self.assertEqual(effects.tick("poison"), 0)
+        self.assertNotIn("poison", effects)
+        self.assertEqual(effects.value("poison"), 0)
+
+    def test_snapshot_round_trip(self):
+        effects = StatusEffects()
+        effects.add("freeze", 2, 2)
+        effects.add("poison", 3, 2)
+        effects.add("poison", 1, 4)
+        restored = StatusEffects()
+        restored.restore(effects.snapshot())
+        self.assertEqual(restored.snapshot(), effects.snapshot())
+        self.assertEqual(restored.stacks("poison"), 2)
+
+    def test_restore_unstacked_save(self):
+        restored = StatusEffects()
+        restored.restore([0, 0, 2, 5, 0, 0])  # Saved before poison stacked
+        self.assertEqual((restored.stacks("poison"), restored.value("poison")), (1, 5))
+        self.assertEqual(restored.tick("poison"), 1)
+        self.assertEqual(restored.value("poison"), 5)
+
+    def test_freeze_slows(self):
+        enemy = goblin()
+        speed = enemy.get_total_speed()
+        enemy.status_effects.add("freeze", 2, 2)
+        enemy.stats_changed()
+        self.assertEqual(enemy.get_total_speed(), speed - 2)
+        self.assertEqual(enemy.stats()[2], speed - 2)
+        enemy.apply_status_effects()
+        self.assertEqual(enemy.stats()[2], speed - 2)
+        enemy.apply_status_effects()  # Wears off
+        self.assertNotIn("freeze", enemy.status_effects)
+        self.assertEqual(enemy.stats()[2], speed)
+
+
+# ------------ scheduler ------------
+class StatusSchedulerTest(unittest.TestCase):
+    """Only combatants with effects tick, until their effects run out"""
+    def test_schedule_and_advance(self):
+        scheduler = StatusScheduler()
+        first, second = goblin("First"), goblin("Second")
+        scheduler.begin_battle([first, second])
+        self.assertEqual(len(scheduler), 0)
+        second.status_effects.add("burn", 2, 1)
+        first.status_effects.add("poison", 1, 1)
+        second.status_effects.add("burn", 3, 1)  # Already due: listed once
+        self.assertEqual(scheduler.advance(), [second, first])
+        self.assertEqual(scheduler.advance(), [])
+
+    def test_battle_turns(self):
+        game = Game(headless=True, seed=1)
+        hero = game.hero
+        enemy = game.enemy_registry.spawn_group(1, 1, game.rng, game.renderer)[0]
+        game.begin_battle([enemy])
+        hero.status_effects.add("poison", 1, 2)
+        enemy.status_effects.add("burn", 3, 1)
+        scheduler = game.status_scheduler
+        due = []
+        for _ in range(4):
+            due.append([character.name for character in scheduler.due])
+            game.start_battle_turn()
+        self.assertEqual(due, [[hero.name, enemy.name], [enemy.name], [enemy.name], []])
+        self.assertFalse(hero.status_effects or enemy.status_effects)
+
+    def test_effects_from_before_the_battle_are_tracked(self):
+        scheduler = StatusScheduler()
+        enemy = goblin()
+        enemy.status_effects.add("freeze", 1, 2)
+        scheduler.begin_battle([enemy])
+        self.assertEqual(scheduler.advance(), [enemy])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,4 @@
-import random
+from rng import default_rng
 
 # ------------ class setup ------------
 class Weapon:
@@ -18,15 +18,15 @@ class Weapon:
         self.special_effect = None  # Special effect like poison, burn, etc.
         self.special_effect_chance = 0.2  # 20% chance to apply special effect
         
-    def get_damage(self):
+    def get_damage(self, rng=default_rng):
         """Calculate damage with random range and any boosts"""
-        base_damage = random.randint(self.damage_range[0], self.damage_range[1])
+        base_damage = rng.randint(self.damage_range[0], self.damage_range[1])
         total_damage = base_damage + self.damage_boost
         return total_damage
         
-    def has_special_effect(self):
+    def has_special_effect(self, rng=default_rng):
         """Check if weapon applies a special effect on hit"""
-        if self.special_effect and random.random() < self.special_effect_chance:
+        if self.special_effect and rng.chance(self.special_effect_chance):
             return self.special_effect
         return None
 